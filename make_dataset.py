@@ -1,7 +1,11 @@
 import json
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 from synthetic_clrs import (
     ProblemGenerator,
     ProblemSolver,
@@ -10,13 +14,37 @@ from synthetic_clrs import (
     ALGORITHMS_BY_CATEGORY,
     ALGORITHM_TO_CATEGORY
 )
+from synthetic_clrs.utils import (
+    JsonlWriter,
+    ParquetShardWriter,
+    read_jsonl,
+    read_parquet,
+    read_parquet_shard,
+)
+
+
+def _make_record(algorithm, question):
+    answer = ProblemSolver.solve(algorithm, **question)
+    return {
+        "algo_name": algorithm,
+        "question": question,
+        "answer": answer,
+    }
+
+
+def _generate_shard(shard):
+    algorithm, start, num_problems, master_seed = shard
+    generator = ProblemGenerator()
+    return [
+        _make_record(algorithm, generator.generate_problem_at(algorithm, index, master_seed))
+        for index in range(start, start + num_problems)
+    ]
 
 
 class CLRSDataset:
-    def __init__(self, save_dir=None):
+    def __init__(self, save_dir=None, seed=None):
         self.data = []
-        self.generator = ProblemGenerator()
-        self.solver = ProblemSolver()
+        self.seed = seed
         self.save_dir = self._ensure_dir(save_dir or "datasets")
 
 
@@ -33,36 +61,106 @@ class CLRSDataset:
         return dirpath
 
 
-    def _insert_problem(self, algorithm):
-        question = self.generator.generate_problem(algorithm)
-        answer = self.solver.solve(algorithm, **question)
-        self.data.append({
-            "algo_name": algorithm,
-            "question": question,
-            "answer": answer,
-        })
-
-
-    def generate(self, num_probs_per_algo=100, save_file="synthetic_clrs_dataset.json"):
-        for algo in ALGORITHM_TO_CATEGORY.keys():
-            for _ in range(num_probs_per_algo):
-                self._insert_problem(algo)
-        
-        with open(self.save_dir / save_file, "w") as f:
-            f.write(self._compact_json(json.dumps(self.data, indent=4)))
+    def _make_shards(self, num_probs_per_algo, shard_size):
+        # problem i of an algorithm is always drawn from the counter-based
+        # stream keyed by (master_seed, algorithm, i), so the output only
+        # depends on the master seed and not on shard_size or num_workers
+        master_seed = self.seed if self.seed is not None else np.random.SeedSequence().entropy
+        return [
+            (algo, start, min(shard_size, num_probs_per_algo - start), master_seed)
+            for algo in ALGORITHM_TO_CATEGORY.keys()
+            for start in range(0, num_probs_per_algo, shard_size)
+        ]
+
+
+    def _iter_problems(self, num_probs_per_algo, num_workers, shard_size):
+        shards = self._make_shards(num_probs_per_algo, shard_size)
+
+        if num_workers == 1:
+            for shard in shards:
+                yield from _generate_shard(shard)
+            return
+
+        # keep a bounded window of shards in flight and yield results
+        # in shard order so output is identical to the serial path
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            pending = deque()
+            for shard in shards:
+                pending.append(executor.submit(_generate_shard, shard))
+                if len(pending) >= 4 * num_workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+    def _open_writer(self, save_path, flush_every, row_group_size):
+        if save_path.suffix == ".parquet":
+            return ParquetShardWriter(save_path, row_group_size=row_group_size)
+        return JsonlWriter(save_path, flush_every=flush_every)
+
+
+    def _stream_problems(self, save_path, problems, flush_every, row_group_size):
+        # write each record as soon as it is produced instead
+        # of holding the whole dataset in memory
+        with self._open_writer(save_path, flush_every, row_group_size) as writer:
+            for record in problems:
+                writer.write(record)
+
+
+    def generate(self, num_probs_per_algo=100, save_file="synthetic_clrs_dataset.json", flush_every=10_000, row_group_size=65_536, num_workers=1, shard_size=1_000):
+        """
+        Save files ending in .jsonl are streamed to disk one record
+        per line (flushed every flush_every records). Save files ending
+        in .parquet are directories holding one Parquet shard per
+        algorithm, written in row groups of row_group_size rows. Any
+        other save file is written as a single compacted JSON array.
+
+        Problems are generated in shards of up to shard_size problems
+        of one algorithm, spread over num_workers processes. Problem i
+        of each algorithm is drawn from its own counter-based stream
+        keyed by the dataset seed, so a seeded dataset is identical for
+        any number of workers or shard size, and any single problem can
+        be regenerated with ProblemGenerator.generate_problem_at.
+        """
+        save_path = self.save_dir / save_file
+        problems = self._iter_problems(num_probs_per_algo, num_workers, shard_size)
+
+        if save_path.suffix in (".jsonl", ".parquet"):
+            self._stream_problems(save_path, problems, flush_every, row_group_size)
+        else:
+            self.data.extend(problems)
+
+            with open(save_path, "w") as f:
+                f.write(self._compact_json(json.dumps(self.data, indent=4)))
 
         print(
             f"Saved generated dataset of "
             f"{len(list(ALGORITHM_TO_CATEGORY.keys())) * num_probs_per_algo} "
-            f"problems to the path {self.save_dir / save_file}"
+            f"problems to the path {save_path}"
         )
 
 
     def load(self, save_file="synthetic_clrs_dataset.json"):
-        with open(self.save_dir / save_file, "r") as f:
+        save_path = self.save_dir / save_file
+        if save_path.suffix == ".jsonl":
+            self.data = read_jsonl(save_path)
+            return
+        if save_path.suffix == ".parquet":
+            self.data = read_parquet(save_path)
+            return
+        with open(save_path, "r") as f:
             self.data = json.load(f)
 
 
+    def load_shard(self, algorithm, save_file="synthetic_clrs_dataset.parquet", columns=None):
+        """
+        Load the problems of a single algorithm from a Parquet dataset
+        as a pyarrow Table (call .to_pandas() for a DataFrame), reading
+        only the requested columns.
+        """
+        return read_parquet_shard(self.save_dir / save_file, algorithm, columns=columns)
+
+
 if __name__ == "__main__":
     dataset = CLRSDataset()
     dataset.generate(num_probs_per_algo=100, save_file="synthetic_clrs_dataset.json")
@@ -12,16 +12,25 @@ class Algorithm:
     OPTIMAL_BST = "optimal_bst"
 
     # geometry
+    ANY_SEGMENTS_INTERSECT = "any_segments_intersect"
+    CLOSEST_PAIR = "closest_pair"
     GRAHAM_SCAN = "graham_scan"
     JARVIS_MARCH = "jarvis_march"
     SEGMENT_INTERSECT = "segment_intersect"
+    SEGMENT_INTERSECTIONS = "segment_intersections"
 
     # graphs
+    ARTICULATION_POINTS = "articulation_points"
     BELLMAN_FORD = "bellman_ford"
     BFS = "bfs"
+    BRIDGES = "bridges"
     DAG_SHORTEST_PATH = "dag_shortest_path"
     DFS = "dfs"
     DIJKSTRA = "dijkstra"
+    FLOYD_WARSHALL = "floyd_warshall"
+    MST_KRUSKAL = "mst_kruskal"
+    MST_PRIM = "mst_prim"
+    SCC = "scc"
     TOPOLOGICAL_SORT = "topological_sort"
     
     # greedy
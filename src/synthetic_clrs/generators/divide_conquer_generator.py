@@ -1,6 +1,8 @@
 from ..utils import Rng
 from ..algorithms import Algorithm
 
+KADANE_TASK = "Find the maximum subarray sum of the array"
+
 class DivideConquerGenerator:
     def __init__(self, rng=None, min_array_size=2, max_array_size=10, min_element=-10, max_element=10, seed=None):
         self.rng = rng if rng is not None else Rng(seed)
@@ -15,7 +17,15 @@ class DivideConquerGenerator:
         arr = self.rng.gen_int_array(array_size, self.min_element, self.max_element)
         return {
             "array": arr,
-            "task": "Find the maximum subarray sum of the array"
+            "task": KADANE_TASK
+        }
+
+
+    def generate_kadane_batch(self, num_problems):
+        array_sizes = self.rng.gen_int_ndarray((num_problems,), self.min_array_size, self.max_array_size)
+        return {
+            "array": self.rng.gen_padded_int_arrays(array_sizes, self.min_element, self.max_element),
+            "task": KADANE_TASK
         }
     
 
@@ -23,3 +33,10 @@ class DivideConquerGenerator:
         return {
             Algorithm.KADANE: self.generate_kadane_problem,
         }[algorithm](**kwargs)
+
+
+    def generate_batch(self, algorithm: Algorithm, num_problems, **kwargs):
+        return {
+            Algorithm.KADANE: self.generate_kadane_batch,
+        }[algorithm](num_problems, **kwargs)
+
@@ -1,6 +1,8 @@
-from ..utils import Rng
+from ..utils import Rng, batch_from_problems
 from ..algorithms import Algorithm
 
+LCS_LENGTH_TASK = "Find the length of the longest common subsequence of the two sequences"
+
 class DynamicProgrammingGenerator:
     def __init__(self, rng=None, min_sequence_length=2, max_sequence_length=8, min_char=0, max_char=3, min_keys=2, max_keys=5, seed=None):
         self.rng = rng if rng is not None else Rng(seed)
@@ -23,7 +25,16 @@ class DynamicProgrammingGenerator:
         return {
             "sequence_a": a,
             "sequence_b": b,
-            "task": "Find the length of the longest common subsequence of the two sequences"
+            "task": LCS_LENGTH_TASK
+        }
+
+
+    def generate_lcs_length_batch(self, num_problems):
+        seq_lengths = self.rng.gen_int_ndarray((num_problems,), self.min_sequence_length, self.max_sequence_length)
+        return {
+            "sequence_a": self.rng.gen_padded_int_arrays(seq_lengths, self.min_char, self.max_char),
+            "sequence_b": self.rng.gen_padded_int_arrays(seq_lengths, self.min_char, self.max_char),
+            "task": LCS_LENGTH_TASK
         }
 
 
@@ -49,3 +60,16 @@ class DynamicProgrammingGenerator:
             Algorithm.LCS_LENGTH: self.generate_lcs_length_problem,
             Algorithm.OPTIMAL_BST: self.generate_optimal_bst_problem,
         }[algorithm](**kwargs)
+
+
+    def generate_optimal_bst_batch(self, num_problems):
+        # probability rounding is done per problem, so no vectorized path
+        return batch_from_problems([self.generate_optimal_bst_problem() for _ in range(num_problems)])
+
+
+    def generate_batch(self, algorithm: Algorithm, num_problems, **kwargs):
+        return {
+            Algorithm.LCS_LENGTH: self.generate_lcs_length_batch,
+            Algorithm.OPTIMAL_BST: self.generate_optimal_bst_batch,
+        }[algorithm](num_problems, **kwargs)
+
@@ -1,13 +1,25 @@
-from ..utils import Rng
+import numpy as np
+
+from ..utils import RaggedArray, Rng, batch_from_problems
 from ..algorithms import Algorithm
 
+CONVEX_HULL_TASK = "Find the convex hull of the given points"
+CLOSEST_PAIR_TASK = "Find the smallest squared distance between two of the given points"
+ANY_SEGMENTS_INTERSECT_TASK = "Determine whether any two of the line segments intersect"
+SEGMENT_INTERSECTIONS_TASK = "Find all pairs of line segments that intersect"
+
 class GeometryGenerator:
-    def __init__(self, rng=None, min_num_points=5, max_num_points=8, min_coordinate=-10, max_coordinate=10, seed=None):
+    def __init__(self, rng=None, min_num_points=5, max_num_points=8, min_coordinate=-10, max_coordinate=10, min_num_segments=2, max_num_segments=8, max_segment_length=None, seed=None):
         self.rng = rng if rng is not None else Rng(seed)
         self.min_num_points = min_num_points
         self.max_num_points = max_num_points
         self.min_coordinate = min_coordinate
         self.max_coordinate = max_coordinate
+        self.min_num_segments = min_num_segments
+        self.max_num_segments = max_num_segments
+        # bound on how far apart segment endpoints are in each coordinate,
+        # so that large sets of short segments only cross a few others
+        self.max_segment_length = max_segment_length
 
 
     def _generate_random_segment(self):
@@ -33,15 +45,103 @@ class GeometryGenerator:
         }
 
 
+    def _generate_random_segment_arrays(self, num_segments):
+        """
+        Draws num_segments segments at once as the arrays (xs, ys)
+        of their endpoints, segment i going from point 2i to point
+        2i+1. The endpoints of a segment are distinct.
+        """
+        x1 = self.rng.gen_int_ndarray((num_segments,), self.min_coordinate, self.max_coordinate)
+        y1 = self.rng.gen_int_ndarray((num_segments,), self.min_coordinate, self.max_coordinate)
+        if self.max_segment_length is None:
+            x2 = self.rng.gen_int_ndarray((num_segments,), self.min_coordinate, self.max_coordinate)
+            y2 = self.rng.gen_int_ndarray((num_segments,), self.min_coordinate, self.max_coordinate)
+        else:
+            length = self.max_segment_length
+            x2 = np.clip(x1 + self.rng.gen_int_ndarray((num_segments,), -length, length), self.min_coordinate, self.max_coordinate)
+            y2 = np.clip(y1 + self.rng.gen_int_ndarray((num_segments,), -length, length), self.min_coordinate, self.max_coordinate)
+
+        # move the second endpoint off the first one
+        same = (x1 == x2) & (y1 == y2)
+        x2[same] = np.where(x1[same] < self.max_coordinate, x1[same] + 1, x1[same] - 1)
+        return np.stack((x1, x2), axis=1).ravel(), np.stack((y1, y2), axis=1).ravel()
+
+
+    def _generate_segments_problem(self, task):
+        num_segments = self.rng.gen_int(self.min_num_segments, self.max_num_segments)
+        xs, ys = self._generate_random_segment_arrays(num_segments)
+        return {
+            "xs": xs.tolist(),
+            "ys": ys.tolist(),
+            "task": task
+        }
+
+
+    def _generate_segments_batch(self, num_problems, task):
+        num_segments = self.rng.gen_int_ndarray((num_problems,), self.min_num_segments, self.max_num_segments)
+        xs, ys = self._generate_random_segment_arrays(int(num_segments.sum()))
+        offsets = np.concatenate(([0], np.cumsum(2 * num_segments)))
+        return {
+            "xs": RaggedArray(xs, offsets).to_padded(),
+            "ys": RaggedArray(ys, offsets).to_padded(),
+            "task": task
+        }
+
+
     def _generate_convex_hull_problem(self):
         num_points = self.rng.gen_int(self.min_num_points, self.max_num_points)
         random_points = self._generate_random_points(num_points)
         return {
             **random_points,
-            "task": "Find the convex hull of the given points"
+            "task": CONVEX_HULL_TASK
         }
 
 
+    def _generate_closest_pair_problem(self):
+        # both coordinates of every point in one draw
+        num_points = self.rng.gen_int(self.min_num_points, self.max_num_points)
+        xs, ys = self.rng.gen_int_ndarray((2, num_points), self.min_coordinate, self.max_coordinate)
+        return {
+            "xs": xs.tolist(),
+            "ys": ys.tolist(),
+            "task": CLOSEST_PAIR_TASK
+        }
+
+
+    def _generate_closest_pair_batch(self, num_problems):
+        return {**self._generate_convex_hull_batch(num_problems), "task": CLOSEST_PAIR_TASK}
+
+
+    def _generate_convex_hull_batch(self, num_problems):
+        num_points = self.rng.gen_int_ndarray((num_problems,), self.min_num_points, self.max_num_points)
+        return {
+            "xs": self.rng.gen_padded_int_arrays(num_points, self.min_coordinate, self.max_coordinate),
+            "ys": self.rng.gen_padded_int_arrays(num_points, self.min_coordinate, self.max_coordinate),
+            "task": CONVEX_HULL_TASK
+        }
+
+
+    def generate_any_segments_intersect_batch(self, num_problems):
+        return self._generate_segments_batch(num_problems, ANY_SEGMENTS_INTERSECT_TASK)
+
+
+    def generate_segment_intersect_batch(self, num_problems):
+        # distinct-endpoint draws are done per segment, so no vectorized path
+        return batch_from_problems([self.generate_segment_intersect_problem() for _ in range(num_problems)])
+
+
+    def generate_segment_intersections_batch(self, num_problems):
+        return self._generate_segments_batch(num_problems, SEGMENT_INTERSECTIONS_TASK)
+
+
+    def generate_any_segments_intersect_problem(self):
+        return self._generate_segments_problem(ANY_SEGMENTS_INTERSECT_TASK)
+
+
+    def generate_closest_pair_problem(self):
+        return self._generate_closest_pair_problem()
+
+
     def generate_graham_scan_problem(self):
         return self._generate_convex_hull_problem()
 
@@ -59,9 +159,28 @@ class GeometryGenerator:
         }
 
 
+    def generate_segment_intersections_problem(self):
+        return self._generate_segments_problem(SEGMENT_INTERSECTIONS_TASK)
+
+
     def generate_problem(self, algorithm: Algorithm, **kwargs):
         return {
+            Algorithm.ANY_SEGMENTS_INTERSECT: self.generate_any_segments_intersect_problem,
+            Algorithm.CLOSEST_PAIR: self.generate_closest_pair_problem,
             Algorithm.GRAHAM_SCAN: self.generate_graham_scan_problem,
             Algorithm.JARVIS_MARCH: self.generate_jarvis_march_problem,
             Algorithm.SEGMENT_INTERSECT: self.generate_segment_intersect_problem,
+            Algorithm.SEGMENT_INTERSECTIONS: self.generate_segment_intersections_problem,
         }[algorithm](**kwargs)
+
+
+    def generate_batch(self, algorithm: Algorithm, num_problems, **kwargs):
+        return {
+            Algorithm.ANY_SEGMENTS_INTERSECT: self.generate_any_segments_intersect_batch,
+            Algorithm.CLOSEST_PAIR: self._generate_closest_pair_batch,
+            Algorithm.GRAHAM_SCAN: self._generate_convex_hull_batch,
+            Algorithm.JARVIS_MARCH: self._generate_convex_hull_batch,
+            Algorithm.SEGMENT_INTERSECT: self.generate_segment_intersect_batch,
+            Algorithm.SEGMENT_INTERSECTIONS: self.generate_segment_intersections_batch,
+        }[algorithm](num_problems, **kwargs)
+
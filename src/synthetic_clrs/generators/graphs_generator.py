@@ -1,80 +1,157 @@
-import itertools
-import random
-from ..utils import Rng
+import math
+
+import numpy as np
+
+from ..utils import (
+    CSRGraph,
+    Rng,
+    bellman_ford_distances,
+    connected_component_labels,
+    edge_list_to_arrays,
+)
 from ..algorithms import Algorithm
 
+# families of structured graphs that can replace the uniform random graphs
+GRAPH_FAMILIES = ("complete_bipartite", "grid", "layered_dag", "path", "power_law", "random_geometric", "star")
+# families whose graphs are trees, for the problems that need one
+TREE_FAMILIES = ("path", "star")
+# algorithms whose problems are trees
+TREE_ALGORITHMS = (Algorithm.BFS, Algorithm.DFS)
+
 class GraphsGenerator:
-    def __init__(self, rng=None, min_vertices=3, max_vertices=7, min_weight=-3, max_weight=10, seed=None):
+    def __init__(self, rng=None, min_vertices=3, max_vertices=7, min_weight=-3, max_weight=10, edge_probability=0.5, avg_degree=None, sparse=False, negative_cycle_free_by_construction=True, as_csr=False, num_queries=1, family=None, power_law_exponent=2.5, seed=None):
         # skew towards positive weights to avoid negative cycles in Bellman-Ford
         self.rng = rng if rng is not None else Rng(seed)
         self.min_vertices = min_vertices
         self.max_vertices = max_vertices
         self.min_weight = min_weight
         self.max_weight = max_weight
+        # each possible edge is present with probability edge_probability,
+        # or with the probability that gives avg_degree if it is set
+        self.edge_probability = edge_probability
+        self.avg_degree = avg_degree
+        # sample edges directly in O(V+E) instead of drawing adjacency matrices
+        self.sparse = sparse
+        # draw Bellman-Ford weights from vertex potentials so negative cycles
+        # cannot occur, instead of regenerating until there is none
+        self.negative_cycle_free_by_construction = negative_cycle_free_by_construction
+        # emit edge_list as a CSRGraph instead of a list of (u, v, w) tuples;
+        # only a CSRGraph carries the known topological order of a generated
+        # dag to the solvers (a question field would give away the answer to
+        # topological_sort), so list outputs are ordered again by Kahn's algorithm
+        self.as_csr = as_csr
+        # problems with a src ask for the answer from num_queries distinct
+        # src vertices of the same graph (given as srcs) if num_queries > 1
+        self.num_queries = num_queries
+        # draw graphs from one of GRAPH_FAMILIES instead of uniformly at
+        # random, either for every algorithm or as a dict {algorithm: family};
+        # a family for every algorithm that does not give trees leaves the
+        # problems of TREE_ALGORITHMS as uniform random trees
+        GraphsGenerator._check_family_setting(family)
+        self.family = family
+        # exponent of the degree distribution of power_law graphs
+        self.power_law_exponent = power_law_exponent
 
 
     @staticmethod
     def copy_bottom_left_tri_to_top_right_tri(grid):
-        symmetric_grid = grid[::]
-        m, n = len(grid), len(grid[0])
-        for r in range(m):
-            for c in range(0, min(n, r)):
-                symmetric_grid[m-r-1][n-c-1] = grid[r][c]
-        return symmetric_grid
+        # symmetric copy of grid with the strictly lower triangle
+        # mirrored onto the upper one and the diagonal kept as is
+        grid = np.asarray(grid)
+        return np.tril(grid) + np.tril(grid, -1).T
 
 
     @staticmethod
-    def _has_negative_cycle(edge_list, num_vertices, src):
-        d = [float("inf")] * num_vertices
-        d[src] = 0
-
-        for _ in range(1, num_vertices):
-            for u, v, w in edge_list:
-                d[v] = min(d[u] + w, d[v])
-
+    def _has_negative_cycle(edge_list, num_vertices, src=None, srcs=None):
+        edges = edge_list.edge_arrays() if isinstance(edge_list, CSRGraph) else edge_list_to_arrays(edge_list)
         return any(
-            d[v] > d[u] + w
-            for u, v, w in edge_list
+            bellman_ford_distances(*edges, num_vertices, src) is None
+            for src in (srcs if srcs is not None else [src])
         )
 
 
     @staticmethod
-    def _unreachable_vertices_from_src(edge_list, num_vertices, src):
-        graph = [[] for _ in range(num_vertices)]
-        for u, v, _ in edge_list:
-            graph[u].append(v)
-
-        visited = [False] * num_vertices
-        visited[src] = True
-
-        def dfs(u):
-            for v in graph[u]:
-                if visited[v]:
-                    continue
-                visited[v] = True
-                dfs(v)
-
-        # mark all reachable nodes
-        # from src as visited
-        dfs(src)
-
-        return [
-            v for v in range(num_vertices)
-            if not visited[v]
-        ]
+    def _unreachable_vertices_from_src(graph, src):
+        return np.flatnonzero(~graph.reachable_from(src))
+
 
-    
     @staticmethod
-    def _get_dag_source(edge_list, num_vertices):
-        indegrees = [0 for _ in range(num_vertices)]
-        for _, v, _ in edge_list:
-            indegrees[v] += 1
-        
-        return next((
-            v for v in range(num_vertices)
-            if indegrees[v] == 0
-        ))
-        
+    def _slots_to_pairs(slots):
+        # slot k enumerates the pairs (i, j) with i < j as k = j*(j-1)/2 + i
+        j = ((1 + np.sqrt(1 + 8 * slots.astype(np.float64))) // 2).astype(np.int64)
+        # correct any floating point rounding of the square root
+        j -= j * (j - 1) // 2 > slots
+        j += (j + 1) * j // 2 <= slots
+        return slots - j * (j - 1) // 2, j
+
+
+    def _edge_probability(self, num_vertices):
+        if self.avg_degree is None:
+            return self.edge_probability
+        return min(1.0, self.avg_degree / max(num_vertices - 1, 1))
+
+
+    def _sample_edge_slots(self, num_slots, p):
+        """
+        Returns the sorted indices of the slots in range(num_slots)
+        holding an edge, where each slot holds one independently with
+        probability p. Gaps between consecutive edges are geometric, so
+        drawing the gaps takes O(expected number of edges) instead of
+        one coin flip per slot.
+        """
+        if num_slots == 0 or p <= 0:
+            return np.empty(0, dtype=np.int64)
+        if p >= 1:
+            return np.arange(num_slots, dtype=np.int64)
+
+        chunks = []
+        last_slot = -1
+        chunk_size = int(num_slots * p * 1.05) + 16
+        while last_slot < num_slots:
+            slots = last_slot + np.cumsum(self.rng.gen_geometric_ndarray(chunk_size, p))
+            chunks.append(slots[slots < num_slots])
+            last_slot = slots[-1]
+        return np.concatenate(chunks)
+
+
+    def _sample_sparse_directed_edges(self, num_vertices):
+        # any ordered pair (u, v), as in the dense adjacency matrix
+        slots = self._sample_edge_slots(num_vertices * num_vertices, self._edge_probability(num_vertices))
+        return slots // num_vertices, slots % num_vertices
+
+
+    def _sample_sparse_undirected_edges(self, num_vertices):
+        # unordered pairs {u, v} with u != v
+        slots = self._sample_edge_slots(num_vertices * (num_vertices - 1) // 2, self._edge_probability(num_vertices))
+        return self._slots_to_pairs(slots)
+
+
+    def _sample_sparse_dag_edges(self, topo_order):
+        # pairs of positions i < j in the topological order
+        num_vertices = len(topo_order)
+        slots = self._sample_edge_slots(num_vertices * (num_vertices - 1) // 2, self._edge_probability(num_vertices))
+        i, j = self._slots_to_pairs(slots)
+        topo_order = np.asarray(topo_order, dtype=np.int64)
+        return topo_order[i], topo_order[j]
+
+
+    def _get_edge_weights_from_arrays(self, us, vs, directed=True, weighted=True, only_positive_weights=False):
+        if weighted:
+            # make sure weights are strictly positive if only_positive_weights=True
+            ws = self.rng.gen_int_ndarray((len(us),), 1 if only_positive_weights else self.min_weight, self.max_weight)
+        else:
+            ws = np.ones(len(us), dtype=np.int64)
+
+        if directed:
+            return us, vs, ws
+
+        # assign same weight for each edge direction
+        return (
+            np.stack((us, vs), axis=1).ravel(),
+            np.stack((vs, us), axis=1).ravel(),
+            np.repeat(ws, 2)
+        )
+
 
     def _generate_random_edge_weights(self, num_weights, weighted, only_positive_weights):
         if weighted:
@@ -88,251 +165,580 @@ class GraphsGenerator:
             return [1] * num_weights
 
 
-    def _get_edge_weights(self, edges=None, adj_matrix=None, directed=True, weighted=True, only_positive_weights=False):
-        if edges is None:
-            num_vertices = len(adj_matrix)
-            edges = [
-                (u, v)
-                for u in range(num_vertices)
-                for v in range(num_vertices)
-                if adj_matrix[u][v]
-            ]
+    def _sample_dense_undirected_edges(self, num_vertices):
+        # one coin flip per unordered pair {u, v} with u < v
+        us, vs = np.triu_indices(num_vertices, k=1)
+        is_edge = self.rng.gen_bernoulli_ndarray((len(us),), self._edge_probability(num_vertices))
+        return us[is_edge], vs[is_edge]
 
-        weights = self._generate_random_edge_weights(len(edges), weighted, only_positive_weights)
 
-        if directed:
-            return [
-                (u, v, w) for (u, v), w in zip(edges, weights)
-            ]
+    def _sample_dense_directed_edges(self, num_vertices):
+        # one coin flip per ordered pair (u, v), as in an adjacency matrix
+        adj_matrix = self.rng.gen_bernoulli_ndarray((num_vertices, num_vertices), self._edge_probability(num_vertices))
+        return np.nonzero(adj_matrix)
 
-        # assign same weight for each edge direction
-        assigned_edges = set()
-        edge_list = []
-        for u, v in edges:
-            e = tuple(sorted([u, v]))
-            if e in assigned_edges:
-                continue
-            random_weight = weights[len(assigned_edges)]
-            edge_list.append((u, v, random_weight))
-            edge_list.append((v, u, random_weight))
-            assigned_edges.add(e)
 
-        return edge_list
+    def _sample_dense_dag_edges(self, topo_order):
+        # one coin flip per pair of positions i < j in the topological order
+        i, j = self._sample_dense_undirected_edges(len(topo_order))
+        topo_order = np.asarray(topo_order, dtype=np.int64)
+        return topo_order[i], topo_order[j]
 
 
-    def _gen_random_edges_from_topo_order(self, topo_order):
-        num_vertices = len(topo_order)        
-        adj_matrix = [[0 for _ in range(num_vertices)] for _ in range(num_vertices)]
-        for i, u in enumerate(topo_order):
-            bool_array = self.rng.gen_bool_array(num_vertices-i-1)
-            for j in range(i+1, num_vertices):
-                if bool_array[j-i-1]:
-                    adj_matrix[u][topo_order[j]] = 1
-        return adj_matrix
+    @staticmethod
+    def _check_family_setting(family):
+        # reject bad settings up front instead of midway through a dataset
+        families = family.items() if isinstance(family, dict) else [(None, family)]
+        for algorithm, algorithm_family in families:
+            if algorithm_family is not None and algorithm_family not in GRAPH_FAMILIES:
+                raise ValueError(f"Unknown graph family {algorithm_family!r}, expected one of {GRAPH_FAMILIES}")
+            if algorithm in TREE_ALGORITHMS:
+                GraphsGenerator._check_tree_family(algorithm_family)
 
 
-    def _generate_random_undirected_graph(self, num_vertices, weighted, only_positive_weights):
-        random_bool_grid = self.rng.gen_bool_grid(num_vertices, num_vertices)
-        symmetric_adj_matrix = self.copy_bottom_left_tri_to_top_right_tri(random_bool_grid)
-        return self._get_edge_weights(adj_matrix=symmetric_adj_matrix, directed=False, weighted=weighted, only_positive_weights=only_positive_weights)
+    def _family_for(self, algorithm):
+        if isinstance(self.family, dict):
+            return self.family.get(algorithm)
+        if algorithm in TREE_ALGORITHMS and self.family not in TREE_FAMILIES:
+            return None
+        return self.family
 
 
-    def _generate_random_directed_graph(self, num_vertices, weighted, only_positive_weights):
-        adj_matrix = self.rng.gen_bool_grid(num_vertices, num_vertices)
-        return self._get_edge_weights(adj_matrix=adj_matrix, directed=True, weighted=weighted, only_positive_weights=only_positive_weights)
+    def _average_degree(self, num_vertices):
+        return self._edge_probability(num_vertices) * max(num_vertices - 1, 0)
 
 
-    def _generate_random_dag(self, num_vertices, weighted, only_positive_weights):
-        random_topo_order = list(range(num_vertices))
-        random.shuffle(random_topo_order)
-        adj_matrix = self._gen_random_edges_from_topo_order(random_topo_order)
-        return self._get_edge_weights(adj_matrix=adj_matrix, directed=True, weighted=weighted, only_positive_weights=only_positive_weights)
+    @staticmethod
+    def _sample_path_edges(num_vertices):
+        return np.arange(num_vertices - 1), np.arange(1, num_vertices)
+
+
+    @staticmethod
+    def _sample_star_edges(num_vertices):
+        return np.zeros(max(num_vertices - 1, 0), dtype=np.int64), np.arange(1, num_vertices)
+
+
+    @staticmethod
+    def _sample_grid_edges(num_vertices):
+        # vertex i sits at row i // cols and column i % cols of a
+        # near-square grid whose last row may be partial
+        cols = max(math.isqrt(num_vertices), 1)
+        right = np.flatnonzero(np.arange(num_vertices - 1) % cols != cols - 1)
+        down = np.arange(max(num_vertices - cols, 0))
+        return np.concatenate((right, down)), np.concatenate((right + 1, down + cols))
+
+
+    def _sample_complete_bipartite_edges(self, num_vertices):
+        # every vertex of [0, a) is joined to every vertex of [a, n), with
+        # a chosen so that the average degree 2a(n-a)/n is about the target
+        # one: a few hubs for sparse graphs, balanced sides for dense ones
+        discriminant = max(num_vertices * num_vertices - 2 * self._average_degree(num_vertices) * num_vertices, 0)
+        a = min(max(int(round((num_vertices - math.sqrt(discriminant)) / 2)), 1), num_vertices // 2)
+        return np.repeat(np.arange(a), num_vertices - a), np.tile(np.arange(a, num_vertices), a)
+
+
+    def _sample_random_geometric_edges(self, num_vertices):
+        """
+        Drops the vertices uniformly in the unit square and joins the
+        pairs within distance r, chosen to give the average degree.
+        Vertices are bucketed into cells of side at least r, so only
+        pairs in the same or adjacent cells are compared, each once.
+        """
+        radius = min(math.sqrt(self._average_degree(num_vertices) / (math.pi * max(num_vertices, 1))), math.sqrt(2))
+        points = self.rng.gen_uniform_ndarray((num_vertices, 2))
+        cells_per_side = max(min(int(1 / radius) if radius > 0 else 1, math.isqrt(num_vertices) + 1), 1)
+        cell_xy = np.minimum((points * cells_per_side).astype(np.int64), cells_per_side - 1)
+        cells = cell_xy[:, 0] * cells_per_side + cell_xy[:, 1]
+
+        # vertices sorted by cell, so each cell is a range of positions
+        order = np.argsort(cells, kind="stable")
+        cell_starts = np.searchsorted(cells[order], np.arange(cells_per_side * cells_per_side + 1))
+        positions = np.arange(num_vertices)
+        cell_xy = cell_xy[order]
+
+        us, vs = [], []
+        # the same cell (later positions only) and the adjacent cells
+        # ahead of it, so each pair of cells is visited once
+        for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+            x, y = cell_xy[:, 0] + dx, cell_xy[:, 1] + dy
+            valid = (x < cells_per_side) & (y >= 0) & (y < cells_per_side)
+            neighbor_cells = np.where(valid, x * cells_per_side + y, 0)
+            starts = positions + 1 if (dx, dy) == (0, 0) else cell_starts[neighbor_cells]
+            counts = np.where(valid, cell_starts[neighbor_cells + 1] - starts, 0)
+            # all candidate positions of all vertices in one ragged arange
+            sources = np.repeat(positions, counts)
+            candidates = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+            us.append(sources)
+            vs.append(candidates)
+
+        us, vs = order[np.concatenate(us)], order[np.concatenate(vs)]
+        close = ((points[us] - points[vs]) ** 2).sum(axis=1) <= radius * radius
+        us, vs = us[close], vs[close]
+        return np.minimum(us, vs), np.maximum(us, vs)
+
+
+    def _sample_power_law_edges(self, num_vertices):
+        """
+        Chung-Lu graph: vertex i gets the weight (i+1)^(-1/(exponent-1)),
+        so the degrees follow a power law, and each of n*d/2 edges joins
+        two endpoints drawn in proportion to their weights. Self-loops
+        and repeated pairs are dropped.
+        """
+        weights = np.arange(1, num_vertices + 1) ** (-1 / (self.power_law_exponent - 1))
+        cumulative = np.cumsum(weights)
+        num_draws = int(round(num_vertices * self._average_degree(num_vertices) / 2))
+        endpoints = np.searchsorted(cumulative, self.rng.gen_uniform_ndarray((2, num_draws)) * cumulative[-1], side="right")
+        endpoints = np.minimum(endpoints, num_vertices - 1)
+        us, vs = np.minimum(*endpoints), np.maximum(*endpoints)
+        pairs = np.unique(us[us != vs] * num_vertices + vs[us != vs])
+        return pairs // num_vertices, pairs % num_vertices
+
+
+    def _sample_layered_dag_edges(self, num_vertices):
+        """
+        Splits the vertices into about sqrt(n) consecutive layers of
+        near-equal size and joins each pair of vertices in consecutive
+        layers with the probability that gives the average degree.
+        """
+        num_layers = min(max(math.isqrt(num_vertices), 2), num_vertices)
+        if num_layers < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        sizes = np.full(num_layers, num_vertices // num_layers) + (np.arange(num_layers) < num_vertices % num_layers)
+        layer_starts = np.cumsum(sizes) - sizes
+
+        # the slots between layers i and i+1 are numbered consecutively
+        num_slots = sizes[:-1] * sizes[1:]
+        slot_starts = np.cumsum(num_slots) - num_slots
+        p = num_vertices * self._average_degree(num_vertices) / 2 / num_slots.sum()
+        slots = self._sample_edge_slots(int(num_slots.sum()), p)
+        layers = np.searchsorted(slot_starts, slots, side="right") - 1
+        within = slots - slot_starts[layers]
+        return layer_starts[layers] + within // sizes[layers + 1], layer_starts[layers + 1] + within % sizes[layers + 1]
+
+
+    def _sample_family_edges(self, family, num_vertices):
+        """
+        Samples the edges of a graph of the given family as pairs
+        (us, vs), then relabels the vertices by a random permutation
+        and shuffles the edges. Returns (us, vs, topo_order), where
+        topo_order lists the vertices so that every edge goes from us
+        to vs forwards in it.
+        """
+        samplers = {
+            "complete_bipartite": self._sample_complete_bipartite_edges,
+            "grid": self._sample_grid_edges,
+            "layered_dag": self._sample_layered_dag_edges,
+            "path": self._sample_path_edges,
+            "power_law": self._sample_power_law_edges,
+            "random_geometric": self._sample_random_geometric_edges,
+            "star": self._sample_star_edges,
+        }
+        if family not in samplers:
+            raise ValueError(f"Unknown graph family {family!r}, expected one of {GRAPH_FAMILIES}")
+        us, vs = samplers[family](num_vertices)
+
+        topo_order = np.asarray(self.rng.gen_permutation(num_vertices), dtype=np.int64)
+        edge_order = np.arange(len(us))
+        self.rng.shuffle(edge_order)
+        return topo_order[us[edge_order]], topo_order[vs[edge_order]], topo_order.tolist()
+
+
+    def _sample_family_directed_edges(self, family, num_vertices):
+        # orient each edge of the family graph at random
+        us, vs, _ = self._sample_family_edges(family, num_vertices)
+        flip = self.rng.gen_bernoulli_ndarray((len(us),), 0.5)
+        return np.where(flip, vs, us), np.where(flip, us, vs)
+
+
+    def _connect_components(self, us, vs, num_vertices):
+        # chain the smallest vertex of each connected component to the next
+        labels = connected_component_labels(us, vs, num_vertices)
+        roots = np.flatnonzero(labels == np.arange(num_vertices))
+        return np.concatenate((us, roots[:-1])), np.concatenate((vs, roots[1:]))
+
+
+    def _generate_random_undirected_graph(self, num_vertices, weighted, only_positive_weights, family=None):
+        if family is not None:
+            us, vs, _ = self._sample_family_edges(family, num_vertices)
+        elif self.sparse:
+            us, vs = self._sample_sparse_undirected_edges(num_vertices)
+        else:
+            us, vs = self._sample_dense_undirected_edges(num_vertices)
+        return self._get_edge_weights_from_arrays(us, vs, directed=False, weighted=weighted, only_positive_weights=only_positive_weights)
+
+
+    def _generate_random_directed_graph(self, num_vertices, weighted, only_positive_weights, family=None):
+        if family is not None:
+            us, vs = self._sample_family_directed_edges(family, num_vertices)
+        elif self.sparse:
+            us, vs = self._sample_sparse_directed_edges(num_vertices)
+        else:
+            us, vs = self._sample_dense_directed_edges(num_vertices)
+        return self._get_edge_weights_from_arrays(us, vs, directed=True, weighted=weighted, only_positive_weights=only_positive_weights)
+
+
+    def _generate_random_dag(self, num_vertices, weighted, only_positive_weights, family=None):
+        # returns the edges and a topological order of the dag
+        if family is not None:
+            # family edges go forwards in the order they come with
+            us, vs, random_topo_order = self._sample_family_edges(family, num_vertices)
+        elif self.sparse:
+            random_topo_order = self.rng.gen_permutation(num_vertices)
+            us, vs = self._sample_sparse_dag_edges(random_topo_order)
+        else:
+            random_topo_order = self.rng.gen_permutation(num_vertices)
+            us, vs = self._sample_dense_dag_edges(random_topo_order)
+        # list edges by vertex rather than by topological position,
+        # which would give the order away
+        order = np.lexsort((vs, us))
+        return self._get_edge_weights_from_arrays(us[order], vs[order], directed=True, weighted=weighted, only_positive_weights=only_positive_weights), random_topo_order
 
     
-    def _generate_random_tree(self, num_vertices, weighted, only_positive_weights, offset=0):
-        random_topo_order = list(range(num_vertices))
-        random.shuffle(random_topo_order)
-
-        # root is first vertex of generated topological ordering
-        root = random_topo_order[0]
-
-        # store parents when adding edges, with -1 as placeholder
-        # to avoid creating multiple paths to a node
-        parent = [-1 for _ in range(num_vertices)]
-        parent[root] = root
-
-        # shuffle all possible edges that abide by topological
-        # ordering
-        possible_edges = [
-            (u, random_topo_order[j])
-            for i, u in enumerate(random_topo_order)
-            for j in range(i + 1, num_vertices)
-        ]
-        random.shuffle(possible_edges)
-
-        edges = []
-        for u, v in possible_edges:
-            if len(edges) == num_vertices - 1:
-                break
-            if parent[v] != -1:
-                # path to node exists
-                # so skip this edge
-                continue
-            parent[v] = u
-            # add single edge direction with offset
-            edges.append((u+offset, v+offset))
- 
-        return self._get_edge_weights(edges=edges, directed=False, weighted=weighted, only_positive_weights=only_positive_weights)
-    
+    def _sample_forest_edges(self, tree_sizes):
+        """
+        Samples a random tree on each consecutive block of tree_sizes
+        vertices in O(n): the vertices of each tree are put in random
+        order and each vertex after the first (the root) is attached to
+        a uniformly random earlier vertex. Returns (parents, children).
+        """
+        tree_sizes = np.asarray(tree_sizes, dtype=np.int64)
+        num_vertices = int(tree_sizes.sum())
+        tree_ids = np.repeat(np.arange(len(tree_sizes)), tree_sizes)
+        tree_starts = np.repeat(np.cumsum(tree_sizes) - tree_sizes, tree_sizes)
+
+        # random order of the vertices within each tree
+        order = np.lexsort((self.rng.gen_uniform_ndarray((num_vertices,)), tree_ids))
+
+        # position of each vertex slot within its tree's order
+        positions = np.arange(num_vertices) - tree_starts
+        non_roots = positions > 0
+        parent_positions = (self.rng.gen_uniform_ndarray((num_vertices,)) * positions).astype(np.int64)
+        parents = order[(tree_starts + parent_positions)[non_roots]]
+        return parents, order[non_roots]
+
+
+    @staticmethod
+    def _check_tree_family(family):
+        if family is not None and family not in TREE_FAMILIES:
+            raise ValueError(f"Graph family {family!r} does not give trees, expected one of {TREE_FAMILIES}")
 
-    def _generate_random_forest(self, num_vertices, weighted, only_positive_weights):
+
+    def _generate_random_tree(self, num_vertices, weighted, only_positive_weights, offset=0, family=None):
+        GraphsGenerator._check_tree_family(family)
+        if family is not None:
+            parents, children, _ = self._sample_family_edges(family, num_vertices)
+        else:
+            parents, children = self._sample_forest_edges([num_vertices])
+        # add single edge direction with offset
+        return self._get_edge_weights_from_arrays(parents + offset, children + offset, directed=False, weighted=weighted, only_positive_weights=only_positive_weights)
+
+
+    def _generate_random_forest(self, num_vertices, weighted, only_positive_weights, family=None):
+        if family is not None:
+            # a single tree of the family
+            return self._generate_random_tree(num_vertices, weighted, only_positive_weights, family=family)
+        # tree i spans the vertices [prefix[i], prefix[i+1]) of the partition
         random_partition = self.rng.gen_random_integer_partition(num_vertices)
-        partition_prefix_sum = list(itertools.accumulate(random_partition, initial=0))
-        return list(itertools.chain((
-            self._generate_random_tree(
-                num_tree_vertices,
-                weighted,
-                only_positive_weights,
-                offset=partition_prefix_sum[i]
-            )
-            for i, num_tree_vertices in enumerate(random_partition)
-        )))
+        parents, children = self._sample_forest_edges(random_partition)
+        return self._get_edge_weights_from_arrays(parents, children, directed=False, weighted=weighted, only_positive_weights=only_positive_weights)
 
-    
-    def _generate_random_reachable_digraph_from_src(self, src, num_vertices, weighted, only_positive_weights):
-        random_digraph = self._generate_random_directed_graph(num_vertices, weighted, only_positive_weights)
-        unreachable_nodes = GraphsGenerator._unreachable_vertices_from_src(random_digraph, num_vertices, src)
+
+    def _add_edges_from_src_to_unreachable(self, edges, src, num_vertices, weighted, only_positive_weights):
+        graph = CSRGraph.from_arrays(*edges, num_vertices)
+        unreachable_nodes = GraphsGenerator._unreachable_vertices_from_src(graph, src)
         # add direct edge from src to unreachable nodes
         random_weights = self._generate_random_edge_weights(len(unreachable_nodes), weighted, only_positive_weights)
-        for v, w in zip(unreachable_nodes, random_weights):
-            random_digraph.append((src, v, w))
+        us, vs, ws = edges
+        return (
+            np.concatenate((us, np.full(len(unreachable_nodes), src, dtype=us.dtype))),
+            np.concatenate((vs, unreachable_nodes.astype(vs.dtype))),
+            np.concatenate((ws, np.array(random_weights, dtype=ws.dtype)))
+        )
+
+
+    def _generate_random_connected_undirected_graph(self, num_vertices, weighted, only_positive_weights, family=None):
+        if family is not None:
+            us, vs, _ = self._sample_family_edges(family, num_vertices)
+            us, vs = self._connect_components(us, vs, num_vertices)
+            return self._get_edge_weights_from_arrays(us, vs, directed=False, weighted=weighted, only_positive_weights=only_positive_weights)
+
+        # union of a random spanning tree and a random graph
+        parents, children = self._sample_forest_edges([num_vertices])
+        us, vs = self._sample_sparse_undirected_edges(num_vertices)
+        us = np.concatenate((np.minimum(parents, children), us))
+        vs = np.concatenate((np.maximum(parents, children), vs))
+
+        # drop the random edges that are also tree edges, and
+        # mix the tree edges in with the others
+        _, first = np.unique(us * num_vertices + vs, return_index=True)
+        self.rng.shuffle(first)
+        return self._get_edge_weights_from_arrays(us[first], vs[first], directed=False, weighted=weighted, only_positive_weights=only_positive_weights)
+
+
+    def _generate_random_reachable_digraph_from_srcs(self, srcs, num_vertices, weighted, only_positive_weights, family=None):
+        random_digraph = self._generate_random_directed_graph(num_vertices, weighted, only_positive_weights, family)
+        for src in srcs:
+            random_digraph = self._add_edges_from_src_to_unreachable(random_digraph, src, num_vertices, weighted, only_positive_weights)
         return random_digraph
 
 
-    def _generate_random_reachable_dag_from_vertex(self, num_vertices, weighted, only_positive_weights):
-        random_dag = self._generate_random_dag(num_vertices, weighted, only_positive_weights)
-        dag_src = GraphsGenerator._get_dag_source(random_dag, num_vertices)
-        unreachable_nodes = GraphsGenerator._unreachable_vertices_from_src(random_dag, num_vertices, dag_src)
-        # add direct edge from src to unreachable nodes
-        random_weights = self._generate_random_edge_weights(len(unreachable_nodes), weighted, only_positive_weights)
-        for v, w in zip(unreachable_nodes, random_weights):
-            random_dag.append((dag_src, v, w))
-        return random_dag, dag_src
+    def _generate_random_reachable_dag_from_vertex(self, num_vertices, weighted, only_positive_weights, family=None):
+        random_dag, random_topo_order = self._generate_random_dag(num_vertices, weighted, only_positive_weights, family)
+        # the first vertex in topological order has no incoming edges, so
+        # adding edges from it keeps both the dag and the order valid
+        dag_src = random_topo_order[0]
+        random_dag = self._add_edges_from_src_to_unreachable(random_dag, dag_src, num_vertices, weighted, only_positive_weights)
+        return random_dag, dag_src, random_topo_order
+
 
+    def _gen_srcs(self, num_vertices, src=None):
+        """
+        Returns num_queries distinct src vertices (at most
+        num_vertices), starting with src if it is given.
+        """
+        if self.num_queries == 1:
+            return [src if src is not None else self.rng.gen_int(0, num_vertices-1)]
+        srcs = [src] if src is not None else []
+        srcs += [v for v in self.rng.gen_permutation(num_vertices) if v != src]
+        return srcs[:self.num_queries]
 
-    def _try_to_generate_reachable_digraph_without_negative_cycle(self, retries=2):
+
+    def _add_srcs(self, problem, srcs):
+        if self.num_queries == 1:
+            problem["src"] = srcs[0]
+        else:
+            problem["srcs"] = srcs
+        return problem
+
+
+    def _try_to_generate_reachable_digraph_without_negative_cycle(self, retries=2, family=None):
         # try to generate a reachable digraph with negative weight edges without a
         # negative cycle within {retries} generations; if fails both attempts,
         # default to a strictly positive weight reachable digraph
         for _ in range(retries):
-            problem = self._generate_graph_problem(directed=True, weighted=True, only_positive_weights=False, reachable_from_src=True, include_src=True)
+            problem = self._generate_graph_problem(directed=True, weighted=True, only_positive_weights=False, reachable_from_src=True, include_src=True, family=family)
             if self._has_negative_cycle(**problem):
                 continue
             return problem
-        return self._generate_graph_problem(directed=True, weighted=True, only_positive_weights=True, reachable_from_src=True, include_src=True)
+        return self._generate_graph_problem(directed=True, weighted=True, only_positive_weights=True, reachable_from_src=True, include_src=True, family=family)
+
+
+    def _assign_potential_weights(self, us, vs, num_vertices):
+        """
+        Draws weights w(u, v) = base(u, v) + p(u) - p(v) from random
+        non-negative base weights and random vertex potentials p. The
+        potentials cancel along any cycle, so every cycle weighs the sum
+        of its base weights and no negative cycle can exist, while edges
+        going "uphill" in potential still get negative weights.
 
+        Weights are at most max_weight by construction, and weights
+        below min_weight are raised to it, which cannot create a
+        negative cycle either.
+        """
+        max_potential = self.max_weight // 2 if self.min_weight < 0 else 0
+        potentials = self.rng.gen_int_ndarray((num_vertices,), 0, max_potential)
+        base_weights = self.rng.gen_int_ndarray((len(us),), max(self.min_weight, 0), self.max_weight - max_potential)
+        return np.maximum(base_weights + potentials[us] - potentials[vs], self.min_weight)
 
-    def _generate_graph_problem(self, tree=False, acyclic=False, directed=False, weighted=False, only_positive_weights=False, reachable_from_src=False, include_src=False):
+
+    def _generate_reachable_digraph_without_negative_cycle(self, family=None):
+        # weights are reassigned below, so generate the graph unweighted
+        num_vertices = self.rng.gen_int(self.min_vertices, self.max_vertices)
+        srcs = self._gen_srcs(num_vertices)
+        us, vs, _ = self._generate_random_reachable_digraph_from_srcs(srcs, num_vertices, weighted=False, only_positive_weights=False, family=family)
+        ws = self._assign_potential_weights(us, vs, num_vertices)
+        return self._add_srcs({
+            "edge_list": self._format_edges((us, vs, ws), num_vertices),
+            "num_vertices": num_vertices
+        }, srcs)
+
+
+    def _format_edges(self, edges, num_vertices, topo_order=None):
+        if self.as_csr:
+            return CSRGraph.from_arrays(*edges, num_vertices, topo_order=topo_order)
+        us, vs, ws = edges
+        return list(zip(us.tolist(), vs.tolist(), ws.tolist(), strict=True))
+
+
+    def _generate_random_strongly_connected_digraph(self, num_vertices, family=None):
+        us, vs, _ = self._generate_random_directed_graph(num_vertices, weighted=False, only_positive_weights=False, family=family)
+        # close a cycle through all vertices in random order, skipping
+        # the cycle edges that are already in the graph
+        cycle = np.asarray(self.rng.gen_permutation(num_vertices), dtype=us.dtype)
+        cycle_us, cycle_vs = cycle, np.roll(cycle, -1)
+        missing = ~np.isin(cycle_us * num_vertices + cycle_vs, us * num_vertices + vs)
+        if num_vertices == 1:
+            missing[:] = False
+        return np.concatenate((us, cycle_us[missing])), np.concatenate((vs, cycle_vs[missing]))
+
+
+    def _generate_graph_problem(self, tree=False, connected=False, acyclic=False, directed=False, weighted=False, only_positive_weights=False, reachable_from_src=False, include_src=False, family=None):
         num_vertices = self.rng.gen_int(self.min_vertices, self.max_vertices)
-        src = None
+        srcs = None
+        topo_order = None
 
         if tree:
             # tree (complete acyclic graph)
-            edge_list = self._generate_random_tree(num_vertices, weighted, only_positive_weights)
+            edge_list = self._generate_random_tree(num_vertices, weighted, only_positive_weights, family=family)
+
+        elif connected and not directed:
+            # connected undirected graph
+            edge_list = self._generate_random_connected_undirected_graph(num_vertices, weighted, only_positive_weights, family)
 
         elif acyclic and not directed:
             # forest
-            edge_list = self._generate_random_forest(num_vertices, weighted, only_positive_weights)
+            edge_list = self._generate_random_forest(num_vertices, weighted, only_positive_weights, family)
 
         elif not directed:
             # undirected graph
-            edge_list = self._generate_random_undirected_graph(num_vertices, weighted, only_positive_weights)
+            edge_list = self._generate_random_undirected_graph(num_vertices, weighted, only_positive_weights, family)
 
         elif acyclic and reachable_from_src:
-            # directed acyclic graph reachable from src
-            edge_list, src = self._generate_random_reachable_dag_from_vertex(num_vertices, weighted, only_positive_weights)
+            # directed acyclic graph reachable from src; other srcs
+            # of a multi-query problem may not reach every vertex
+            edge_list, src, topo_order = self._generate_random_reachable_dag_from_vertex(num_vertices, weighted, only_positive_weights, family)
+            srcs = self._gen_srcs(num_vertices, src)
 
         elif acyclic:
             # directed acyclic graph
-            edge_list = self._generate_random_dag(num_vertices, weighted, only_positive_weights)        
+            edge_list, topo_order = self._generate_random_dag(num_vertices, weighted, only_positive_weights, family)
 
         elif reachable_from_src:
-            # directed graph that is reachable from src
-            edge_list = self._generate_random_reachable_digraph_from_src(
-                src := self.rng.gen_int(0, num_vertices-1),
+            # directed graph that is reachable from every src
+            edge_list = self._generate_random_reachable_digraph_from_srcs(
+                srcs := self._gen_srcs(num_vertices),
                 num_vertices,
                 weighted,
-                only_positive_weights
+                only_positive_weights,
+                family
             )
 
         else:
             # directed graph
-            edge_list = self._generate_random_directed_graph(num_vertices, weighted, only_positive_weights)
+            edge_list = self._generate_random_directed_graph(num_vertices, weighted, only_positive_weights, family)
 
-        if not include_src:
-            return {
-                "edge_list": edge_list,
-                "num_vertices": num_vertices
-            }
-        
-        if src is None:
-            src = self.rng.gen_int(0, num_vertices-1)
+        edge_list = self._format_edges(edge_list, num_vertices, topo_order)
 
-        return {
+        problem = {
             "edge_list": edge_list,
-            "num_vertices": num_vertices,
-            "src": src
+            "num_vertices": num_vertices
         }
+        if not include_src:
+            return problem
+        
+        if srcs is None:
+            srcs = self._gen_srcs(num_vertices)
 
+        return self._add_srcs(problem, srcs)
+
+
+    def generate_articulation_points_problem(self, family=None):
+        # connected undirected graph
+        problem = self._generate_graph_problem(connected=True, weighted=False, family=family)
+        problem["task"] = "For each vertex, output 1 if it is an articulation point of the undirected graph and 0 otherwise"
+        return problem
 
-    def generate_bellman_ford_problem(self):
+
+    def generate_bellman_ford_problem(self, family=None):
         # directed graphs with negative weights
-        problem = self._try_to_generate_reachable_digraph_without_negative_cycle()
+        if self.negative_cycle_free_by_construction:
+            problem = self._generate_reachable_digraph_without_negative_cycle(family)
+        else:
+            problem = self._try_to_generate_reachable_digraph_without_negative_cycle(family=family)
         problem["task"] = "Find the shortest path distances from src to all vertices in the graph (negative weights allowed)"
         return problem
 
 
-    def generate_bfs_problem(self):
+    def generate_bfs_problem(self, family=None):
         # unweighted tree for deterministic traversal
-        problem = self._generate_graph_problem(tree=True, weighted=False, include_src=True)
+        problem = self._generate_graph_problem(tree=True, weighted=False, include_src=True, family=family)
         problem["task"] = "Traverse the graph in breadth-first order from src and track parents (parent of src is just src)"
         return problem
 
 
-    def generate_dag_shortest_path_problem(self):
+    def generate_bridges_problem(self, family=None):
+        # connected undirected graph
+        problem = self._generate_graph_problem(connected=True, weighted=False, family=family)
+        problem["task"] = "For each edge in the edge list, output 1 if it is a bridge of the undirected graph and 0 otherwise"
+        return problem
+
+
+    def generate_dag_shortest_path_problem(self, family=None):
         # directed acyclic graph with negative weights
-        problem = self._generate_graph_problem(acyclic=True, directed=True, weighted=True, only_positive_weights=False, reachable_from_src=True, include_src=True)
+        problem = self._generate_graph_problem(acyclic=True, directed=True, weighted=True, only_positive_weights=False, reachable_from_src=True, include_src=True, family=family)
         problem["task"] = "Find the shortest path distances from src to all vertices in a DAG"
         return problem
 
 
-    def generate_dfs_problem(self):
+    def generate_dfs_problem(self, family=None):
         # unweighted tree for deterministic traversal
-        problem = self._generate_graph_problem(tree=True, weighted=False, include_src=True)
+        problem = self._generate_graph_problem(tree=True, weighted=False, include_src=True, family=family)
         problem["task"] = "Traverse the graph in depth-first order from src and track parents (parent of src is just src)"
         return problem
 
 
-    def generate_dijkstra_problem(self):
+    def generate_dijkstra_problem(self, family=None):
         # directed graph with positive weights
-        problem = self._generate_graph_problem(directed=True, weighted=True, only_positive_weights=True, reachable_from_src=True, include_src=True)
+        problem = self._generate_graph_problem(directed=True, weighted=True, only_positive_weights=True, reachable_from_src=True, include_src=True, family=family)
         problem["task"] = "Find the shortest path distances from src to all vertices in the graph"
         return problem
 
 
-    def generate_topological_sort_problem(self):
+    def generate_floyd_warshall_problem(self, family=None):
+        # strongly connected directed graph with negative weights
+        # but no negative cycles, so all distances are finite
+        num_vertices = self.rng.gen_int(self.min_vertices, self.max_vertices)
+        us, vs = self._generate_random_strongly_connected_digraph(num_vertices, family)
+        ws = self._assign_potential_weights(us, vs, num_vertices)
+        problem = {
+            "edge_list": self._format_edges((us, vs, ws), num_vertices),
+            "num_vertices": num_vertices
+        }
+        problem["task"] = "Find the shortest path distances between all pairs of vertices in the graph (negative weights allowed)"
+        return problem
+
+
+    def generate_mst_kruskal_problem(self, family=None):
+        # connected undirected graph with positive weights
+        problem = self._generate_graph_problem(connected=True, weighted=True, only_positive_weights=True, family=family)
+        problem["task"] = "Find the total weight of a minimum spanning tree of the graph using Kruskal's algorithm"
+        return problem
+
+
+    def generate_mst_prim_problem(self, family=None):
+        # connected undirected graph with positive weights
+        problem = self._generate_graph_problem(connected=True, weighted=True, only_positive_weights=True, family=family)
+        problem["task"] = "Find the total weight of a minimum spanning tree of the graph using Prim's algorithm"
+        return problem
+
+
+    def generate_scc_problem(self, family=None):
+        # directed graph
+        problem = self._generate_graph_problem(directed=True, weighted=False, family=family)
+        problem["task"] = "Label each vertex with the smallest vertex in its strongly connected component"
+        return problem
+
+
+    def generate_topological_sort_problem(self, family=None):
         # unweighted directed acyclic graph
-        problem = self._generate_graph_problem(acyclic=True, directed=True, weighted=False)
+        problem = self._generate_graph_problem(acyclic=True, directed=True, weighted=False, family=family)
         problem["task"] = "Find a valid topological order of the vertices in the DAG"
         return problem
 
 
     def generate_problem(self, algorithm: Algorithm, **kwargs):
+        kwargs.setdefault("family", self._family_for(algorithm))
         return {
+            Algorithm.ARTICULATION_POINTS: self.generate_articulation_points_problem,
             Algorithm.BELLMAN_FORD: self.generate_bellman_ford_problem,
             Algorithm.BFS: self.generate_bfs_problem,
+            Algorithm.BRIDGES: self.generate_bridges_problem,
             Algorithm.DAG_SHORTEST_PATH: self.generate_dag_shortest_path_problem,
             Algorithm.DFS: self.generate_dfs_problem,
             Algorithm.DIJKSTRA: self.generate_dijkstra_problem,
+            Algorithm.FLOYD_WARSHALL: self.generate_floyd_warshall_problem,
+            Algorithm.MST_KRUSKAL: self.generate_mst_kruskal_problem,
+            Algorithm.MST_PRIM: self.generate_mst_prim_problem,
+            Algorithm.SCC: self.generate_scc_problem,
             Algorithm.TOPOLOGICAL_SORT: self.generate_topological_sort_problem,
         }[algorithm](**kwargs)
\ No newline at end of file
@@ -1,6 +1,9 @@
-from ..utils import Rng
+from ..utils import PaddedArray, Rng
 from ..algorithms import Algorithm
 
+ACTIVITY_SELECTION_TASK = "Select the maximum number of non-overlapping activities"
+TASK_SCHEDULING_TASK = "Schedule tasks to maximize the total weight of the tasks scheduled by their deadline"
+
 class GreedyGenerator:
     def __init__(self, rng=None, min_input_size=5, max_input_size=10, min_time=0, max_time=10, min_weight=1, max_weight=10, seed=None):
         self.rng = rng if rng is not None else Rng(seed)
@@ -25,7 +28,7 @@ class GreedyGenerator:
         return {
             "start": start_times,
             "finish": finish_times,
-            "task": "Select the maximum number of non-overlapping activities"
+            "task": ACTIVITY_SELECTION_TASK
         }
 
 
@@ -37,12 +40,44 @@ class GreedyGenerator:
         return {
             "deadlines": deadlines,
             "weights": weights,
-            "task": "Schedule tasks to maximize the total weight of the tasks scheduled by their deadline"
-        }  
+            "task": TASK_SCHEDULING_TASK
+        }
+
+
+    def generate_activity_selection_batch(self, num_problems):
+        num_tasks = self.rng.gen_int_ndarray((num_problems,), self.min_input_size, self.max_input_size)
+        start_times = self.rng.gen_padded_int_arrays(num_tasks, self.min_time, self.max_time-1)
+        # make sure finish times are after start times
+        finish_times = PaddedArray(
+            self.rng.gen_int_ndarray_in_ranges(start_times.values + 1, self.max_time),
+            num_tasks
+        )
+        finish_times.values[~finish_times.mask()] = finish_times.pad_value
+        return {
+            "start": start_times,
+            "finish": finish_times,
+            "task": ACTIVITY_SELECTION_TASK
+        }
+
+
+    def generate_task_scheduling_batch(self, num_problems):
+        num_tasks = self.rng.gen_int_ndarray((num_problems,), self.min_input_size, self.max_input_size)
+        return {
+            "deadlines": self.rng.gen_padded_int_arrays(num_tasks, self.min_time, self.max_time),
+            "weights": self.rng.gen_padded_int_arrays(num_tasks, self.min_weight, self.max_weight),
+            "task": TASK_SCHEDULING_TASK
+        }
 
 
     def generate_problem(self, algorithm: Algorithm, **kwargs):
         return {
             Algorithm.TASK_SCHEDULING: self.generate_task_scheduling_problem,
             Algorithm.ACTIVITY_SELECTION: self.generate_activity_selection_problem,
-        }[algorithm](**kwargs)
\ No newline at end of file
+        }[algorithm](**kwargs)
+
+
+    def generate_batch(self, algorithm: Algorithm, num_problems, **kwargs):
+        return {
+            Algorithm.TASK_SCHEDULING: self.generate_task_scheduling_batch,
+            Algorithm.ACTIVITY_SELECTION: self.generate_activity_selection_batch,
+        }[algorithm](num_problems, **kwargs)
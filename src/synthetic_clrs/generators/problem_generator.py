@@ -1,4 +1,5 @@
 from ..utils.rng_utils import Rng
+from ..utils.batch_utils import batch_from_problems
 from ..algorithms import Algorithm
 from ..problem_mappings import ALGORITHM_TO_CATEGORY, Category
 from .greedy_generator import GreedyGenerator
@@ -23,8 +24,52 @@ class ProblemGenerator():
             Category.SORTING: SortingGenerator(rng=rng),
             Category.STRINGS: StringsGenerator(rng=rng),
         }
+        # counter-based Rng of each (master_seed, algorithm) stream,
+        # moved to the requested index by generate_problem_at
+        self._counter_rngs = {}
 
 
     def generate_problem(self, algorithm: Algorithm, **kwargs):
         problem_generator = self.generators[ALGORITHM_TO_CATEGORY[algorithm]]
         return problem_generator.generate_problem(algorithm, **kwargs)
+
+
+    def generate_batch(self, algorithm: Algorithm, num_problems, **kwargs):
+        """
+        Generate num_problems problems of algorithm at once as a
+        columnar batch: a dict mapping each question field to a
+        PaddedArray (bounded-length arrays), RaggedArray (e.g. edge
+        lists), numpy array (scalars) or the shared task string.
+        Algorithms without a vectorized generator are generated one
+        problem at a time and converted.
+        """
+        problem_generator = self.generators[ALGORITHM_TO_CATEGORY[algorithm]]
+        if hasattr(problem_generator, "generate_batch"):
+            return problem_generator.generate_batch(algorithm, num_problems, **kwargs)
+        return batch_from_problems([
+            problem_generator.generate_problem(algorithm, **kwargs)
+            for _ in range(num_problems)
+        ])
+
+
+    def generate_problem_at(self, algorithm: Algorithm, index, master_seed, **kwargs):
+        """
+        Generate problem number index of algorithm for the dataset
+        keyed by master_seed. The problem is drawn from its own
+        counter-based random stream, so it is built in O(1) and is
+        the same regardless of which other problems were generated.
+        """
+        rng = self._counter_rngs.get((master_seed, algorithm))
+        if rng is None:
+            rng = Rng.from_counter(master_seed, algorithm, index)
+            self._counter_rngs[master_seed, algorithm] = rng
+        else:
+            rng.seek(index)
+
+        # draw from the counter stream instead of the shared one
+        problem_generator = self.generators[ALGORITHM_TO_CATEGORY[algorithm]]
+        shared_rng, problem_generator.rng = problem_generator.rng, rng
+        try:
+            return problem_generator.generate_problem(algorithm, **kwargs)
+        finally:
+            problem_generator.rng = shared_rng
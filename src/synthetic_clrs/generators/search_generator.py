@@ -1,6 +1,11 @@
+import numpy as np
+
 from ..utils import Rng
 from ..algorithms import Algorithm
 
+BINARY_SEARCH_TASK = "Find the index of target in the array"
+MINIMUM_TASK = "Find the minimum element of the array"
+
 class SearchGenerator:
     def __init__(self, rng=None, min_num_elements=5, max_num_elements=15, min_element=-100, max_element=100, seed=None):
         self.rng = rng if rng is not None else Rng(seed)
@@ -17,7 +22,7 @@ class SearchGenerator:
         return {
             "array": arr,
             "target": arr[target_idx],
-            "task": "Find the index of target in the array"
+            "task": BINARY_SEARCH_TASK
         }
     
 
@@ -26,7 +31,33 @@ class SearchGenerator:
         arr = self.rng.gen_int_array(num_elements, self.min_element, self.max_element)
         return {
             "array": arr,
-            "task": "Find the minimum element of the array"
+            "task": MINIMUM_TASK
+        }
+
+
+    def _generate_padded_arrays(self, num_problems):
+        lengths = self.rng.gen_int_ndarray((num_problems,), self.min_num_elements, self.max_num_elements)
+        return self.rng.gen_padded_int_arrays(lengths, self.min_element, self.max_element)
+
+
+    def generate_binary_search_batch(self, num_problems):
+        arrays = self._generate_padded_arrays(num_problems)
+        # sort each row with padding pushed past the row's values
+        mask = arrays.mask()
+        arrays.values = np.sort(np.where(mask, arrays.values, np.iinfo(np.int64).max), axis=1)
+        arrays.values[~mask] = arrays.pad_value
+        target_indices = self.rng.gen_int_ndarray_in_ranges(0, arrays.lengths - 1)
+        return {
+            "array": arrays,
+            "target": arrays.values[np.arange(num_problems), target_indices],
+            "task": BINARY_SEARCH_TASK
+        }
+
+
+    def generate_minimum_batch(self, num_problems):
+        return {
+            "array": self._generate_padded_arrays(num_problems),
+            "task": MINIMUM_TASK
         }
 
 
@@ -38,4 +69,11 @@ class SearchGenerator:
         return {
             Algorithm.BINARY_SEARCH: self.generate_binary_search_problem,
             Algorithm.MINIMUM: self.generate_minimum_problem,
-        }[algorithm](**kwargs)
\ No newline at end of file
+        }[algorithm](**kwargs)
+
+
+    def generate_batch(self, algorithm: Algorithm, num_problems, **kwargs):
+        return {
+            Algorithm.BINARY_SEARCH: self.generate_binary_search_batch,
+            Algorithm.MINIMUM: self.generate_minimum_batch,
+        }[algorithm](num_problems, **kwargs)
@@ -1,6 +1,8 @@
 from ..utils import Rng
 from ..algorithms import Algorithm
 
+SORTING_TASK = "Sort the array in ascending order"
+
 class SortingGenerator:
     def __init__(self, rng=None, min_num_elements=5, max_num_elements=10, min_element=-100, max_element=100, seed=None):
         self.rng = rng if rng is not None else Rng(seed)
@@ -15,7 +17,15 @@ class SortingGenerator:
         arr = self.rng.gen_int_array(num_elements, self.min_element, self.max_element)
         return {
             "array": arr,
-            "task": "Sort the array in ascending order"
+            "task": SORTING_TASK
+        }
+
+
+    def _generate_sorting_batch(self, num_problems):
+        lengths = self.rng.gen_int_ndarray((num_problems,), self.min_num_elements, self.max_num_elements)
+        return {
+            "array": self.rng.gen_padded_int_arrays(lengths, self.min_element, self.max_element),
+            "task": SORTING_TASK
         }
 
 
@@ -42,3 +52,13 @@ class SortingGenerator:
             Algorithm.INSERTION_SORT: self.generate_insertion_sort_problem,
             Algorithm.QUICKSORT: self.generate_quicksort_problem,
         }[algorithm](**kwargs)
+
+
+    def generate_batch(self, algorithm: Algorithm, num_problems, **kwargs):
+        return {
+            Algorithm.BUBBLE_SORT: self._generate_sorting_batch,
+            Algorithm.HEAPSORT: self._generate_sorting_batch,
+            Algorithm.INSERTION_SORT: self._generate_sorting_batch,
+            Algorithm.QUICKSORT: self._generate_sorting_batch,
+        }[algorithm](num_problems, **kwargs)
+
@@ -1,6 +1,8 @@
 from ..utils import Rng
 from ..algorithms import Algorithm
 
+STRING_MATCHER_TASK = "Find the index of the first substring of text that matches pattern"
+
 class StringsGenerator:
     def __init__(self, rng=None, min_string_length=3, max_string_length=8, min_char=0, max_char=3, seed=None):
         self.rng = rng if rng is not None else Rng(seed)
@@ -20,7 +22,17 @@ class StringsGenerator:
         return {
             "text": text,
             "pattern": pattern,
-            "task": "Find the index of the first substring of text that matches pattern"
+            "task": STRING_MATCHER_TASK
+        }
+
+
+    def _generate_string_matcher_batch(self, num_problems):
+        text_lengths = self.rng.gen_int_ndarray((num_problems,), self.min_string_length, self.max_string_length)
+        pattern_lengths = self.rng.gen_int_ndarray_in_ranges(self.min_string_length, text_lengths)
+        return {
+            "text": self.rng.gen_padded_int_arrays(text_lengths, self.min_char, self.max_char),
+            "pattern": self.rng.gen_padded_int_arrays(pattern_lengths, self.min_char, self.max_char),
+            "task": STRING_MATCHER_TASK
         }
 
 
@@ -37,3 +49,11 @@ class StringsGenerator:
             Algorithm.KMP_MATCHER: self.generate_kmp_matcher_problem,
             Algorithm.NAIVE_STRING_MATCHER: self.generate_naive_string_matcher_problem,
         }[algorithm](**kwargs)
+
+
+    def generate_batch(self, algorithm: Algorithm, num_problems, **kwargs):
+        return {
+            Algorithm.KMP_MATCHER: self._generate_string_matcher_batch,
+            Algorithm.NAIVE_STRING_MATCHER: self._generate_string_matcher_batch,
+        }[algorithm](num_problems, **kwargs)
+
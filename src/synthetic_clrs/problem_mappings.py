@@ -24,11 +24,17 @@ ALGORITHMS_BY_CATEGORY = MappingProxyType({
         Algorithm.TASK_SCHEDULING
     ],
     Category.GRAPHS: [
+        Algorithm.ARTICULATION_POINTS,
         Algorithm.BELLMAN_FORD,
         Algorithm.BFS,
+        Algorithm.BRIDGES,
         Algorithm.DAG_SHORTEST_PATH,
         Algorithm.DFS,
         Algorithm.DIJKSTRA,
+        Algorithm.FLOYD_WARSHALL,
+        Algorithm.MST_KRUSKAL,
+        Algorithm.MST_PRIM,
+        Algorithm.SCC,
         Algorithm.TOPOLOGICAL_SORT
     ],
     Category.SEARCH: [
@@ -45,9 +51,12 @@ ALGORITHMS_BY_CATEGORY = MappingProxyType({
         Algorithm.KADANE
     ],
     Category.GEOMETRY: [
+        Algorithm.ANY_SEGMENTS_INTERSECT,
+        Algorithm.CLOSEST_PAIR,
         Algorithm.GRAHAM_SCAN,
         Algorithm.JARVIS_MARCH,
-        Algorithm.SEGMENT_INTERSECT
+        Algorithm.SEGMENT_INTERSECT,
+        Algorithm.SEGMENT_INTERSECTIONS
     ],
     Category.STRINGS: [
         Algorithm.KMP_MATCHER,
@@ -1,3 +1,8 @@
+import numpy as np
+
+from ..utils.batch_utils import as_padded, max_value, pad_with
+
+
 class DivideConquerSolver:
     @staticmethod
     def kadane(array, **_):
@@ -50,3 +55,22 @@ class DivideConquerSolver:
         _, max_subarray_sum = subproblem(0, len(array) - 1)
 
         return max_subarray_sum
+
+
+    @staticmethod
+    def kadane_batch(array, **_):
+        """
+        Maximum subarray sum of every row at once: the best sum ending
+        at j is prefix[j] minus the smallest prefix before j.
+        """
+        array = as_padded(array)
+        if not array.lengths.all():
+            raise ValueError("Input batch contains an empty array!")
+
+        prefix_sums = np.cumsum(pad_with(array, 0), axis=1)
+        prefix_sums = np.concatenate((np.zeros_like(prefix_sums[:, :1]), prefix_sums), axis=1)
+        min_prefix_before = np.minimum.accumulate(prefix_sums[:, :-1], axis=1)
+        best_ending_at = prefix_sums[:, 1:] - min_prefix_before
+
+        best_ending_at[~array.mask()] = -max_value(best_ending_at.dtype)
+        return best_ending_at.max(axis=1).tolist()
@@ -1,3 +1,8 @@
+import numpy as np
+
+from ..utils.batch_utils import as_padded
+
+
 class DynamicProgrammingSolver:
     @staticmethod
     def matrix_chain_order(matrix_dimensions, **_):
@@ -24,6 +29,33 @@ class DynamicProgrammingSolver:
         return dp[len_a][len_b]
 
 
+    @staticmethod
+    def lcs_length_batch(sequence_a, sequence_b, **_):
+        """
+        Fills the lcs_length dp table one row i at a time for every
+        problem at once. Within a row, dp[i][j] is a running max over j
+        of max(dp[i-1][j], dp[i-1][j-1] + match), so each row is a
+        single maximum.accumulate.
+        """
+        sequence_a, sequence_b = as_padded(sequence_a), as_padded(sequence_b)
+        num_rows, max_len_b = sequence_b.values.shape
+        rows = np.arange(num_rows)
+
+        dp = np.zeros((num_rows, max_len_b + 1), dtype=np.int64)
+        lcs_lengths = np.zeros(num_rows, dtype=np.int64)
+
+        for i in range(1, sequence_a.values.shape[1] + 1):
+            matches = sequence_a.values[:, i-1, None] == sequence_b.values
+            candidates = np.maximum(dp[:, 1:], dp[:, :-1] + matches)
+            dp[:, 1:] = np.maximum.accumulate(candidates, axis=1)
+
+            # read off the answer once row i reaches the end of sequence_a
+            done = sequence_a.lengths == i
+            lcs_lengths[done] = dp[rows[done], sequence_b.lengths[done]]
+
+        return lcs_lengths.tolist()
+
+
     @staticmethod
     def optimal_bst(key_probabilities, gap_probabilities, decimal_places, **_):
         if not key_probabilities:
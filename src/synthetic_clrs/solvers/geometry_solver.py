@@ -1,135 +1,117 @@
+import numpy as np
+
+from ..utils import (
+    SweepLineStatus,
+    closest_pair_distance,
+    gift_wrapping,
+    hull_mask,
+    monotone_chain,
+    point_arrays,
+    segment_endpoints,
+    segment_pairs_intersect,
+    segments_intersect,
+)
+
 class GeometrySolver:
     @staticmethod
-    def graham_scan(xs, ys, **_):
-        points = list(zip(xs, ys))
+    def any_segments_intersect(xs, ys, **_):
+        """
+        Define line segment s_i by endpoints p[2i], p[2i+1],
+        where p = list(zip(xs, ys)).
 
-        if not points:
-            return []
+        Returns 1 if any two segments share a point, otherwise 0.
 
-        if len(points) == 1:
-            return [1]
-
-        # extract lowest point to initialize convex hull
-        lowest_point = (float('inf'), float('inf'))
-        for x, y in points:
-            if y > lowest_point[-1]:
-                continue
-            elif y == lowest_point[-1] and x > lowest_point[0]:
-                continue
-            # lower y than current lowest_point
-            # or same y but smaller x
-            lowest_point = (x, y)
-
-        i_low = next((
-            i for i, p in enumerate(points)
-            if p == lowest_point
-        ))
-
-        # initialize convex hull with lowest point
-        convex_hull = [i_low]
-            
-        # sort other points by ccw angle from lowest point
-        def polar_angle_key(v):
-            dx = v[0] - lowest_point[0]
-            dy = v[1] - lowest_point[1]
-            import math
-            return math.atan2(dy, dx)
-
-        other_points = [(i, p) for i, p in enumerate(points) if i != i_low]
-        sorted_points = list(sorted(
-            other_points,
-            key=lambda e: polar_angle_key(e[1]),
-        ))
-
-        # iterate through points, only accepting into 
-        # convex hull if it forms right turn
-        def forms_left_turn(p0, p1, p2):
-            v0 = (p1[0] - p0[0], p1[1] - p0[1])
-            v1 = (p2[0] - p1[0], p2[1] - p1[1])
-            cross_prod = v0[0] * v1[1] - v0[1] * v1[0]
-            return cross_prod > 0
-
-        convex_hull.append(sorted_points[0][0])
-        for i, n in sorted_points[1:]:
-            # pop points from convex hull until
-            # we form a left turn
-            while len(convex_hull) >= 2:
-                p = points[convex_hull[-2]]
-                c = points[convex_hull[-1]]
-                if forms_left_turn(p, c, n):
-                    break
-                convex_hull.pop()
-            convex_hull.append(i)
-
-        selected = [0 for _ in range(len(points))]
-        for i in convex_hull:
-            selected[i] = 1
-        
-        return selected
-            
-    
-    @staticmethod
-    def jarvis_march(xs, ys, **_):
-        points = list(zip(xs, ys))
+        Shamos-Hoey sweep (CLRS ANY-SEGMENTS-INTERSECT): segments
+        crossing the sweep line are kept ordered from bottom to top
+        and each segment is only tested against its neighbors in
+        that order, in O(n log n) exact comparisons.
+        """
+        x1, y1, x2, y2 = (a.tolist() for a in segment_endpoints(xs, ys))
+        num_segments = len(x1)
+
+        # at equal x, left endpoints come before right endpoints
+        events = np.lexsort((
+            np.concatenate((y1, y2)),
+            np.repeat([0, 1], num_segments),
+            np.concatenate((x1, x2))
+        )).tolist()
+
+        # segment s crosses the vertical line at x at the height
+        # (y1[s] * dens[s] + nums[s] * (x - x1[s])) / dens[s], where
+        # vertical segments are taken at their lower endpoint
+        dens = [(b - a) or 1 for a, b in zip(x1, x2, strict=True)]
+        nums = [
+            (d - c) if a != b else 0
+            for a, b, c, d in zip(x1, x2, y1, y2, strict=True)
+        ]
+
+        def below(a, b):
+            # compare where both segments cross the sweep line; ties
+            # (segments meeting there) are broken by index, so that the
+            # order is strict and total
+            x = x1[a] if x1[a] > x1[b] else x1[b]
+            ya = (y1[a] * dens[a] + nums[a] * (x - x1[a])) * dens[b]
+            yb = (y1[b] * dens[b] + nums[b] * (x - x1[b])) * dens[a]
+            return ya < yb or (ya == yb and a < b)
+
+        def intersect(a, b):
+            return a is not None and b is not None and segments_intersect(
+                x1[a], y1[a], x2[a], y2[a], x1[b], y1[b], x2[b], y2[b]
+            )
 
-        if not points:
-            return []
-        
-        # choose leftmost point (tiebreak with lower y)
-        leftmost_point = (float('inf'), float('inf'))
-        for x, y in points:
-            if x > leftmost_point[0]:
-                continue
-            if x == leftmost_point[0] and y > leftmost_point[1]:
-                continue
-            leftmost_point = (x, y)
-
-        i_left = next((
-            i for i, p in enumerate(points)
-            if p == leftmost_point 
-        ))
-
-        # iteratively choose p_i+1 such that all 
-        # points are to the right of p_ip_i+1
-        def compute_score(p0, p1, p2):
-            if p0 is None:
-                v0 = (0, -1) if p1[0] < 0 else (0, 1)
+        status = SweepLineStatus(below)
+        for event in events:
+            if event < num_segments:
+                prev, next_ = status.insert(event)
+                if intersect(prev, event) or intersect(event, next_):
+                    return 1
             else:
-                v0 = (p1[0] - p0[0], p1[1] - p0[1])
-            v = (p2[0] - p1[0], p2[1] - p1[1])
-            mag_v0_sq = sum(x**2 for x in v0)
-            mag_v_sq = sum(x**2 for x in v)
-            if mag_v0_sq == 0 or mag_v_sq == 0:
-                # skip degenerate cases
-                return -float('inf'), 0
-            dotprod = sum(x*y for x, y in zip(v0, v))
-            cos_theta = dotprod / ((mag_v0_sq * mag_v_sq) ** 0.5)
-            # Return (cos_theta, mag_v_sq) to use distance
-            # from the origin as a tiebreaker for collinear points
-            # when choosing next point to add to convex hull
-            return cos_theta, mag_v_sq
-
-        convex_hull = [i_left]
-
-        prev, curr = None, leftmost_point
-        while len(convex_hull) < len(points):
-            # completed convex hull
-            if curr == leftmost_point and prev is not None:
-                convex_hull.pop()
-                break
-            i_selected = max(
-                range(len(points)),
-                key=lambda i: compute_score(prev, curr, points[i])
-            )
-            convex_hull.append(i_selected)
-            prev = curr
-            curr = points[i_selected]
-             
-        selected = [0 for _ in range(len(points))]
-        for i in convex_hull:
-            selected[i] = 1
+                prev, next_ = status.remove(event - num_segments)
+                if intersect(prev, next_):
+                    return 1
+        return 0
+
+
+    @staticmethod
+    def closest_pair(xs, ys, **_):
+        """
+        Returns the smallest squared distance between two of the
+        points p = list(zip(xs, ys)), which is 0 if a point is
+        repeated. If there are fewer than two points, returns -1.
 
-        return selected
+        Divide and conquer over the points presorted by x, with
+        exact integer squared distances, in O(n log n).
+        """
+        xs, ys = point_arrays(xs, ys)
+        distance = closest_pair_distance(xs, ys)
+        return -1 if distance is None else distance
+
+
+    @staticmethod
+    def graham_scan(xs, ys, **_):
+        """
+        Returns 1 for each point that is a vertex of the convex
+        hull of p = list(zip(xs, ys)), otherwise 0. Points on a
+        hull edge are not vertices, and of several copies of a
+        vertex only the first is selected.
+
+        Sorts the points once and scans them with Andrew's
+        monotone chain variant of Graham's scan, using exact
+        cross products instead of polar angles.
+        """
+        xs, ys = point_arrays(xs, ys)
+        return hull_mask(len(xs), monotone_chain(xs, ys))
+
+
+    @staticmethod
+    def jarvis_march(xs, ys, **_):
+        """
+        Same selection as graham_scan, found by gift wrapping
+        from the leftmost point, with each wrapping step comparing
+        cross products against all points at once.
+        """
+        xs, ys = point_arrays(xs, ys)
+        return hull_mask(len(xs), gift_wrapping(xs, ys))
 
 
     @staticmethod
@@ -142,53 +124,60 @@ class GeometrySolver:
         Neither segment s_0 nor s_1 should have identical
         endpoints
         
-        Returns 1 if segments share a single point, otherwise
-        0.
+        Returns 1 if segments share a point, otherwise 0.
         """
-        def does_point_lie_on_segment(p, seg):
-            # sort endpoints left to right
-            p_0, p_1 = tuple(sorted(seg, key=lambda x: x[0]))
-
-            if not(p_0[0] <= p[0] <= p_1[0]):
-                # point doesnt lie between segment endpoints
-                # so cannot lie on segment
-                return False
-
-            # check equality of slope between p_0, p and
-            # between p, p_1; also handles extreme case of 
-            # p == p_0, since expression reduces to:
-            # 0 * x == 0 * y -> True
-            return (
-                (p[1] - p_0[1]) * (p_1[0] - p_0[0]) == (p_1[1] - p_0[1]) * (p[0] - p_0[0])
-            )
+        (ax, bx, cx, dx), (ay, by, cy, dy) = xs, ys
+        return 1 if segments_intersect(ax, ay, bx, by, cx, cy, dx, dy) else 0
 
-        # handle special case where endpoint of a segment
-        # touches the other segment
-        ps = list(zip(xs, ys))
-        if any(
-            # bit-twiddling below used to concisely map
-            # i in {0, 1} => 2 and i in {2, 3} => 0,
-            # i.e. the start index of the segment
-            # that point (xs[i], ys[i]) is not in
-            does_point_lie_on_segment(p, (ps[x:=(i&(~1)^(2))], ps[x+1]))
-            for i, p in enumerate(zip(xs, ys))
-        ):
-            return 1
-
-        # handle general case of segment intersection below
-        # the following algorithm is adopted from:
-        # https://github.com/vlecomte/cp-geo
-        a, b, c, d = list(zip(xs, ys))
-
-        def cross(x, y):
-            return x[0] * y[1] - x[1] * y[0]
-
-        def orient(x, y, z):
-            return cross((y[0] - x[0], y[1] - x[1]), (z[0] - y[0], z[1] - y[1]))
-        
-        oa = orient(c, d, a)
-        ob = orient(c, d, b)
-        oc = orient(a, b, c)
-        od = orient(a, b, d)
 
-        return 1 if (oa * ob < 0) and (oc * od < 0) else 0
+    @staticmethod
+    def segment_intersections(xs, ys, chunk_size=1 << 22, **_):
+        """
+        Define line segment s_i by endpoints p[2i], p[2i+1],
+        where p = list(zip(xs, ys)).
+
+        Returns the pairs [i, j] with i < j of segments that share
+        a point, in lexicographic order.
+
+        Sweeps the segments in order of their left x (or bottom y,
+        whichever gives fewer candidates), testing each one only
+        against the segments that start before it ends and overlap
+        it on the other axis. The tests are vectorized over chunks of
+        chunk_size candidate pairs, so the work is O(n log n + m) for
+        the m pairs of segments that overlap along the sweep.
+        """
+        x1, y1, x2, y2 = segment_endpoints(xs, ys)
+        num_segments = len(x1)
+        boxes = [(x1, x2), (np.minimum(y1, y2), np.maximum(y1, y2))]
+
+        # segment i (in sweep order) overlaps the segments i+1, ...,
+        # i+counts[i] along the sweep axis
+        sweeps = []
+        for (starts, ends), other in zip(boxes, boxes[::-1], strict=True):
+            order = np.argsort(starts, kind="stable")
+            counts = np.searchsorted(starts[order], ends[order], side="right") - np.arange(num_segments) - 1
+            sweeps.append((counts.sum(), order, counts, other))
+        _, order, counts, (lows, highs) = min(sweeps, key=lambda sweep: sweep[0])
+        x1, y1, x2, y2, lows, highs = (a[order] for a in (x1, y1, x2, y2, lows, highs))
+        cumulative = np.cumsum(counts)
+
+        pairs = []
+        start = 0
+        while start < num_segments:
+            stop = max(int(np.searchsorted(cumulative, cumulative[start] - counts[start] + chunk_size, side="right")), start + 1)
+            chunk_counts = counts[start:stop]
+            i = np.repeat(np.arange(start, stop), chunk_counts)
+            j = i + 1 + np.arange(len(i)) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+
+            candidates = (lows[i] <= highs[j]) & (lows[j] <= highs[i])
+            i, j = i[candidates], j[candidates]
+            hits = segment_pairs_intersect(x1[i], y1[i], x2[i], y2[i], x1[j], y1[j], x2[j], y2[j])
+            pairs.append((order[i[hits]], order[j[hits]]))
+            start = stop
+
+        if not pairs:
+            return []
+        us, vs = np.concatenate([u for u, _ in pairs]), np.concatenate([v for _, v in pairs])
+        us, vs = np.minimum(us, vs), np.maximum(us, vs)
+        sorted_pairs = np.lexsort((vs, us))
+        return np.stack((us[sorted_pairs], vs[sorted_pairs]), axis=1).tolist()
@@ -1,5 +1,73 @@
-from queue import Queue, LifoQueue
+from collections import deque
 import heapq
+from numbers import Integral
+
+import numpy as np
+
+from ..utils import (
+    CSRGraph,
+    DisjointSet,
+    bellman_ford_grouped_distances,
+    distances_to_list,
+    edge_list_to_arrays,
+    group_edges_by_target,
+    low_link_dfs,
+)
+
+class PreparedGraph:
+    """
+    Graph prepared once to answer many queries (e.g. from
+    different src vertices). Its adjacency lists, edge arrays,
+    edges grouped by target, CSR form, in-degrees and topological
+    order are computed on first use and cached. Can be passed as
+    the edge_list of any GraphsSolver method.
+    """
+    def __init__(self, edge_list, num_vertices):
+        self.edge_list = edge_list
+        self.num_vertices = num_vertices
+        self._adjacency = {}
+        self._edge_arrays = None
+        self._edges_by_target = None
+        self._csr = None
+        self._in_degrees = None
+        self._topo_order = None
+
+
+    def adjacency(self, keep_weights=True):
+        if keep_weights not in self._adjacency:
+            self._adjacency[keep_weights] = GraphsSolver._construct_graph_from_input(self.edge_list, self.num_vertices, keep_weights)
+        return self._adjacency[keep_weights]
+
+
+    def edge_arrays(self):
+        if self._edge_arrays is None:
+            self._edge_arrays = GraphsSolver._edge_arrays_from_input(self.edge_list)
+        return self._edge_arrays
+
+
+    def edges_by_target(self):
+        if self._edges_by_target is None:
+            self._edges_by_target = group_edges_by_target(*self.edge_arrays())
+        return self._edges_by_target
+
+
+    def csr(self):
+        if self._csr is None:
+            self._csr = CSRGraph.from_edge_list(self.edge_list, self.num_vertices)
+        return self._csr
+
+
+    def in_degrees(self):
+        if self._in_degrees is None:
+            self._in_degrees = GraphsSolver._compute_in_degrees(self.adjacency(), self.num_vertices)
+        return self._in_degrees
+
+
+    def topological_order(self):
+        if self._topo_order is None:
+            self._topo_order = GraphsSolver._compute_topological_ordering(self.adjacency(), self.num_vertices, self.in_degrees())
+        return self._topo_order
+
 
 class GraphsSolver:
     @staticmethod
@@ -8,13 +76,18 @@ class GraphsSolver:
         Vertices are list(range(num_vertices)).
         Edge list is a list of tuples of the form:
         (u, v, w), which denotes an edge from u
-        to v with weight w.
+        to v with weight w, or a CSRGraph or PreparedGraph.
         
         Returns an adjacency list matching the graph,
         where u -> (v, w) indicates edge (u, v) with
         weight w. If keep_weights is False, mapping is
         just u -> v.
         """
+        if isinstance(edge_list, PreparedGraph):
+            return edge_list.adjacency(keep_weights)
+        if isinstance(edge_list, CSRGraph):
+            return edge_list.adjacency_lists(keep_weights)
+
         graph = [[] for _ in range(num_vertices)]
         for u, v, w in edge_list:  
             graph[u].append(((v, w) if keep_weights else v))
@@ -22,35 +95,83 @@ class GraphsSolver:
         return graph
 
 
+    @staticmethod
+    def _edge_arrays_from_input(edge_list):
+        # (sources, targets, weights) arrays of a list, CSRGraph or PreparedGraph edge list
+        if isinstance(edge_list, (CSRGraph, PreparedGraph)):
+            return edge_list.edge_arrays()
+        return edge_list_to_arrays(edge_list)
+
 
     @staticmethod
-    def _compute_topological_ordering(edge_list, num_vertices):
+    def _edges_by_target_from_input(edge_list):
+        # edges grouped by target for bellman_ford_grouped_distances
+        if isinstance(edge_list, PreparedGraph):
+            return edge_list.edges_by_target()
+        return group_edges_by_target(*GraphsSolver._edge_arrays_from_input(edge_list))
+
+
+    @staticmethod
+    def _csr_from_input(edge_list, num_vertices):
+        if isinstance(edge_list, PreparedGraph):
+            return edge_list.csr()
+        return CSRGraph.from_edge_list(edge_list, num_vertices)
+
+
+    @staticmethod
+    def _topological_ordering_from_input(edge_list, graph, num_vertices):
+        # graph is the adjacency list of edge_list with weights
+        if isinstance(edge_list, PreparedGraph):
+            return edge_list.topological_order()
+        return GraphsSolver._compute_topological_ordering(graph, num_vertices)
+
+
+    @staticmethod
+    def _known_topological_ordering(edge_list):
         """
-        Returns topological ordering if one exists, otherwise
-        returns -1.
+        Returns the topological ordering the input already carries
+        (cached by a PreparedGraph or given by the generator of a
+        CSRGraph), or None if it has to be computed.
         """
-        graph = GraphsSolver._construct_graph_from_input(edge_list, num_vertices, keep_weights=False)
+        if isinstance(edge_list, PreparedGraph):
+            known_order = GraphsSolver._known_topological_ordering(edge_list.edge_list)
+            return known_order if known_order is not None else edge_list.topological_order()
+        if isinstance(edge_list, CSRGraph):
+            return edge_list.topo_order
+        return None
 
+
+    @staticmethod
+    def _compute_in_degrees(graph, num_vertices):
         indegrees = [0] * num_vertices
-        for u, v, _ in edge_list:
-            indegrees[v] += 1
+        for edges in graph:
+            for v, _ in edges:
+                indegrees[v] += 1
+        return indegrees
 
-        visited = [False] * num_vertices
-        topo_order = [v for v in range(num_vertices) if indegrees[v] == 0]
 
-        queue = Queue(maxsize=0)
-        for v in topo_order:
-            queue.put(v)
-            visited[v] = True
+    @staticmethod
+    def _compute_topological_ordering(graph, num_vertices, indegrees=None):
+        """
+        Graph is an adjacency list with weights, as
+        returned by _construct_graph_from_input.
+        Returns topological ordering if one exists, otherwise
+        returns -1.
+        """
+        if indegrees is None:
+            indegrees = GraphsSolver._compute_in_degrees(graph, num_vertices)
+        # counted down below, so work on a copy
+        indegrees = list(indegrees)
 
-        while not queue.empty():
-            u = queue.get()
-            for v in graph[u]:
+        topo_order = [v for v in range(num_vertices) if indegrees[v] == 0]
+
+        # vertices leave the queue in the order they are appended
+        # to topo_order, so topo_order itself serves as the queue
+        for u in topo_order:
+            for v, _ in graph[u]:
                 indegrees[v] -= 1
                 if indegrees[v] == 0:
                     topo_order.append(v)
-                    queue.put(v)
-                    visited[v] = True
 
         if any(indegrees):
             # topological ordering doesnt exist
@@ -59,9 +180,75 @@ class GraphsSolver:
         return topo_order
 
 
+    @staticmethod
+    def _dial(graph, num_vertices, src):
+        """
+        Dijkstra with a circular array of max_weight + 1 buckets,
+        where bucket i % (max_weight + 1) holds the vertices with
+        tentative distance i. Runs in O(E + V * max_weight).
+        """
+        weights = [w for edges in graph for _, w in edges]
+        if not all(isinstance(w, Integral) and w >= 0 for w in weights):
+            raise ValueError("Bucket queue requires non-negative integer weights")
+        num_buckets = max(weights, default=0) + 1
+
+        d = [float('inf')] * num_vertices
+        d[src] = 0
+
+        buckets = [[] for _ in range(num_buckets)]
+        buckets[0].append(src)
+        num_queued = 1
+
+        dist = 0
+        while num_queued:
+            # zero weight edges may add to the bucket being emptied
+            bucket = buckets[dist % num_buckets]
+            while bucket:
+                u = bucket.pop()
+                num_queued -= 1
+                if d[u] != dist:
+                    # stale entry, u was settled at a smaller distance
+                    continue
+                for v, w in graph[u]:
+                    if dist + w < d[v]:
+                        d[v] = dist + w
+                        buckets[d[v] % num_buckets].append(v)
+                        num_queued += 1
+            dist += 1
+
+        return d
+
+
+    @staticmethod
+    def _undirected_low_links(edge_list, num_vertices):
+        graph = GraphsSolver._csr_from_input(edge_list, num_vertices)
+        disc, low, parents, _ = low_link_dfs(graph, skip_parent_edge=True)
+        return (
+            np.array(disc, dtype=np.int64),
+            np.array(low, dtype=np.int64),
+            np.array(parents, dtype=np.int64)
+        )
+
+
     @staticmethod
     def articulation_points(edge_list, num_vertices, **_):
-        raise NotImplementedError("omitting this algorithm for now...")
+        """
+        Input graph should be undirected, i.e. contain
+        both (u, v, w) and (v, u, w). Returns list is_cut,
+        where is_cut[v] = 1 if removing v disconnects its
+        connected component, otherwise 0.
+        """
+        disc, low, parents = GraphsSolver._undirected_low_links(edge_list, num_vertices)
+        is_root = parents == -1
+        children = np.flatnonzero(~is_root)
+
+        # a non-root vertex u is an articulation point if the subtree
+        # of some child v cannot reach above u; a root is one if it
+        # has more than one child
+        is_cut = np.zeros(num_vertices, dtype=bool)
+        is_cut[parents[children[low[children] >= disc[parents[children]]]]] = True
+        is_cut[is_root] = np.bincount(parents[children], minlength=num_vertices)[is_root] > 1
+        return is_cut.astype(int).tolist()
 
 
     @staticmethod
@@ -78,20 +265,14 @@ class GraphsSolver:
         avoid issues with encoding infinite
         distances
         """
-        d = [float('inf')] * num_vertices
-        d[src] = 0
+        grouped_edges = GraphsSolver._edges_by_target_from_input(edge_list)
+        d = bellman_ford_grouped_distances(grouped_edges, num_vertices, src)
+        if d is None:
+            # negative cycle detected
+            return -1
 
-        # num_vertices-1 rounds of edge relaxation
-        for _ in range(1, num_vertices):
-            for u, v, w in edge_list:
-                d[v] = min(d[u] + w, d[v])
-
-        for u, v, w in edge_list:
-            if d[v] > d[u] + w:
-                # negative cycle detected
-                return -1
-        
-        return d
+        weights = grouped_edges[1]
+        return distances_to_list(d, integral=weights.dtype.kind in "iu")
 
 
     @staticmethod
@@ -102,31 +283,43 @@ class GraphsSolver:
         """
         graph = GraphsSolver._construct_graph_from_input(edge_list, num_vertices, keep_weights=False)
 
-        visited = [False] * num_vertices
+        # parents[v] == -1 marks v as not yet visited
         parents = [-1] * num_vertices
-
-        visited[src] = True
         parents[src] = src
         
         # initialize queue with sorce
-        queue = Queue(maxsize=0)
-        queue.put(src)
+        queue = deque([src])
 
-        while not queue.empty():
-            u = queue.get()
+        while queue:
+            u = queue.popleft()
             for v in graph[u]:
-                if visited[v]:
+                if parents[v] != -1:
                     continue
                 parents[v] = u
-                visited[v] = True
-                queue.put(v)
+                queue.append(v)
         
         return parents
 
 
     @staticmethod
-    def bridges(edges, num_vertices, **_):
-        raise NotImplementedError("omitting this algorithm for now...")
+    def bridges(edge_list, num_vertices, **_):
+        """
+        Input graph should be undirected, i.e. contain
+        both (u, v, w) and (v, u, w). Returns list is_bridge,
+        where is_bridge[i] = 1 if removing edge i (in both
+        directions) disconnects its connected component,
+        otherwise 0.
+        """
+        disc, low, parents = GraphsSolver._undirected_low_links(edge_list, num_vertices)
+        sources, targets, _ = GraphsSolver._edge_arrays_from_input(edge_list)
+
+        # tree edge (parent, v) is a bridge if the subtree of v
+        # cannot reach the parent or above without it
+        is_bridge = (
+            ((parents[targets] == sources) & (low[targets] > disc[sources]))
+            | ((parents[sources] == targets) & (low[sources] > disc[targets]))
+        )
+        return is_bridge.astype(int).tolist()
 
 
     @staticmethod
@@ -135,24 +328,43 @@ class GraphsSolver:
         Input graph must be a directed, acyclic graph (dag).
         For dataset generation, src must be able to reach all other
         vertices in graph to avoid infinite distances in output.
+
+        A topological order carried by the input (a CSRGraph from
+        GraphsGenerator(as_csr=True), or one cached by a PreparedGraph)
+        is used as is; otherwise one is found with Kahn's algorithm
+        while relaxing the edges.
         """
         graph = GraphsSolver._construct_graph_from_input(edge_list, num_vertices)
-        topo_order = GraphsSolver._compute_topological_ordering(edge_list, num_vertices)
-
-        if topo_order == -1:
-            raise ValueError("Input graph is not a directed, acyclic graph (dag)")
 
         d = [float('inf')] * num_vertices
         d[src] = 0
 
-        # move pointer to src index in topo_order
-        start = next((i for i in range(len(topo_order)) if topo_order[i] == src))
-        
-        for i in range(start, num_vertices): 
-            u = topo_order[i]
-            for v, w in graph[u]:
-                # relax edge (u, v)
-                d[v] = min(d[u] + w, d[v])
+        topo_order = GraphsSolver._known_topological_ordering(edge_list)
+        if topo_order is None:
+            # Kahn's algorithm, relaxing the out-edges of each vertex
+            # as it leaves the queue, so that the order and the
+            # distances are found in the same pass
+            indegrees = GraphsSolver._compute_in_degrees(graph, num_vertices)
+            topo_order = [v for v in range(num_vertices) if indegrees[v] == 0]
+            for u in topo_order:
+                du = d[u]
+                for v, w in graph[u]:
+                    # relax edge (u, v)
+                    if du + w < d[v]:
+                        d[v] = du + w
+                    indegrees[v] -= 1
+                    if indegrees[v] == 0:
+                        topo_order.append(v)
+        elif topo_order != -1:
+            for u in topo_order:
+                du = d[u]
+                for v, w in graph[u]:
+                    # relax edge (u, v)
+                    if du + w < d[v]:
+                        d[v] = du + w
+
+        if topo_order == -1 or len(topo_order) < num_vertices:
+            raise ValueError("Input graph is not a directed, acyclic graph (dag)")
 
         return d
 
@@ -165,74 +377,209 @@ class GraphsSolver:
         """
         graph = GraphsSolver._construct_graph_from_input(edge_list, num_vertices, keep_weights=False)
 
-        visited = [False] * num_vertices
+        # parents[v] == -1 marks v as not yet visited
         parents = [-1] * num_vertices
-
-        visited[src] = True
         parents[src] = src
         
-        # initialize stack with src
-        stack = LifoQueue(maxsize=0)
-        stack.put(src)
+        # initialize stack with src; vertices are marked when
+        # pushed, so each vertex is pushed at most once
+        stack = [src]
 
-        while not stack.empty():
-            u = stack.get()
+        while stack:
+            u = stack.pop()
             for v in graph[u]:
-                if visited[v]:
+                if parents[v] != -1:
                     continue
                 parents[v] = u
-                visited[v] = True
-                stack.put(v)
+                stack.append(v)
         
         return parents
 
 
     @staticmethod
-    def dijkstra(edge_list, num_vertices, src, **_):
+    def dijkstra(edge_list, num_vertices, src, bucket_queue=False, **_):
         """
         Prefer graphs where src can reach all other
         vertices to avoid issues with encoding infinite
-        distances
+        distances.
+
+        If bucket_queue is True, weights must be non-negative
+        integers and the vertices are settled with a bucket
+        queue (Dial's algorithm) instead of a binary heap.
         """
         graph = GraphsSolver._construct_graph_from_input(edge_list, num_vertices)
+        if bucket_queue:
+            return GraphsSolver._dial(graph, num_vertices, src)
 
         d = [float('inf')] * num_vertices
         d[src] = 0
 
-        # put w in front so that it is used for ordering
-        # in heap, i.e. lowest edge weight is at top of heap 
-        edges = [(w, (src, v)) for v, w in graph[src]]
-        heapq.heapify(edges)        
-        while edges:
-            w, (u, v) = heapq.heappop(edges)
-            d[v] = min(d[u] + w, d[v])
-            for child, w in graph[v]:
-                if d[child] != float('inf'):
-                    # already found shortest path to child
-                    continue
-                heapq.heappush(edges, (w, (v, child)))
+        # heap of (tentative distance, vertex); entries whose
+        # distance has since decreased are stale and skipped
+        heap = [(0, src)]
+        while heap:
+            du, u = heapq.heappop(heap)
+            if du > d[u]:
+                continue
+            for v, w in graph[u]:
+                if du + w < d[v]:
+                    d[v] = du + w
+                    heapq.heappush(heap, (d[v], v))
         
         return d
 
 
     @staticmethod
     def floyd_warshall(edge_list, num_vertices, **_):
-        raise NotImplementedError("omitting this algorithm for now...")
+        """
+        Compute shortest path distances between all pairs
+        of vertices. Output is matrix d, where d[u][v] = min
+        path distance from u to v (float('inf') if v is not
+        reachable from u).
+        If there is a negative cycle, return -1. Otherwise,
+        return d.
+
+        Each iteration k relaxes all pairs at once through
+        vertex k with a numpy broadcast. Integer weights are
+        stored as int32 (int64 for large graphs) with a finite
+        sentinel for infinity: sums involving the sentinel stay
+        above half of it, since no finite distance comes close.
+        """
+        sources, targets, weights = GraphsSolver._edge_arrays_from_input(edge_list)
+
+        if weights.dtype.kind == "f":
+            dtype, inf = np.float64, np.inf
+        else:
+            max_abs_weight = int(np.abs(weights).max(initial=0))
+            dtype = np.int32 if num_vertices * max_abs_weight < 1 << 28 else np.int64
+            inf = np.iinfo(dtype).max // 2
+
+        d = np.full((num_vertices, num_vertices), inf, dtype=dtype)
+        np.fill_diagonal(d, 0)
+        # keep the lightest of parallel edges
+        np.minimum.at(d, (sources, targets), weights.astype(dtype))
+
+        for k in range(num_vertices):
+            np.minimum(d, d[:, k, None] + d[None, k, :], out=d)
+            if (np.diagonal(d) < 0).any():
+                # negative cycle detected; stop before distances
+                # around it can grow without bound
+                return -1
+
+        if dtype == np.float64:
+            return d.tolist()
+        half_inf = inf // 2
+        return [
+            [x if x < half_inf else float('inf') for x in row]
+            for row in d.tolist()
+        ]
 
 
     @staticmethod
     def mst_kruskal(edge_list, num_vertices, **_):
-        raise NotImplementedError("omitting this algorithm for now...")
+        """
+        Input graph should be undirected, i.e. contain
+        both (u, v, w) and (v, u, w). Returns the total
+        weight of a minimum spanning tree (of a minimum
+        spanning forest if the graph is not connected).
+        """
+        sources, targets, weights = GraphsSolver._edge_arrays_from_input(edge_list)
+        order = np.argsort(weights, kind="stable")
+
+        components = DisjointSet(num_vertices)
+        total_weight = 0
+        num_tree_edges = 0
+        edges = zip(
+            sources[order].tolist(),
+            targets[order].tolist(),
+            weights[order].tolist(),
+            strict=True,
+        )
+        for u, v, w in edges:
+            if num_tree_edges == num_vertices - 1:
+                # spanning tree is complete
+                break
+            if components.union(u, v):
+                total_weight += w
+                num_tree_edges += 1
+
+        return total_weight
 
 
     @staticmethod
     def mst_prim(edge_list, num_vertices, **_):
-        raise NotImplementedError("omitting this algorithm for now...")
+        """
+        Input graph should be undirected, i.e. contain
+        both (u, v, w) and (v, u, w). Returns the total
+        weight of a minimum spanning tree (of a minimum
+        spanning forest if the graph is not connected).
+        """
+        # scan each vertex's slice of the flat CSR arrays instead of
+        # building per-vertex lists of (v, w) tuples
+        graph = GraphsSolver._csr_from_input(edge_list, num_vertices)
+        offsets = graph.offsets.tolist()
+        targets = graph.targets.tolist()
+        weights = graph.weights.tolist()
+
+        in_tree = [False] * num_vertices
+        # lightest known edge from the tree to each vertex
+        key = [float('inf')] * num_vertices
+        total_weight = 0
+        for root in range(num_vertices):
+            if in_tree[root]:
+                continue
+
+            # heap of (edge weight, vertex) for edges leaving the tree;
+            # entries of vertices that joined the tree are skipped
+            heap = [(0, root)]
+            while heap:
+                w, u = heapq.heappop(heap)
+                if in_tree[u]:
+                    continue
+                in_tree[u] = True
+                total_weight += w
+                for i in range(offsets[u], offsets[u + 1]):
+                    v, w = targets[i], weights[i]
+                    if w < key[v] and not in_tree[v]:
+                        key[v] = w
+                        heapq.heappush(heap, (w, v))
+
+        return total_weight
+
+
+    @staticmethod
+    def prepare(edge_list, num_vertices):
+        if isinstance(edge_list, PreparedGraph):
+            return edge_list
+        return PreparedGraph(edge_list, num_vertices)
 
 
     @staticmethod
     def scc(edge_list, num_vertices, **_):
-        raise NotImplementedError("omitting this algorithm for now...")
+        """
+        Returns list labels, where labels[v] is the smallest
+        vertex in the strongly connected component of v.
+        """
+        graph = GraphsSolver._csr_from_input(edge_list, num_vertices)
+        components = np.array(low_link_dfs(graph)[3], dtype=np.int64)
+
+        smallest_vertex = np.full(num_vertices, num_vertices)
+        np.minimum.at(smallest_vertex, components, np.arange(num_vertices))
+        return smallest_vertex[components].tolist()
+
+
+    @staticmethod
+    def solve_queries(solver, edge_list, num_vertices, srcs, **kwargs):
+        """
+        Runs solver (one of the GraphsSolver methods taking a src)
+        from every vertex in srcs on a graph prepared once, and
+        returns the list of answers.
+        """
+        graph = GraphsSolver.prepare(edge_list, num_vertices)
+        return [
+            solver(edge_list=graph, num_vertices=num_vertices, src=src, **kwargs)
+            for src in srcs
+        ]
 
 
     @staticmethod
@@ -241,4 +588,5 @@ class GraphsSolver:
         Returns a topological ordering of vertices if one exists, otherwise
         returns -1.
         """
-        return GraphsSolver._compute_topological_ordering(edge_list, num_vertices)
+        graph = GraphsSolver._construct_graph_from_input(edge_list, num_vertices)
+        return GraphsSolver._topological_ordering_from_input(edge_list, graph, num_vertices)
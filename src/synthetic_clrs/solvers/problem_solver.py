@@ -1,5 +1,6 @@
 from types import MappingProxyType
 from ..algorithms import Algorithm 
+from ..utils.batch_utils import batch_to_problems
 from .divide_conquer_solver import DivideConquerSolver
 from .dynamic_programming_solver import DynamicProgrammingSolver
 from .geometry_solver import GeometrySolver
@@ -20,16 +21,25 @@ class ProblemSolver:
         Algorithm.OPTIMAL_BST: DynamicProgrammingSolver.optimal_bst,
 
         # geometry
+        Algorithm.ANY_SEGMENTS_INTERSECT: GeometrySolver.any_segments_intersect,
+        Algorithm.CLOSEST_PAIR: GeometrySolver.closest_pair,
         Algorithm.GRAHAM_SCAN: GeometrySolver.graham_scan,
         Algorithm.JARVIS_MARCH: GeometrySolver.jarvis_march,
         Algorithm.SEGMENT_INTERSECT: GeometrySolver.segment_intersect,
+        Algorithm.SEGMENT_INTERSECTIONS: GeometrySolver.segment_intersections,
 
         # graphs
+        Algorithm.ARTICULATION_POINTS: GraphsSolver.articulation_points,
         Algorithm.BELLMAN_FORD: GraphsSolver.bellman_ford,
         Algorithm.BFS: GraphsSolver.bfs,
+        Algorithm.BRIDGES: GraphsSolver.bridges,
         Algorithm.DAG_SHORTEST_PATH: GraphsSolver.dag_shortest_paths,
         Algorithm.DFS: GraphsSolver.dfs,
         Algorithm.DIJKSTRA: GraphsSolver.dijkstra,
+        Algorithm.FLOYD_WARSHALL: GraphsSolver.floyd_warshall,
+        Algorithm.MST_KRUSKAL: GraphsSolver.mst_kruskal,
+        Algorithm.MST_PRIM: GraphsSolver.mst_prim,
+        Algorithm.SCC: GraphsSolver.scc,
         Algorithm.TOPOLOGICAL_SORT: GraphsSolver.topological_sort,
         
         # greedy
@@ -51,8 +61,47 @@ class ProblemSolver:
         Algorithm.NAIVE_STRING_MATCHER: StringsSolver.naive_string_matcher,
     })
 
+    # vectorized solvers over columnar batches, see solve_batch
+    _BATCH_SOLVERS = MappingProxyType({
+        # divide and conquer
+        Algorithm.KADANE: DivideConquerSolver.kadane_batch,
+
+        # dynamic programming
+        Algorithm.LCS_LENGTH: DynamicProgrammingSolver.lcs_length_batch,
+
+        # search
+        Algorithm.BINARY_SEARCH: SearchSolver.binary_search_batch,
+        Algorithm.MINIMUM: SearchSolver.minimum_batch,
+
+        # sorting
+        Algorithm.BUBBLE_SORT: SortingSolver.sort_batch,
+        Algorithm.HEAPSORT: SortingSolver.sort_batch,
+        Algorithm.INSERTION_SORT: SortingSolver.sort_batch,
+        Algorithm.QUICKSORT: SortingSolver.sort_batch,
+    })
+
     @staticmethod
     def solve(algorithm, **kwargs):
         if algorithm not in ProblemSolver._SOLVERS:
             raise ValueError(f"Algorithm {algorithm} not supported! Valid algorithms: {ProblemSolver._SOLVERS.keys()}")
+        if "srcs" in kwargs:
+            # multi-query graph problem, one answer per src
+            return GraphsSolver.solve_queries(ProblemSolver._SOLVERS[algorithm], **kwargs)
         return ProblemSolver._SOLVERS[algorithm](**kwargs)
+
+    @staticmethod
+    def solve_batch(algorithm, batch):
+        """
+        Solve a columnar batch (as returned by generate_batch) and
+        return the list of answers, matching solve on each problem.
+        Algorithms without a vectorized solver are solved one
+        problem at a time.
+        """
+        if algorithm not in ProblemSolver._SOLVERS:
+            raise ValueError(f"Algorithm {algorithm} not supported! Valid algorithms: {ProblemSolver._SOLVERS.keys()}")
+        if algorithm in ProblemSolver._BATCH_SOLVERS:
+            return ProblemSolver._BATCH_SOLVERS[algorithm](**batch)
+        return [
+            ProblemSolver.solve(algorithm, **problem)
+            for problem in batch_to_problems(batch)
+        ]
@@ -1,3 +1,8 @@
+import numpy as np
+
+from ..utils.batch_utils import as_padded, max_value, pad_with
+
+
 class SearchSolver:
     @staticmethod
     def binary_search(array, target, **_):
@@ -15,12 +20,48 @@ class SearchSolver:
         return -1
         
 
+    @staticmethod
+    def binary_search_batch(array, target, **_):
+        """
+        Runs the same bisection as binary_search on every row at once,
+        so the returned index matches it exactly even with duplicates.
+        """
+        array = as_padded(array)
+        num_rows, max_length = array.values.shape
+        rows = np.arange(num_rows)
+
+        l, r = np.zeros(num_rows, dtype=np.int64), array.lengths.copy()
+        result = np.full(num_rows, -1)
+        active = l < r
+
+        while active.any():
+            mid = (l + r) // 2
+            mid_values = array.values[rows, np.minimum(mid, max(max_length - 1, 0))]
+            found = active & (mid_values == target)
+            result[found] = mid[found]
+            active &= ~found
+            lower = mid_values < target
+            l = np.where(active & lower, mid + 1, l)
+            r = np.where(active & ~lower, mid, r)
+            active &= l < r
+
+        return result.tolist()
+
+
     @staticmethod
     def minimum(array, **_):
         if not array:
             raise ValueError(f"Input {array} is empty!")
         return min(array)
 
+
+    @staticmethod
+    def minimum_batch(array, **_):
+        array = as_padded(array)
+        if not array.lengths.all():
+            raise ValueError("Input batch contains an empty array!")
+        return pad_with(array, max_value(array.values.dtype)).min(axis=1).tolist()
+
     
     @staticmethod
     def quickselect(array, **_):
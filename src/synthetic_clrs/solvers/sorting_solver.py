@@ -1,3 +1,8 @@
+import numpy as np
+
+from ..utils.batch_utils import PaddedArray, as_padded, max_value, pad_with
+
+
 class SortingSolver:
     """
     Use python built-in sorting function
@@ -21,3 +26,11 @@ class SortingSolver:
     @staticmethod
     def quicksort(array, **_):
         return list(sorted(array))
+
+
+    @staticmethod
+    def sort_batch(array, **_):
+        # sort every row at once, with padding pushed past the row's values
+        array = as_padded(array)
+        sorted_values = np.sort(pad_with(array, max_value(array.values.dtype)), axis=1)
+        return PaddedArray(sorted_values, array.lengths).tolist()
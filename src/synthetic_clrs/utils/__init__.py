@@ -1 +1,40 @@
 from .rng_utils import Rng
+from .batch_utils import (
+    PaddedArray,
+    RaggedArray,
+    batch_from_problems,
+    batch_size,
+    batch_to_problems,
+)
+from .io_utils import (
+    JsonlWriter,
+    ParquetShardWriter,
+    iter_jsonl,
+    iter_parquet_batches,
+    iter_parquet_records,
+    read_jsonl,
+    read_parquet,
+    read_parquet_shard,
+)
+from .graph_utils import (
+    CSRGraph,
+    DisjointSet,
+    bellman_ford_distances,
+    bellman_ford_grouped_distances,
+    connected_component_labels,
+    distances_to_list,
+    edge_list_to_arrays,
+    group_edges_by_target,
+    low_link_dfs,
+)
+from .geometry_utils import (
+    SweepLineStatus,
+    closest_pair_distance,
+    gift_wrapping,
+    hull_mask,
+    monotone_chain,
+    point_arrays,
+    segment_endpoints,
+    segment_pairs_intersect,
+    segments_intersect,
+)
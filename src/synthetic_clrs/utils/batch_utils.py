@@ -0,0 +1,142 @@
+import itertools
+
+import numpy as np
+
+
+class PaddedArray:
+    """
+    Batch of n variable-length rows stored as an (n, max_length)
+    array of values plus a vector of row lengths. Entries past
+    the length of a row are padding and hold pad_value.
+    """
+    def __init__(self, values, lengths, pad_value=0):
+        self.values = values
+        self.lengths = lengths
+        self.pad_value = pad_value
+
+
+    @classmethod
+    def from_lists(cls, rows, pad_value=0):
+        lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+        values = np.full((len(rows), lengths.max(initial=0)), pad_value)
+        for i, row in enumerate(rows):
+            values[i, :len(row)] = row
+        return cls(values, lengths, pad_value=pad_value)
+
+
+    def mask(self):
+        # True for entries that hold actual (non-padding) values
+        return np.arange(self.values.shape[1]) < self.lengths[:, None]
+
+
+    def row(self, i):
+        return self.values[i, :self.lengths[i]].tolist()
+
+
+    def tolist(self):
+        return [
+            row[:length]
+            for row, length in zip(
+                self.values.tolist(), self.lengths.tolist(), strict=True
+            )
+        ]
+
+
+    def __len__(self):
+        return len(self.lengths)
+
+
+class RaggedArray:
+    """
+    Batch of n variable-length rows stored as one flat array of
+    values plus n+1 offsets, where row i is
+    values[offsets[i]:offsets[i+1]]. Values may have trailing
+    dimensions, e.g. (num_edges, 3) for edge lists.
+    """
+    def __init__(self, values, offsets):
+        self.values = values
+        self.offsets = offsets
+
+
+    @classmethod
+    def from_lists(cls, rows):
+        lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        values = np.array(list(itertools.chain.from_iterable(rows)))
+        return cls(values, offsets)
+
+
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+
+
+    def to_padded(self, pad_value=0):
+        lengths = self.lengths
+        values = np.full((len(self), lengths.max(initial=0)) + self.values.shape[1:], pad_value, dtype=self.values.dtype)
+        padded = PaddedArray(values, lengths, pad_value=pad_value)
+        values[padded.mask()] = self.values
+        return padded
+
+
+    def row(self, i):
+        rows = self.values[self.offsets[i]:self.offsets[i + 1]].tolist()
+        return [tuple(r) for r in rows] if self.values.ndim > 1 else rows
+
+
+    def tolist(self):
+        return [self.row(i) for i in range(len(self))]
+
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+def as_padded(column):
+    return column.to_padded() if isinstance(column, RaggedArray) else column
+
+
+def pad_with(padded, fill_value):
+    # row values with padding entries replaced by fill_value
+    return np.where(padded.mask(), padded.values, fill_value)
+
+
+def max_value(dtype):
+    return np.inf if np.issubdtype(dtype, np.floating) else np.iinfo(dtype).max
+
+
+def batch_from_problems(problems):
+    """
+    Converts a list of problems (dicts as returned by generate_problem)
+    into a columnar batch: list fields become RaggedArrays, scalar
+    fields become numpy arrays and the task string is kept as is.
+    """
+    batch = {}
+    for key, value in problems[0].items():
+        column = [problem[key] for problem in problems]
+        if isinstance(value, str):
+            batch[key] = value
+        elif isinstance(value, (list, tuple)):
+            batch[key] = RaggedArray.from_lists(column)
+        else:
+            batch[key] = np.array(column)
+    return batch
+
+
+def batch_size(batch):
+    return next(len(column) for column in batch.values() if not isinstance(column, str))
+
+
+def batch_to_problems(batch):
+    """
+    Converts a columnar batch back into a list of problems in the
+    same format as generate_problem.
+    """
+    columns = {
+        key: [column] * batch_size(batch) if isinstance(column, str) else column.tolist()
+        for key, column in batch.items()
+    }
+    return [
+        dict(zip(columns.keys(), values, strict=True))
+        for values in zip(*columns.values(), strict=True)
+    ]
@@ -0,0 +1,332 @@
+import numpy as np
+
+
+def point_arrays(xs, ys):
+    """
+    Returns the coordinates as numpy arrays. Integer coordinates
+    are kept as int64, so that orientation tests on them are exact,
+    and any other coordinates become float64.
+    """
+    xs, ys = np.asarray(xs), np.asarray(ys)
+    dtype = np.int64 if xs.dtype.kind in "iu" and ys.dtype.kind in "iu" else np.float64
+    return xs.astype(dtype), ys.astype(dtype)
+
+
+def cross(ox, oy, ax, ay, bx, by):
+    # positive if o, a, b turn counterclockwise, negative if they
+    # turn clockwise and zero if they are collinear
+    return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+
+def segments_intersect(ax, ay, bx, by, cx, cy, dx, dy):
+    """
+    Whether the closed segments ab and cd share a point: neither
+    segment has both endpoints strictly on one side of the other's
+    line, and their bounding boxes overlap, which settles the case
+    of collinear segments.
+    """
+    d1 = cross(cx, cy, dx, dy, ax, ay)
+    d2 = cross(cx, cy, dx, dy, bx, by)
+    d3 = cross(ax, ay, bx, by, cx, cy)
+    d4 = cross(ax, ay, bx, by, dx, dy)
+    return (
+        (d1 <= 0 <= d2 or d2 <= 0 <= d1) and (d3 <= 0 <= d4 or d4 <= 0 <= d3)
+        and min(ax, bx) <= max(cx, dx) and min(cx, dx) <= max(ax, bx)
+        and min(ay, by) <= max(cy, dy) and min(cy, dy) <= max(ay, by)
+    )
+
+
+def segment_pairs_intersect(ax, ay, bx, by, cx, cy, dx, dy):
+    # segments_intersect over arrays of segment pairs
+    d1 = np.sign(cross(cx, cy, dx, dy, ax, ay))
+    d2 = np.sign(cross(cx, cy, dx, dy, bx, by))
+    d3 = np.sign(cross(ax, ay, bx, by, cx, cy))
+    d4 = np.sign(cross(ax, ay, bx, by, dx, dy))
+    return (
+        (d1 * d2 <= 0) & (d3 * d4 <= 0)
+        & (np.minimum(ax, bx) <= np.maximum(cx, dx)) & (np.minimum(cx, dx) <= np.maximum(ax, bx))
+        & (np.minimum(ay, by) <= np.maximum(cy, dy)) & (np.minimum(cy, dy) <= np.maximum(ay, by))
+    )
+
+
+def segment_endpoints(xs, ys):
+    """
+    Splits the points p = list(zip(xs, ys)) into the segments from
+    p[2i] to p[2i+1] and returns the arrays (x1, y1, x2, y2) of
+    their endpoints, ordered so that (x1, y1) <= (x2, y2).
+    """
+    xs, ys = point_arrays(xs, ys)
+    x1, y1, x2, y2 = xs[0::2], ys[0::2], xs[1::2], ys[1::2]
+    swap = (x1 > x2) | ((x1 == x2) & (y1 > y2))
+    return np.where(swap, x2, x1), np.where(swap, y2, y1), np.where(swap, x1, x2), np.where(swap, y1, y2)
+
+
+class SweepLineStatus:
+    """
+    The segments crossing a sweep line, ordered from bottom to
+    top by below(a, b). They are kept in sorted blocks of at most
+    block_size segments, like a B-tree of height two: finding a
+    position takes O(log n) comparisons and inserting or removing a
+    segment moves at most block_size entries, plus one entry per
+    block when a block is split or emptied.
+
+    below must be a strict total order on the segments present, so
+    that searching for a segment lands exactly on it.
+    """
+    def __init__(self, below, block_size=512):
+        self.below = below
+        self.block_size = block_size
+        self.blocks = []
+
+
+    def _lower_bound(self, s):
+        # (block, index) of the first segment that is not below s
+        blocks, below = self.blocks, self.below
+        lo, hi = 0, len(blocks)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if below(blocks[mid][-1], s):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(blocks):
+            return lo, 0
+
+        block = blocks[lo]
+        i, hi = 0, len(block) - 1
+        while i < hi:
+            mid = (i + hi) // 2
+            if below(block[mid], s):
+                i = mid + 1
+            else:
+                hi = mid
+        return lo, i
+
+
+    def _neighbors(self, b, i):
+        # the segments just before and at position (b, i)
+        blocks = self.blocks
+        if i > 0:
+            prev = blocks[b][i - 1]
+        else:
+            prev = blocks[b - 1][-1] if b > 0 else None
+        return prev, blocks[b][i] if b < len(blocks) else None
+
+
+    def insert(self, s):
+        """
+        Inserts segment s and returns the segments just below and
+        just above it (None where there is none).
+        """
+        b, i = self._lower_bound(s)
+        neighbors = self._neighbors(b, i)
+        if b == len(self.blocks):
+            if not self.blocks:
+                self.blocks.append([])
+            b = len(self.blocks) - 1
+            i = len(self.blocks[b])
+
+        block = self.blocks[b]
+        block.insert(i, s)
+        if len(block) > self.block_size:
+            half = len(block) // 2
+            self.blocks[b:b + 1] = [block[:half], block[half:]]
+        return neighbors
+
+
+    def remove(self, s):
+        """
+        Removes segment s and returns the segments that were just
+        below and just above it (None where there was none).
+        """
+        b, i = self._lower_bound(s)
+        assert b < len(self.blocks) and self.blocks[b][i] == s, "segment not found"
+
+        prev, _ = self._neighbors(b, i)
+        block = self.blocks[b]
+        if i + 1 < len(block):
+            next_ = block[i + 1]
+        else:
+            next_ = self.blocks[b + 1][0] if b + 1 < len(self.blocks) else None
+
+        del block[i]
+        if not block:
+            del self.blocks[b]
+        return prev, next_
+
+
+def distinct_points_order(xs, ys):
+    """
+    Returns the indices of the distinct points sorted by x, then
+    by y, keeping the lowest index among copies of a point.
+    """
+    order = np.lexsort((ys, xs))
+    if len(order) == 0:
+        return order
+    xs, ys = xs[order], ys[order]
+    first = np.r_[True, (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])]
+    return order[first]
+
+
+def convex_hull_candidates(xs, ys):
+    """
+    Returns the indices of the points that may be convex hull
+    vertices, sorted as in distinct_points_order. Points strictly
+    inside the polygon of the extreme points in eight directions
+    cannot be (Akl-Toussaint), and on random inputs they are most
+    of the points.
+    """
+    order = distinct_points_order(xs, ys)
+    if len(order) <= 3:
+        return order
+    xs, ys = xs[order], ys[order]
+
+    # extreme points in counterclockwise order of their directions
+    corners = [
+        np.argmin(xs), np.argmin(xs + ys), np.argmin(ys), np.argmax(xs - ys),
+        np.argmax(xs), np.argmax(xs + ys), np.argmax(ys), np.argmin(xs - ys),
+    ]
+    corners = [
+        c for c, d in zip(corners, corners[1:] + corners[:1], strict=True) if c != d
+    ]
+    if len(corners) < 3:
+        return order
+
+    inside = np.ones(len(order), dtype=bool)
+    for a, b in zip(corners, corners[1:] + corners[:1], strict=True):
+        inside &= cross(xs[a], ys[a], xs[b], ys[b], xs, ys) > 0
+    return order[~inside]
+
+
+def monotone_chain(xs, ys):
+    """
+    Andrew's monotone chain: returns the indices of the convex hull
+    vertices in counterclockwise order, starting from the leftmost
+    point. Points on a hull edge are not vertices.
+
+    Candidates are sorted once, then the lower and upper hulls are
+    built with a stack in a single pass each over Python ints, so
+    the orientation tests on integer coordinates are exact.
+    """
+    candidates = convex_hull_candidates(xs, ys).tolist()
+    if len(candidates) <= 2:
+        return candidates
+    px, py = xs.tolist(), ys.tolist()
+
+    def half_hull(indices):
+        hull = []
+        for i in indices:
+            x, y = px[i], py[i]
+            while len(hull) >= 2:
+                a, b = hull[-2], hull[-1]
+                if (px[b] - px[a]) * (y - py[a]) - (py[b] - py[a]) * (x - px[a]) > 0:
+                    break
+                hull.pop()
+            hull.append(i)
+        return hull
+
+    return half_hull(candidates)[:-1] + half_hull(candidates[::-1])[:-1]
+
+
+def gift_wrapping(xs, ys):
+    """
+    Jarvis march: returns the indices of the convex hull vertices
+    in counterclockwise order, starting from the leftmost point.
+    Points on a hull edge are not vertices.
+
+    Each step looks at every candidate at once: starting from any
+    point ahead of the current direction, it moves to the point with
+    the most negative cross product until none is left clockwise of
+    it, then takes the farthest point in that direction.
+    """
+    candidates = convex_hull_candidates(xs, ys)
+    if len(candidates) <= 2:
+        return candidates.tolist()
+    xs, ys = xs[candidates], ys[candidates]
+    if not cross(xs[0], ys[0], xs[-1], ys[-1], xs, ys).any():
+        # all points on one line: its two ends
+        return [candidates[0].item(), candidates[-1].item()]
+
+    # the leftmost point is on the hull; arrive there going down
+    hull = [0]
+    p, dx, dy = 0, 0, -1
+    while True:
+        vx, vy = xs - xs[p], ys - ys[p]
+        # points at a counterclockwise angle in [0, pi) from the direction
+        turn = dx * vy - dy * vx
+        ahead = (turn > 0) | ((turn == 0) & (dx * vx + dy * vy > 0))
+
+        q = np.argmax(ahead)
+        while True:
+            turn = np.where(ahead, vx[q] * vy - vy[q] * vx, 0)
+            r = np.argmin(turn)
+            if turn[r] >= 0:
+                break
+            q = r
+
+        q = np.argmax(np.where(ahead & (turn == 0), vx * vx + vy * vy, -1))
+        if q == 0:
+            return candidates[hull].tolist()
+        hull.append(q)
+        p, dx, dy = q, vx[q], vy[q]
+
+
+def closest_pair_distance(xs, ys, leaf_size=8):
+    """
+    Smallest squared distance between two of the points, or None
+    for fewer than two points. Exact for integer coordinates below
+    about 10^9 in absolute value.
+
+    Divide and conquer (CLRS 33.4) run bottom-up, one level of the
+    recursion at a time over all nodes at once: the points are sorted
+    by x once, the nodes of a level are blocks of consecutive points
+    in that order, and blocks of leaf_size points are solved by brute
+    force. Merging two blocks compares each point of the strip around
+    the dividing line with the next 7 strip points of the same block
+    in y order, using the smallest distance found so far as the strip
+    half-width, which only narrows the strips.
+    """
+    num_points = len(xs)
+    if num_points < 2:
+        return None
+    order = np.lexsort((ys, xs))
+    xs, ys = xs[order], ys[order]
+    positions = np.arange(num_points)
+
+    # brute force within each leaf block, starting from any pair
+    best = (xs[1] - xs[0]) ** 2 + (ys[1] - ys[0]) ** 2
+    for i in range(1, leaf_size):
+        a = positions[:-i]
+        a = a[a // leaf_size == (a + i) // leaf_size]
+        if len(a):
+            best = min(best, ((xs[a + i] - xs[a]) ** 2 + (ys[a + i] - ys[a]) ** 2).min())
+
+    by_y = np.lexsort((xs, ys))
+    block_size = leaf_size
+    while block_size < num_points and best:
+        # merge the blocks [k*2s, k*2s+s) and [k*2s+s, (k+1)*2s) of size s
+        blocks = positions // (2 * block_size)
+        splits = blocks * 2 * block_size + block_size
+        has_right = splits < num_points
+        dividing_x = xs[np.minimum(splits, num_points) - 1]
+        in_strip = has_right & ((xs - dividing_x) ** 2 < best)
+
+        # strip points in y order, grouped by block
+        strip = by_y[in_strip[by_y]]
+        strip = strip[np.argsort(blocks[strip], kind="stable")]
+        for i in range(1, 8):
+            a, b = strip[:-i], strip[i:]
+            same_block = blocks[a] == blocks[b]
+            if not same_block.any():
+                break
+            a, b = a[same_block], b[same_block]
+            best = min(best, ((xs[b] - xs[a]) ** 2 + (ys[b] - ys[a]) ** 2).min())
+        block_size *= 2
+
+    return best.item()
+
+
+def hull_mask(num_points, hull):
+    selected = np.zeros(num_points, dtype=np.int64)
+    selected[hull] = 1
+    return selected.tolist()
@@ -0,0 +1,382 @@
+import gc
+from itertools import pairwise
+
+import numpy as np
+
+
+def index_dtype(num_vertices):
+    # smallest signed dtype that can hold every vertex index
+    return np.int32 if num_vertices <= np.iinfo(np.int32).max else np.int64
+
+
+def weight_dtype(weights):
+    # integer weights are stored as int32 whenever they fit
+    if weights.dtype.kind in "iu" and len(weights) and (
+        weights.min() >= np.iinfo(np.int32).min and weights.max() <= np.iinfo(np.int32).max
+    ):
+        return np.int32
+    return weights.dtype if weights.dtype.kind in "iuf" else np.int64
+
+
+def edge_list_to_arrays(edge_list):
+    """
+    Splits a list of (u, v, w) tuples into arrays of sources,
+    targets and weights.
+    """
+    edges = np.array(edge_list) if len(edge_list) else np.empty((0, 3), dtype=np.int64)
+    if edges.dtype.kind == "f":
+        # float weights promote the whole array, so restore int vertices
+        return edges[:, 0].astype(np.int64), edges[:, 1].astype(np.int64), edges[:, 2]
+    return edges[:, 0], edges[:, 1], edges[:, 2]
+
+
+def group_edges_by_target(sources, targets, weights):
+    """
+    Sorts the edges (sources[i], targets[i], weights[i]) by target
+    for bellman_ford_grouped_distances. Returns (sources, weights,
+    starts, heads), where the edges into heads[k] start at index
+    starts[k].
+    """
+    order = np.argsort(targets, kind="stable")
+    sources = np.asarray(sources)[order]
+    weights = np.asarray(weights)[order]
+    targets = np.asarray(targets)[order]
+    # targets are non-negative, so the first edge always starts a group
+    starts = np.flatnonzero(np.diff(targets, prepend=-1))
+    return sources, weights, starts, targets[starts]
+
+
+def bellman_ford_grouped_distances(grouped_edges, num_vertices, src):
+    """
+    bellman_ford_distances over edges already grouped by
+    group_edges_by_target, so that a graph queried from many src
+    vertices is only sorted once.
+    """
+    sources, weights, starts, heads = grouped_edges
+    d = np.full(num_vertices, np.inf)
+    d[src] = 0
+    if len(starts) == 0:
+        return d
+
+    for _ in range(num_vertices):
+        candidates = np.minimum.reduceat(d[sources] + weights, starts)
+        improved = candidates < d[heads]
+        if not improved.any():
+            return d
+        d[heads[improved]] = candidates[improved]
+
+    return None
+
+
+def bellman_ford_distances(sources, targets, weights, num_vertices, src):
+    """
+    Shortest path distances from src over the edges
+    (sources[i], targets[i], weights[i]) as a float array, with inf
+    for unreachable vertices, or None if a negative cycle is
+    reachable from src.
+
+    Each round relaxes every edge at once: the candidate distances
+    d[u] + w are grouped by target (edges are sorted by target
+    once) and reduced with np.minimum.reduceat. Stops as soon as a
+    round changes nothing; a change in round num_vertices means a
+    negative cycle.
+    """
+    grouped_edges = group_edges_by_target(sources, targets, weights)
+    return bellman_ford_grouped_distances(grouped_edges, num_vertices, src)
+
+
+def connected_component_labels(us, vs, num_vertices):
+    """
+    Labels each vertex with the smallest vertex of its connected
+    component in the undirected graph with edges (us[i], vs[i]).
+
+    Union-find over all edges at once: each round hooks the roots
+    of the endpoints of every edge onto the smaller of the two with
+    np.minimum.at, then jumps pointers until every label is a root.
+    Rounds repeat until no edge joins two different roots.
+    """
+    labels = np.arange(num_vertices)
+    us, vs = np.asarray(us), np.asarray(vs)
+    while True:
+        lu, lv = labels[us], labels[vs]
+        joins = lu != lv
+        if not joins.any():
+            return labels
+        lu, lv = lu[joins], lv[joins]
+        lo = np.minimum(lu, lv)
+        np.minimum.at(labels, lu, lo)
+        np.minimum.at(labels, lv, lo)
+        while True:
+            parents = labels[labels]
+            if (parents == labels).all():
+                break
+            labels = parents
+
+
+def distances_to_list(d, integral=True):
+    # finite distances become ints for integer weights, others stay inf
+    if not integral:
+        return d.tolist()
+    return [int(x) if x != np.inf else x for x in d.tolist()]
+
+
+def low_link_dfs(graph, skip_parent_edge=False):
+    """
+    Iterative version of Tarjan's depth-first search over a
+    CSRGraph, visiting vertices from 0 up. Returns the lists
+    (disc, low, parents, components) where disc[v] is the discovery
+    time of v, low[v] the smallest discovery time reachable from the
+    subtree of v through one non-tree edge to a vertex still on
+    Tarjan's stack, parents[v] the parent of v in the DFS forest
+    (-1 for roots) and components[v] the id of the strongly
+    connected component of v.
+
+    For undirected graphs (both edge directions stored), set
+    skip_parent_edge so that one copy of the edge to the parent is
+    not counted as a back edge; components are then the
+    2-edge-connected components.
+    """
+    num_vertices = graph.num_vertices
+    offsets = graph.offsets.tolist()
+    targets = graph.targets.tolist()
+
+    disc = [-1] * num_vertices
+    low = [0] * num_vertices
+    parents = [-1] * num_vertices
+    components = [-1] * num_vertices
+    on_stack = [False] * num_vertices
+    skipped_parent_edge = [False] * num_vertices
+    # position of the next out-edge to explore from each vertex
+    next_edge = offsets[:-1]
+
+    tarjan_stack = []
+    time = 0
+    num_components = 0
+    for root in range(num_vertices):
+        if disc[root] != -1:
+            continue
+
+        disc[root] = low[root] = time
+        time += 1
+        tarjan_stack.append(root)
+        on_stack[root] = True
+        stack = [root]
+
+        while stack:
+            u = stack[-1]
+            i = next_edge[u]
+            if i < offsets[u + 1]:
+                next_edge[u] = i + 1
+                v = targets[i]
+                if disc[v] == -1:
+                    # tree edge
+                    parents[v] = u
+                    disc[v] = low[v] = time
+                    time += 1
+                    tarjan_stack.append(v)
+                    on_stack[v] = True
+                    stack.append(v)
+                elif skip_parent_edge and v == parents[u] and not skipped_parent_edge[u]:
+                    skipped_parent_edge[u] = True
+                elif on_stack[v] and disc[v] < low[u]:
+                    low[u] = disc[v]
+                continue
+
+            # all edges of u explored
+            stack.pop()
+            if stack and low[u] < low[stack[-1]]:
+                low[stack[-1]] = low[u]
+            if low[u] == disc[u]:
+                # u is the root of a component
+                while True:
+                    v = tarjan_stack.pop()
+                    on_stack[v] = False
+                    components[v] = num_components
+                    if v == u:
+                        break
+                num_components += 1
+
+    return disc, low, parents, components
+
+
+class DisjointSet:
+    """
+    Disjoint-set forest over the elements range(n), backed by
+    flat lists of parents and ranks, with path compression and
+    union by rank.
+    """
+    def __init__(self, n):
+        self.parents = list(range(n))
+        self.ranks = [0] * n
+
+
+    def find(self, u):
+        parents = self.parents
+        root = u
+        while parents[root] != root:
+            root = parents[root]
+        # point every vertex on the path directly at the root
+        while parents[u] != root:
+            parents[u], u = root, parents[u]
+        return root
+
+
+    def union(self, u, v):
+        """
+        Merges the sets of u and v. Returns False if they were
+        already in the same set.
+        """
+        root_u, root_v = self.find(u), self.find(v)
+        if root_u == root_v:
+            return False
+        if self.ranks[root_u] < self.ranks[root_v]:
+            root_u, root_v = root_v, root_u
+        self.parents[root_v] = root_u
+        if self.ranks[root_u] == self.ranks[root_v]:
+            self.ranks[root_u] += 1
+        return True
+
+
+class CSRGraph:
+    """
+    Directed graph in compressed sparse row form: the out-edges
+    of vertex u go to targets[offsets[u]:offsets[u+1]] with the
+    matching weights, in the order they appear in the edge list.
+    Undirected graphs store both directions of each edge, as in
+    the edge_list format.
+
+    Takes about 8 bytes per edge (int32 targets and weights) plus
+    8 bytes per vertex, instead of a Python tuple per edge.
+
+    Generators of acyclic graphs may set topo_order to a known
+    topological order, which solvers can use instead of computing
+    one (it need not be the order Kahn's algorithm finds).
+    """
+    def __init__(self, offsets, targets, weights, topo_order=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.topo_order = topo_order
+
+
+    @classmethod
+    def from_arrays(cls, sources, targets, weights, num_vertices, topo_order=None):
+        sources = np.asarray(sources)
+        targets = np.asarray(targets)
+        weights = np.asarray(weights)
+
+        # a stable sort keeps the edge list order within each vertex
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_vertices), out=offsets[1:])
+        return cls(
+            offsets,
+            targets[order].astype(index_dtype(num_vertices)),
+            weights[order].astype(weight_dtype(weights)),
+            topo_order=topo_order
+        )
+
+
+    @classmethod
+    def from_edge_list(cls, edge_list, num_vertices):
+        if isinstance(edge_list, cls):
+            return edge_list
+        return cls.from_arrays(*edge_list_to_arrays(edge_list), num_vertices)
+
+
+    @property
+    def num_vertices(self):
+        return len(self.offsets) - 1
+
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+
+    def sources(self):
+        return np.repeat(np.arange(self.num_vertices, dtype=self.targets.dtype), self.out_degrees())
+
+
+    def edge_arrays(self):
+        return self.sources(), self.targets, self.weights
+
+
+    def out_degrees(self):
+        return np.diff(self.offsets)
+
+
+    def in_degrees(self):
+        return np.bincount(self.targets, minlength=self.num_vertices)
+
+
+    def neighbors(self, u):
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+
+    def reachable_from(self, src):
+        """
+        Returns a boolean mask of the vertices reachable from
+        src, found with an iterative depth-first search over the
+        flat offsets and targets, so it does not recurse.
+        """
+        offsets = self.offsets.tolist()
+        targets = self.targets.tolist()
+
+        visited = [False] * self.num_vertices
+        visited[src] = True
+        stack = [src]
+        while stack:
+            u = stack.pop()
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if visited[v]:
+                    continue
+                visited[v] = True
+                stack.append(v)
+
+        return np.array(visited, dtype=bool)
+
+
+    def adjacency_lists(self, keep_weights=True):
+        """
+        Returns the graph as a list of Python lists in the format
+        of GraphsSolver._construct_graph_from_input.
+        """
+        offsets = self.offsets.tolist()
+        targets = self.targets.tolist()
+        if keep_weights:
+            targets = list(zip(targets, self.weights.tolist(), strict=True))
+
+        # the lists hold only ints and tuples of ints, so they cannot
+        # form reference cycles; pausing the cyclic garbage collector
+        # avoids rescanning them over and over on large graphs
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return [targets[start:end] for start, end in pairwise(offsets)]
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+
+    def to_edge_list(self):
+        return list(zip(
+            self.sources().tolist(),
+            self.targets.tolist(),
+            self.weights.tolist(),
+            strict=True,
+        ))
+
+
+    def __eq__(self, other):
+        if not isinstance(other, CSRGraph):
+            return NotImplemented
+        return (
+            np.array_equal(self.offsets, other.offsets)
+            and np.array_equal(self.targets, other.targets)
+            and np.array_equal(self.weights, other.weights)
+        )
+
+
+    def __repr__(self):
+        return f"CSRGraph(num_vertices={self.num_vertices}, num_edges={self.num_edges})"
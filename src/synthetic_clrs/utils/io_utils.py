@@ -0,0 +1,199 @@
+import json
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+class JsonlWriter:
+    """
+    Streams dataset records to a JSON Lines file, one compact
+    record per line, as soon as they are produced.
+
+    Writes go through a buffered file object of buffer_size bytes
+    and are flushed to disk every flush_every records (and on close),
+    so memory use stays constant regardless of dataset size.
+    """
+    def __init__(self, path, buffer_size=1 << 20, flush_every=10_000):
+        self.path = path
+        self.flush_every = flush_every
+        self.num_records = 0
+        self._encode = json.JSONEncoder().encode
+        self._file = open(path, "w", buffering=buffer_size)
+
+
+    def write(self, record):
+        self._file.write(self._encode(record))
+        self._file.write("\n")
+        self.num_records += 1
+        if self.flush_every and self.num_records % self.flush_every == 0:
+            self.flush()
+
+
+    def flush(self):
+        self._file.flush()
+
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def iter_jsonl(path):
+    with open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_jsonl(path):
+    return list(iter_jsonl(path))
+
+
+class ParquetShardWriter:
+    """
+    Streams dataset records into a directory of Parquet files,
+    one shard per algorithm named <algo_name>.parquet.
+
+    Question fields become top-level columns (list fields such as
+    edge_list, xs/ys and array are stored as native list columns)
+    next to a typed answer column. Rows are buffered per algorithm
+    and written out as row groups of row_group_size rows, so each
+    shard can be scanned a row group at a time.
+
+    A column that only held empty lists or nulls so far (e.g. the
+    answer of an algorithm whose first problems have no solution)
+    has no type yet, so row groups are held back until a later one
+    settles it or the shard is closed.
+    """
+    def __init__(self, path, row_group_size=65_536):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.row_group_size = row_group_size
+        self.num_records = 0
+        self._buffers = {}
+        self._pending = {}
+        self._writers = {}
+
+
+    def write(self, record):
+        row = {**record["question"], "answer": record["answer"]}
+        buffer = self._buffers.setdefault(record["algo_name"], [])
+        buffer.append(row)
+        self.num_records += 1
+        if len(buffer) >= self.row_group_size:
+            self._write_row_group(record["algo_name"])
+
+
+    def _write_row_group(self, algorithm, final=False):
+        rows = self._buffers.pop(algorithm, None)
+        writer = self._writers.get(algorithm)
+        if writer is not None:
+            if rows:
+                table = pa.Table.from_pylist(rows, schema=writer.schema)
+                writer.write_table(table, row_group_size=self.row_group_size)
+            return
+
+        # the shard schema is unified over the row groups held back so
+        # far, which only settles once no column type is left as null
+        pending = self._pending.setdefault(algorithm, [])
+        if rows:
+            pending.append(pa.Table.from_pylist(rows))
+        if not pending:
+            return
+        schema = pa.unify_schemas(
+            [table.schema for table in pending], promote_options="permissive"
+        )
+        if not final and any(_has_null_type(field.type) for field in schema):
+            return
+
+        writer = pq.ParquetWriter(shard_path(self.path, algorithm), schema)
+        self._writers[algorithm] = writer
+        for table in self._pending.pop(algorithm):
+            writer.write_table(table.cast(schema), row_group_size=self.row_group_size)
+
+
+    def flush(self):
+        for algorithm in list(self._buffers):
+            self._write_row_group(algorithm)
+
+
+    def close(self):
+        for algorithm in set(self._buffers) | set(self._pending):
+            self._write_row_group(algorithm, final=True)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def _has_null_type(type_):
+    # whether type_ is null or nests one, as inferred for a column of
+    # nulls or empty lists
+    if pa.types.is_null(type_):
+        return True
+    if pa.types.is_list(type_) or pa.types.is_large_list(type_):
+        return _has_null_type(type_.value_type)
+    if pa.types.is_struct(type_):
+        return any(_has_null_type(field.type) for field in type_)
+    return False
+
+
+def shard_path(path, algorithm):
+    return Path(path) / f"{algorithm}.parquet"
+
+
+def read_parquet_shard(path, algorithm, columns=None):
+    """
+    Returns the shard of a single algorithm as a pyarrow Table,
+    reading only the requested columns.
+    """
+    return pq.read_table(shard_path(path, algorithm), columns=columns)
+
+
+def iter_parquet_batches(path, algorithm, batch_size=65_536, columns=None):
+    """
+    Yields pyarrow RecordBatches of a single algorithm's shard
+    without loading the whole shard into memory.
+    """
+    parquet_file = pq.ParquetFile(shard_path(path, algorithm))
+    yield from parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+
+
+def iter_parquet_records(path, algorithm=None):
+    """
+    Yields records in the same format as the JSON datasets, for
+    every shard in path or just the shard of the given algorithm.
+    """
+    algorithms = (
+        [algorithm] if algorithm is not None
+        else sorted(p.stem for p in Path(path).glob("*.parquet"))
+    )
+    for algo in algorithms:
+        for batch in iter_parquet_batches(path, algo):
+            for row in batch.to_pylist():
+                answer = row.pop("answer")
+                yield {
+                    "algo_name": algo,
+                    "question": row,
+                    "answer": answer,
+                }
+
+
+def read_parquet(path, algorithm=None):
+    return list(iter_parquet_records(path, algorithm))
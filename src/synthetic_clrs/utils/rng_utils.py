@@ -1,56 +1,201 @@
+import math
+import zlib
+
 import numpy as np
 
+from .batch_utils import PaddedArray
+
+# widest value range served from pre-drawn uniform floats; the
+# float-to-int mapping is biased by at most range / 2^53
+MAX_BLOCK_RANGE = 1 << 32
+
+# longest array built in pure python from the pre-drawn block,
+# below which a list comprehension beats numpy call overhead
+MAX_SMALL_ARRAY_LENGTH = 32
+
+# size of the first pre-drawn block, doubled on each refill up to
+# block_size, so that short-lived streams (one per problem in
+# ProblemGenerator.generate_problem_at) do not pay for a full block
+INITIAL_BLOCK_SIZE = 32
+
 class Rng:
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, block_size=1024):
         if seed is not None:
             self.rng = np.random.default_rng(seed)
         else:
             self.rng = np.random.default_rng()
 
+        # scalar and small-array requests are served from a refillable
+        # block of pre-drawn uniform floats to amortize numpy call overhead
+        self.block_size = block_size
+        self._reset_block()
+
+
+    @classmethod
+    def from_counter(cls, master_seed, stream, index, **kwargs):
+        """
+        Returns an Rng over a counter-based Philox stream keyed by
+        (master_seed, stream) and starting at block index, so the
+        draws for any index can be produced in O(1) without replaying
+        the draws for earlier indices.
+        """
+        key = [master_seed & 0xFFFF_FFFF_FFFF_FFFF, zlib.crc32(stream.encode())]
+        # index goes in the most significant counter word, leaving
+        # 2^192 blocks of draws to each index
+        counter = [0, 0, 0, index]
+        rng = cls(np.random.Philox(key=key, counter=counter), **kwargs)
+        # state at the start of a block index, reused by seek
+        rng._counter_state = rng.rng.bit_generator.state
+        return rng
+
+
+    def seek(self, index):
+        """
+        Moves an Rng made by from_counter to the start of block index
+        of the same stream, giving the same draws as a new
+        from_counter(master_seed, stream, index) without paying for
+        a new Philox bit generator.
+        """
+        state = self._counter_state
+        state["state"]["counter"][3] = index
+        self.rng.bit_generator.state = state
+        self._reset_block()
+
+
+    def _reset_block(self):
+        self._block = np.empty(0)
+        self._block_list = []
+        self._block_pos = 0
+        self._next_block_size = min(INITIAL_BLOCK_SIZE, self.block_size)
+
+
+    def _refill_block(self, size=1):
+        # the block grows geometrically, but always holds size uniforms
+        block_size = max(self._next_block_size, size)
+        self._block = self.rng.random(block_size)
+        self._block_list = self._block.tolist()
+        self._block_pos = 0
+        self._next_block_size = min(2 * block_size, self.block_size)
+
 
-    def _make_prob_dist(self, size, exclude_indices=()):
-        arr = np.ones(size)
-        arr[list(exclude_indices)] = 0
-        return arr / (size - len(exclude_indices))
+    def _next_uniform(self):
+        if self._block_pos == len(self._block_list):
+            self._refill_block()
+        u = self._block_list[self._block_pos]
+        self._block_pos += 1
+        return u
+
+
+    def _reserve_uniforms(self, size):
+        if self._block_pos + size > len(self._block_list):
+            self._refill_block(size)
+        block_start = self._block_pos
+        self._block_pos += size
+        return block_start
+
+
+    def _next_uniforms(self, size):
+        block_start = self._reserve_uniforms(size)
+        return self._block[block_start:self._block_pos]
+
+
+    def _next_uniforms_list(self, size):
+        block_start = self._reserve_uniforms(size)
+        return self._block_list[block_start:self._block_pos]
+
+
+    def _sample_distinct_indices(self, pop_size, sample_size):
+        # dense samples: partial shuffle of the whole population
+        if pop_size <= 32 * sample_size:
+            return self.rng.permutation(pop_size)[:sample_size]
+
+        # sparse samples: Floyd's algorithm, which only needs
+        # sample_size draws and a set of the chosen indices
+        upper_bounds = range(pop_size - sample_size, pop_size)
+        draws = self.rng.integers(0, np.arange(pop_size - sample_size, pop_size) + 1)
+        chosen = set()
+        for j, t in zip(upper_bounds, draws.tolist(), strict=True):
+            chosen.add(j if t in chosen else t)
+
+        # Floyd's algorithm picks a uniform subset but not
+        # a uniform order, so shuffle the chosen indices
+        indices = np.fromiter(chosen, dtype=np.int64, count=sample_size)
+        self.rng.shuffle(indices)
+        return indices
 
 
     def _gen_input(self, shape, min_int, max_int, exclude=(), distinct=False):
-        sample_size = np.array(shape, dtype=np.int64).prod().item()
+        if min_int > max_int:
+            raise ValueError(
+                f"min_int ({min_int}) must be at most max_int ({max_int})."
+            )
+
+        sample_size = math.prod(shape)
         pop_size = max_int - min_int + 1
 
-        if distinct and sample_size > pop_size:
+        if not exclude and not distinct:
+            if sample_size <= self.block_size and pop_size <= MAX_BLOCK_RANGE:
+                # small request: scale pre-drawn uniforms onto [min_int, max_int]
+                uniforms = self._next_uniforms(sample_size)
+                return (min_int + (uniforms * pop_size).astype(np.int64)).reshape(shape)
+            # plain uniform draw over [min_int, max_int]
+            return self.rng.integers(min_int, max_int, size=shape, endpoint=True)
+
+        # offsets of the excluded ints within [min_int, max_int]
+        excluded = np.unique(np.asarray(exclude, dtype=np.int64) - min_int)
+        excluded = excluded[(excluded >= 0) & (excluded < pop_size)]
+        num_allowed = pop_size - len(excluded)
+
+        if num_allowed <= 0:
+            raise ValueError(
+                f"No ints left to sample in [{min_int}, {max_int}] "
+                f"after excluding {exclude}."
+            )
+
+        if distinct and sample_size > num_allowed:
             raise ValueError(
-                f"Sampling set ({pop_size}) must be at least the size of the "
+                f"Sampling set ({num_allowed}) must be at least the size of the "
                 f"input to generate ({sample_size})."
             )
 
-        # uniform distribution over the non-excluded ints in [min_int, max_int]
-        prob_dist = self._make_prob_dist(
-            pop_size,
-            exclude_indices=tuple(
-                exc - min_int for exc in exclude
+        # sample random indices into the non-excluded ints
+        if distinct:
+            random_indices = self._sample_distinct_indices(num_allowed, sample_size)
+        else:
+            random_indices = self.rng.integers(0, num_allowed, size=sample_size)
+
+        if len(excluded):
+            # remap index r to the r-th non-excluded offset by skipping
+            # over every excluded offset at or below it
+            random_indices = random_indices + np.searchsorted(
+                excluded - np.arange(len(excluded)),
+                random_indices,
+                side="right"
             )
-        )
 
-        # sample random indices
-        random_indices = self.rng.choice(
-            pop_size,
-            sample_size,
-            replace=(not distinct),
-            p=prob_dist
-        )
+        return (min_int + random_indices).reshape(shape)
 
-        return np.array(range(min_int, max_int + 1))[random_indices].reshape(shape)
 
-    
     def gen_random_integer_partition(self, num):
-        partition = [0] * num
-        for _ in range(num):
-            partition[self.gen_int(0, num - 1)] += 1
-        return [n for n in partition if n != 0]
+        # throw num balls into num buckets and keep the nonempty buckets
+        partition = np.bincount(self.gen_int_ndarray((num,), 0, num - 1), minlength=num)
+        return partition[partition != 0].tolist()
+
+
+    def gen_permutation(self, num):
+        return self.rng.permutation(num).tolist()
+
+
+    def shuffle(self, arr):
+        # shuffle list in place
+        self.rng.shuffle(arr)
 
 
     def gen_int(self, min_int, max_int, **kwargs):
+        # empty ranges fall through to _gen_input, which rejects them
+        in_block_range = 0 <= max_int - min_int < MAX_BLOCK_RANGE
+        if not kwargs and self.block_size and in_block_range:
+            return min_int + int(self._next_uniform() * (max_int - min_int + 1))
         return self._gen_input(tuple(), min_int, max_int, **kwargs).tolist()
 
 
@@ -59,6 +204,10 @@ class Rng:
 
 
     def gen_int_array(self, length, min_int, max_int, **kwargs):
+        pop_size = max_int - min_int + 1
+        small = length <= min(MAX_SMALL_ARRAY_LENGTH, self.block_size)
+        if not kwargs and small and 0 < pop_size <= MAX_BLOCK_RANGE:
+            return [min_int + int(u * pop_size) for u in self._next_uniforms_list(length)]
         return self._gen_input((length,), min_int, max_int, **kwargs).tolist()
 
 
@@ -74,6 +223,52 @@ class Rng:
         return self.gen_int_grid(rows, cols, 0, 1, **kwargs)
 
 
+    def gen_int_ndarray(self, shape, min_int, max_int, **kwargs):
+        return self._gen_input(shape, min_int, max_int, **kwargs)
+
+
+    def gen_int_ndarray_in_ranges(self, min_ints, max_ints):
+        # elementwise draws from [min_ints[i], max_ints[i]]
+        return self.rng.integers(min_ints, max_ints, endpoint=True)
+
+
+    def gen_uniform_ndarray(self, shape):
+        # uniform floats in [0, 1)
+        size = math.prod(shape)
+        if size <= self.block_size:
+            return self._next_uniforms(size).reshape(shape)
+        return self.rng.random(shape)
+
+
+    def gen_bernoulli_ndarray(self, shape, p):
+        return self.gen_uniform_ndarray(shape) < p
+
+
+    def gen_bernoulli_array(self, length, p):
+        return self.gen_bernoulli_ndarray((length,), p).astype(np.int64).tolist()
+
+
+    def gen_bernoulli_grid(self, rows, cols, p):
+        return self.gen_bernoulli_ndarray((rows, cols), p).astype(np.int64).tolist()
+
+
+    def gen_geometric_ndarray(self, size, p):
+        # number of trials up to and including the first success
+        return self.rng.geometric(p, size=size)
+
+
+    def gen_padded_int_arrays(self, lengths, min_int, max_int):
+        """
+        Draws len(lengths) int arrays with the given lengths in a
+        single call and returns them as a PaddedArray.
+        """
+        lengths = np.asarray(lengths, dtype=np.int64)
+        values = self.rng.integers(min_int, max_int, size=(len(lengths), lengths.max(initial=0)), endpoint=True)
+        padded = PaddedArray(values, lengths)
+        values[~padded.mask()] = padded.pad_value
+        return padded
+
+
     def gen_random_discrete_distribution(self, num_buckets, n_decimals=2):
         random_arr = self._gen_input((num_buckets,), 1, 100)
         random_prob_dist = random_arr / random_arr.sum()
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from make_dataset import CLRSDataset
+
+
+@pytest.mark.parametrize("save_file", ["dataset.jsonl", "dataset.json"])
+def test_generation_is_independent_of_workers_and_shards(tmp_path, save_file):
+    serial_dir, parallel_dir = tmp_path / "serial", tmp_path / "parallel"
+    CLRSDataset(save_dir=serial_dir, seed=0).generate(
+        num_probs_per_algo=5, save_file=save_file, num_workers=1
+    )
+    CLRSDataset(save_dir=parallel_dir, seed=0).generate(
+        num_probs_per_algo=5, save_file=save_file, num_workers=3, shard_size=2
+    )
+    serial = (serial_dir / save_file).read_bytes()
+    assert serial and serial == (parallel_dir / save_file).read_bytes()
+
+def test_parquet_generation_is_independent_of_workers_and_shards(tmp_path):
+    serial = CLRSDataset(save_dir=tmp_path / "serial", seed=0)
+    serial.generate(num_probs_per_algo=5, save_file="dataset.parquet", num_workers=1)
+    parallel = CLRSDataset(save_dir=tmp_path / "parallel", seed=0)
+    parallel.generate(
+        num_probs_per_algo=5, save_file="dataset.parquet", num_workers=2, shard_size=3
+    )
+    serial.load("dataset.parquet")
+    parallel.load("dataset.parquet")
+    assert serial.data and serial.data == parallel.data
+
+def test_jsonl_round_trip_over_several_flushes(tmp_path):
+    dataset = CLRSDataset(save_dir=tmp_path, seed=0)
+    dataset.generate(num_probs_per_algo=3, save_file="dataset.jsonl", flush_every=7)
+    expected = list(dataset._iter_problems(3, num_workers=1, shard_size=1_000))
+    assert len(expected) > 7
+    # edges are generated as tuples and read back as lists
+    expected = json.loads(json.dumps(expected))
+
+    dataset.load("dataset.jsonl")
+    assert dataset.data == expected
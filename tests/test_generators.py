@@ -0,0 +1,277 @@
+import pytest
+
+from synthetic_clrs import (
+    Algorithm,
+    ALGORITHMS_BY_CATEGORY,
+    ALGORITHM_TO_CATEGORY,
+    Category,
+    ProblemGenerator,
+    ProblemSolver,
+)
+from synthetic_clrs.generators.geometry_generator import GeometryGenerator
+from synthetic_clrs.generators.graphs_generator import GRAPH_FAMILIES, TREE_FAMILIES, GraphsGenerator
+from synthetic_clrs.utils import CSRGraph, DisjointSet, batch_to_problems
+
+
+ALGORITHMS = list(ALGORITHM_TO_CATEGORY.keys())
+
+
+#############################
+### Reproducibility Tests ###
+#############################
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_seeded_generation_is_reproducible(algorithm):
+    problems_a = [ProblemGenerator(seed=0).generate_problem(algorithm) for _ in range(3)]
+    problems_b = [ProblemGenerator(seed=0).generate_problem(algorithm) for _ in range(3)]
+    assert problems_a == problems_b
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_generate_problem_at(algorithm):
+    generator = ProblemGenerator()
+    problem = generator.generate_problem_at(algorithm, 1234, master_seed=42)
+
+    # other problems generated in between do not change problem 1234
+    for index in range(3):
+        generator.generate_problem_at(algorithm, index, master_seed=42)
+    generator.generate_problem(algorithm)
+
+    assert ProblemGenerator().generate_problem_at(algorithm, 1234, master_seed=42) == problem
+    ProblemSolver.solve(algorithm, **problem)
+
+def test_generate_problem_at_keeps_shared_stream():
+    generator = ProblemGenerator(seed=0)
+    generator.generate_problem_at(Algorithm.BFS, 5, master_seed=42)
+    expected = ProblemGenerator(seed=0).generate_problem(Algorithm.BFS)
+    assert generator.generate_problem(Algorithm.BFS) == expected
+
+
+##############################
+### Batch Generation Tests ###
+##############################
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_generate_batch(algorithm):
+    batch = ProblemGenerator(seed=0).generate_batch(algorithm, 50)
+    problems = batch_to_problems(batch)
+    assert len(problems) == 50
+    for problem in problems:
+        assert problem.keys() == ProblemGenerator(seed=0).generate_problem(algorithm).keys()
+        ProblemSolver.solve(algorithm, **problem)
+
+def test_generate_batch_constraints():
+    generator = ProblemGenerator(seed=0)
+
+    for problem in batch_to_problems(generator.generate_batch(Algorithm.BINARY_SEARCH, 200)):
+        assert problem["array"] == sorted(problem["array"])
+        assert problem["target"] in problem["array"]
+
+    for problem in batch_to_problems(generator.generate_batch(Algorithm.ACTIVITY_SELECTION, 200)):
+        assert all(s < f for s, f in zip(problem["start"], problem["finish"]))
+
+    for problem in batch_to_problems(generator.generate_batch(Algorithm.KMP_MATCHER, 200)):
+        assert len(problem["pattern"]) <= len(problem["text"])
+
+
+#####################################
+### Sparse Graph Generation Tests ###
+#####################################
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS_BY_CATEGORY[Category.GRAPHS])
+def test_sparse_graph_generation(algorithm):
+    generator = GraphsGenerator(min_vertices=30, max_vertices=40, avg_degree=3, sparse=True, seed=0)
+    for _ in range(10):
+        problem = generator.generate_problem(algorithm)
+        edges = {(u, v) for u, v, _ in problem["edge_list"]}
+        # no duplicate edges
+        assert len(edges) == len(problem["edge_list"])
+        assert all(0 <= u < problem["num_vertices"] and 0 <= v < problem["num_vertices"] for u, v in edges)
+        ProblemSolver.solve(algorithm, **problem)
+
+def test_bellman_ford_generation_has_no_negative_cycle():
+    generator = GraphsGenerator(min_vertices=20, max_vertices=30, seed=0)
+    num_negative_weights = 0
+    for _ in range(50):
+        problem = generator.generate_bellman_ford_problem()
+        weights = [w for _, _, w in problem["edge_list"]]
+        assert generator.min_weight <= min(weights) and max(weights) <= generator.max_weight
+        assert ProblemSolver.solve(Algorithm.BELLMAN_FORD, **problem) != -1
+        num_negative_weights += sum(w < 0 for w in weights)
+    assert num_negative_weights > 0
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS_BY_CATEGORY[Category.GRAPHS])
+@pytest.mark.parametrize("sparse", [False, True])
+def test_csr_graph_generation(algorithm, sparse):
+    list_generator = GraphsGenerator(min_vertices=10, max_vertices=20, sparse=sparse, seed=0)
+    csr_generator = GraphsGenerator(min_vertices=10, max_vertices=20, sparse=sparse, as_csr=True, seed=0)
+    for _ in range(10):
+        problem = list_generator.generate_problem(algorithm)
+        csr_problem = csr_generator.generate_problem(algorithm)
+        assert isinstance(csr_problem["edge_list"], CSRGraph)
+        assert csr_problem["edge_list"] == CSRGraph.from_edge_list(problem["edge_list"], problem["num_vertices"])
+        assert ProblemSolver.solve(algorithm, **csr_problem) == ProblemSolver.solve(algorithm, **problem)
+
+def test_mst_generation_is_connected():
+    generator = GraphsGenerator(min_vertices=10, max_vertices=50, edge_probability=0.05, seed=0)
+    for _ in range(20):
+        problem = generator.generate_mst_prim_problem()
+        graph = CSRGraph.from_edge_list(problem["edge_list"], problem["num_vertices"])
+        assert graph.reachable_from(0).all()
+        # both directions of each undirected edge, without duplicates
+        edges = {(u, v) for u, v, _ in problem["edge_list"]}
+        assert len(edges) == len(problem["edge_list"])
+        assert all((v, u) in edges for u, v in edges)
+
+def tree_components(us, vs, num_vertices):
+    # roots of the components of the undirected edges, which must
+    # form a forest: every edge joins two different components
+    components = DisjointSet(num_vertices)
+    for u, v in zip(us.tolist(), vs.tolist(), strict=True):
+        assert components.union(u, v)
+    return [components.find(v) for v in range(num_vertices)]
+
+@pytest.mark.parametrize("tree_sizes", [[1], [2], [50], [1, 1, 1], [3, 1, 7, 2, 20]])
+def test_sample_forest_edges(tree_sizes):
+    generator = GraphsGenerator(seed=0)
+    parents, children = generator._sample_forest_edges(tree_sizes)
+    num_vertices = sum(tree_sizes)
+    assert len(parents) == len(children) == num_vertices - len(tree_sizes)
+
+    # each tree spans its own block of consecutive vertices
+    roots = tree_components(parents, children, num_vertices)
+    start = 0
+    for size in tree_sizes:
+        assert set(roots[start:start + size]) == {roots[start]}
+        start += size
+    assert len(set(roots)) == len(tree_sizes)
+
+@pytest.mark.parametrize("num_vertices, offset", [(1, 0), (30, 0), (30, 12)])
+def test_random_tree_generation(num_vertices, offset):
+    generator = GraphsGenerator(seed=0)
+    us, vs, ws = generator._generate_random_tree(num_vertices, True, True, offset=offset)
+    # both directions of num_vertices - 1 edges, with matching weights
+    assert len(us) == len(vs) == len(ws) == 2 * (num_vertices - 1)
+    assert (us[0::2] == vs[1::2]).all() and (ws[0::2] == ws[1::2]).all()
+    assert set(us.tolist()) | set(vs.tolist()) <= set(range(offset, offset + num_vertices))
+
+    roots = tree_components(us[0::2] - offset, vs[0::2] - offset, num_vertices)
+    assert len(set(roots)) == 1
+
+def test_random_forest_generation():
+    generator = GraphsGenerator(seed=0)
+    for num_vertices in [1, 2, 10, 100]:
+        us, vs, _ = generator._generate_random_forest(num_vertices, True, False)
+        # trees on consecutive blocks of vertices that partition them
+        roots = tree_components(us[0::2], vs[0::2], num_vertices)
+        assert len(us) == 2 * (num_vertices - len(set(roots)))
+        runs = 1 + sum(roots[v] != roots[v - 1] for v in range(1, num_vertices))
+        assert runs == len(set(roots))
+
+@pytest.mark.parametrize("algorithm", [
+    Algorithm.BELLMAN_FORD,
+    Algorithm.BFS,
+    Algorithm.DAG_SHORTEST_PATH,
+    Algorithm.DFS,
+    Algorithm.DIJKSTRA,
+])
+def test_multi_query_generation(algorithm):
+    generator = GraphsGenerator(min_vertices=5, max_vertices=20, num_queries=4, seed=0)
+    for _ in range(10):
+        problem = generator.generate_problem(algorithm)
+        assert "src" not in problem
+        assert len(set(problem["srcs"])) == len(problem["srcs"]) == min(4, problem["num_vertices"])
+
+        answers = ProblemSolver.solve(algorithm, **problem)
+        question = {key: value for key, value in problem.items() if key != "srcs"}
+        assert answers == [ProblemSolver.solve(algorithm, **question, src=src) for src in problem["srcs"]]
+        if algorithm in (Algorithm.BELLMAN_FORD, Algorithm.DIJKSTRA):
+            # every src reaches every vertex
+            assert all(float("inf") not in answer for answer in answers)
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_dag_generation_topological_order(sparse):
+    generator = GraphsGenerator(min_vertices=10, max_vertices=30, sparse=sparse, as_csr=True, seed=0)
+    for _ in range(20):
+        graph = generator.generate_dag_shortest_path_problem()["edge_list"]
+        position = {v: i for i, v in enumerate(graph.topo_order)}
+        assert sorted(position) == list(range(graph.num_vertices))
+        assert all(position[u] < position[v] for u, v, _ in graph.to_edge_list())
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_undirected_graph_generation(sparse):
+    generator = GraphsGenerator(min_vertices=5, max_vertices=30, sparse=sparse, seed=0)
+    for _ in range(20):
+        problem = generator._generate_graph_problem(weighted=True)
+        weights = {(u, v): w for u, v, w in problem["edge_list"]}
+        # each unordered pair once, in both directions with the same weight
+        assert len(weights) == len(problem["edge_list"])
+        assert all(u != v and weights[v, u] == w for (u, v), w in weights.items())
+
+def test_copy_bottom_left_tri_to_top_right_tri():
+    grid = [[1, 0, 0], [1, 0, 0], [0, 1, 1]]
+    symmetric_grid = GraphsGenerator.copy_bottom_left_tri_to_top_right_tri(grid)
+    assert symmetric_grid.tolist() == [[1, 1, 0], [1, 0, 1], [0, 1, 1]]
+    # the input is left as is
+    assert grid == [[1, 0, 0], [1, 0, 0], [0, 1, 1]]
+
+@pytest.mark.parametrize("family", GRAPH_FAMILIES)
+@pytest.mark.parametrize("algorithm", ALGORITHMS_BY_CATEGORY[Category.GRAPHS])
+def test_graph_family_generation(family, algorithm):
+    if algorithm in (Algorithm.BFS, Algorithm.DFS) and family not in TREE_FAMILIES:
+        # rejected when the generator is made, not midway through a dataset
+        with pytest.raises(ValueError):
+            GraphsGenerator(family={algorithm: family})
+        # a family for every algorithm leaves their problems as random trees
+        generators = [GraphsGenerator(min_vertices=1, max_vertices=40, avg_degree=3, family=family, seed=0)]
+    else:
+        generators = [
+            GraphsGenerator(min_vertices=1, max_vertices=40, avg_degree=3, family=family_setting, seed=0)
+            for family_setting in ({algorithm: family}, family)
+        ]
+
+    for generator in generators:
+        for _ in range(10):
+            problem = generator.generate_problem(algorithm)
+            edges = {(u, v) for u, v, _ in problem["edge_list"]}
+            assert len(edges) == len(problem["edge_list"])
+            assert all(u != v for u, v in edges)
+            ProblemSolver.solve(algorithm, **problem)
+
+def test_unknown_graph_family_is_rejected():
+    with pytest.raises(ValueError):
+        GraphsGenerator(family="hypercube")
+    with pytest.raises(ValueError):
+        GraphsGenerator(family={Algorithm.DIJKSTRA: "hypercube"})
+
+@pytest.mark.parametrize("family", GRAPH_FAMILIES)
+def test_graph_family_dag_and_connected_generation(family):
+    generator = GraphsGenerator(min_vertices=50, max_vertices=50, avg_degree=4, family=family, as_csr=True, seed=0)
+    for _ in range(5):
+        graph = generator.generate_problem(Algorithm.TOPOLOGICAL_SORT)["edge_list"]
+        position = {v: i for i, v in enumerate(graph.topo_order)}
+        assert all(position[u] < position[v] for u, v, _ in graph.to_edge_list())
+
+        graph = generator.generate_problem(Algorithm.MST_PRIM)["edge_list"]
+        assert graph.reachable_from(0).all()
+
+@pytest.mark.parametrize("family, num_edges, degrees", [
+    ("path", 49, {1, 2}),
+    ("star", 49, {1, 49}),
+    # 7 columns: 7 full rows and one vertex in the last
+    ("grid", 7 * 6 + 43, {2, 3, 4, 1}),
+    ("complete_bipartite", 25 * 25, {25}),
+])
+def test_graph_family_structure(family, num_edges, degrees):
+    generator = GraphsGenerator(min_vertices=50, max_vertices=50, edge_probability=1.0, family=family, as_csr=True, seed=0)
+    graph = generator.generate_problem(Algorithm.BRIDGES)["edge_list"]
+    assert graph.num_edges == 2 * num_edges
+    assert set(graph.out_degrees().tolist()) == degrees
+
+def test_segment_generation():
+    generator = GeometryGenerator(min_num_segments=100, max_num_segments=200, min_coordinate=0, max_coordinate=1000, max_segment_length=5, seed=0)
+    for problem in [generator.generate_any_segments_intersect_problem()] + batch_to_problems(generator.generate_batch(Algorithm.SEGMENT_INTERSECTIONS, 5)):
+        xs, ys = problem["xs"], problem["ys"]
+        assert len(xs) == len(ys) and len(xs) % 2 == 0 and 100 <= len(xs) // 2 <= 200
+        assert all(0 <= c <= 1000 for c in xs + ys)
+        segments = list(zip(xs[0::2], ys[0::2], xs[1::2], ys[1::2], strict=True))
+        assert all((x1, y1) != (x2, y2) and abs(x1 - x2) <= 5 and abs(y1 - y2) <= 5 for x1, y1, x2, y2 in segments)
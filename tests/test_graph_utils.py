@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from synthetic_clrs.utils import DisjointSet, Rng, connected_component_labels
+
+
+def reference_labels(us, vs, num_vertices):
+    components = DisjointSet(num_vertices)
+    for u, v in zip(us.tolist(), vs.tolist(), strict=True):
+        components.union(u, v)
+    smallest = {}
+    for v in range(num_vertices):
+        smallest.setdefault(components.find(v), v)
+    return [smallest[components.find(v)] for v in range(num_vertices)]
+
+@pytest.mark.parametrize("num_vertices, num_edges", [
+    (1, 0), (5, 0), (10, 3), (100, 50), (100, 100), (1000, 2000),
+])
+def test_connected_component_labels(num_vertices, num_edges):
+    rng = Rng(seed=0)
+    for _ in range(5):
+        us = rng.gen_int_ndarray((num_edges,), 0, num_vertices - 1)
+        vs = rng.gen_int_ndarray((num_edges,), 0, num_vertices - 1)
+        labels = connected_component_labels(us, vs, num_vertices)
+        assert labels.tolist() == reference_labels(us, vs, num_vertices)
+
+def test_connected_component_labels_on_long_path():
+    # a path visiting the vertices in decreasing order
+    num_vertices = 1000
+    order = np.arange(num_vertices)[::-1]
+    labels = connected_component_labels(order[:-1], order[1:], num_vertices)
+    assert (labels == 0).all()
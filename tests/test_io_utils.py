@@ -0,0 +1,88 @@
+import pyarrow as pa
+
+from synthetic_clrs.utils import (
+    JsonlWriter,
+    ParquetShardWriter,
+    iter_jsonl,
+    iter_parquet_batches,
+    read_jsonl,
+    read_parquet,
+    read_parquet_shard,
+)
+
+
+def _segment_records(answers):
+    return [
+        {
+            "algo_name": "segment_intersections",
+            "question": {"xs": [i, i + 1], "ys": [0, 1]},
+            "answer": answer,
+        }
+        for i, answer in enumerate(answers)
+    ]
+
+
+#####################
+### Parquet Tests ###
+#####################
+
+def test_parquet_round_trip_with_empty_first_row_groups(tmp_path):
+    # the first row groups only have empty answers, so their answer
+    # type is list<null> until a later row group settles it
+    records = _segment_records([[], [], [[0, 1]], [], [[0, 1], [2, 3]]])
+    with ParquetShardWriter(tmp_path, row_group_size=2) as writer:
+        for record in records:
+            writer.write(record)
+
+    assert read_parquet(tmp_path) == records
+    table = read_parquet_shard(tmp_path, "segment_intersections")
+    assert table.schema.field("answer").type == pa.list_(pa.list_(pa.int64()))
+    assert table.num_rows == len(records)
+
+def test_parquet_round_trip_with_only_empty_answers(tmp_path):
+    records = _segment_records([[], [], []])
+    with ParquetShardWriter(tmp_path, row_group_size=1) as writer:
+        for record in records:
+            writer.write(record)
+    assert read_parquet(tmp_path, "segment_intersections") == records
+
+def test_read_parquet_shard_columns(tmp_path):
+    records = _segment_records([[[0, 1]], [], [[1, 2]]])
+    with ParquetShardWriter(tmp_path, row_group_size=2) as writer:
+        for record in records:
+            writer.write(record)
+
+    table = read_parquet_shard(tmp_path, "segment_intersections", columns=["xs"])
+    assert table.column_names == ["xs"]
+    assert table.column("xs").to_pylist() == [r["question"]["xs"] for r in records]
+
+def test_iter_parquet_batches(tmp_path):
+    records = _segment_records([[[0, 1]]] * 7)
+    with ParquetShardWriter(tmp_path, row_group_size=3) as writer:
+        for record in records:
+            writer.write(record)
+
+    batches = list(
+        iter_parquet_batches(tmp_path, "segment_intersections", batch_size=2)
+    )
+    assert all(batch.num_rows <= 2 for batch in batches)
+    rows = [row for batch in batches for row in batch.to_pylist()]
+    assert [row.pop("answer") for row in rows] == [r["answer"] for r in records]
+    assert rows == [r["question"] for r in records]
+
+
+
+###################
+### JSONL Tests ###
+###################
+
+def test_jsonl_writer_flushes_every_flush_every_records(tmp_path):
+    records = _segment_records([[], [[0, 1]], [], [[1, 2]], [[0, 2]]])
+    path = tmp_path / "dataset.jsonl"
+    with JsonlWriter(path, flush_every=2) as writer:
+        for i, record in enumerate(records, start=1):
+            writer.write(record)
+            # flushed records are on disk before the writer is closed
+            assert read_jsonl(path) == records[:i - i % 2]
+    assert writer.num_records == len(records)
+    assert list(iter_jsonl(path)) == records
@@ -0,0 +1,79 @@
+import pytest
+
+from synthetic_clrs.utils import Rng
+
+
+@pytest.mark.parametrize("method, args", [
+    ("gen_int", (3, 2)),
+    ("gen_int_array", (4, 3, 2)),
+    ("gen_int_array", (100, 3, 2)),
+    ("gen_int_grid", (2, 2, 3, 2)),
+])
+def test_empty_range_raises(method, args):
+    with pytest.raises(ValueError):
+        getattr(Rng(seed=0), method)(*args)
+
+def test_exclude_never_returns_excluded_values():
+    rng = Rng(seed=0)
+    exclude = [0, 1, 3, 4, 7, 9, 10, 42]
+    values = rng.gen_int_array(1000, 0, 10, exclude=exclude)
+    assert set(values) == {2, 5, 6, 8}
+    for _ in range(100):
+        assert rng.gen_int(-5, 5, exclude=[-5, -4, 0, 5]) not in (-5, -4, 0, 5)
+    with pytest.raises(ValueError):
+        rng.gen_int(0, 2, exclude=[0, 1, 2])
+
+@pytest.mark.parametrize("pop_size, sample_size", [
+    # partial shuffle
+    (10, 10), (100, 50),
+    # Floyd's algorithm
+    (10_000, 20), (1 << 40, 100),
+])
+def test_distinct_samples_are_distinct_and_in_range(pop_size, sample_size):
+    rng = Rng(seed=0)
+    for min_int, exclude in [(0, ()), (-7, (-7, -5, 0, 3))]:
+        max_int = min_int + pop_size - 1
+        if sample_size > pop_size - len(exclude):
+            continue
+        values = rng.gen_int_array(
+            sample_size, min_int, max_int, exclude=exclude, distinct=True
+        )
+        assert len(set(values)) == sample_size
+        assert all(min_int <= v <= max_int and v not in exclude for v in values)
+
+    with pytest.raises(ValueError):
+        rng.gen_int_array(pop_size + 1, 0, pop_size - 1, distinct=True)
+
+@pytest.mark.parametrize("block_size", [1, 7, 1024])
+def test_block_draws_are_reproducible(block_size):
+    def draws(seed):
+        rng = Rng(seed=seed, block_size=block_size)
+        # mix scalar and array requests so that blocks are refilled
+        # part of the way through
+        return [
+            (rng.gen_int(0, 9), rng.gen_int_array(5, -3, 3), rng.gen_bool())
+            for _ in range(200)
+        ]
+
+    assert draws(0) == draws(0)
+    assert draws(0) != draws(1)
+
+def test_block_draws_are_in_range():
+    rng = Rng(seed=0, block_size=16)
+    values = [rng.gen_int(-2, 2) for _ in range(1000)]
+    values += [v for _ in range(100) for v in rng.gen_int_array(10, -2, 2)]
+    assert set(values) == {-2, -1, 0, 1, 2}
+
+def test_seek_matches_from_counter():
+    def draws(rng):
+        return (
+            rng.gen_int_array(40, 0, 99),
+            rng.gen_int(0, 1 << 40),
+            rng.gen_uniform_ndarray((3,)).tolist(),
+        )
+
+    rng = Rng.from_counter(7, "stream", 0)
+    for index in [3, 0, 12, 3]:
+        draws(rng)
+        rng.seek(index)
+        assert draws(rng) == draws(Rng.from_counter(7, "stream", index))
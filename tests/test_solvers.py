@@ -4,8 +4,13 @@ from synthetic_clrs import (
     Algorithm,
     ALGORITHMS_BY_CATEGORY,
     Category,
+    ProblemGenerator,
     ProblemSolver,
 )
+from synthetic_clrs.generators.geometry_generator import GeometryGenerator
+from synthetic_clrs.solvers.geometry_solver import GeometrySolver
+from synthetic_clrs.solvers.graphs_solver import GraphsSolver
+from synthetic_clrs.utils import CSRGraph, SweepLineStatus, batch_from_problems
 
 
 EPSILON = 1e-6
@@ -146,7 +151,34 @@ TEST_CONVEX_HULL_INPUTS = [
         ),
         [1, 1, 1, 1, 0, 0, 0, 0, 0, 1]
     ),
-
+    # point on a hull edge
+    (
+        (
+            [0, 2, 4, 4, 0],
+            [0, 0, 0, 4, 4],
+        ),
+        [1, 0, 1, 1, 1]
+    ),
+    # copies of hull vertices, only the first is selected
+    (
+        (
+            [0, 4, 0, 4, 4, 0],
+            [0, 0, 4, 4, 0, 0],
+        ),
+        [1, 1, 1, 1, 0, 0]
+    ),
+    # vertical line
+    (
+        (
+            [0, 0, 0],
+            [2, 0, 1],
+        ),
+        [1, 1, 0]
+    ),
+    # single point repeated
+    (([1, 1], [2, 2]), [1, 0]),
+    # no points
+    (([], []), []),
 ]
 @pytest.mark.parametrize("test_input, expected_output", TEST_CONVEX_HULL_INPUTS)
 def test_graham_scan(test_input, expected_output):
@@ -166,6 +198,48 @@ def test_jarvis_march(test_input, expected_output):
     print("expected:", expected_output)
     assert selected == expected_output
 
+def test_convex_hull_on_many_points():
+    # points on a parabola are all hull vertices, the ones above it are not
+    xs = list(range(-500, 500)) + list(range(-250, 250))
+    ys = [x * x for x in range(-500, 500)] + [x * x + 1 for x in range(-250, 250)]
+    expected = [1] * 1000 + [0] * 500
+    assert ProblemSolver.solve(Algorithm.GRAHAM_SCAN, xs=xs, ys=ys) == expected
+    assert ProblemSolver.solve(Algorithm.JARVIS_MARCH, xs=xs, ys=ys) == expected
+
+def test_convex_hull_solvers_agree():
+    generator = GeometryGenerator(min_num_points=1, max_num_points=30, min_coordinate=-3, max_coordinate=3, seed=0)
+    for _ in range(200):
+        problem = generator.generate_graham_scan_problem()
+        assert ProblemSolver.solve(Algorithm.GRAHAM_SCAN, **problem) == ProblemSolver.solve(Algorithm.JARVIS_MARCH, **problem)
+
+TEST_CLOSEST_PAIR_INPUTS = [
+    # fewer than two points
+    (([1], [1]), -1),
+    # two points
+    (([0, 3], [0, 4]), 25),
+    # repeated point
+    (([0, 5, 2, 5], [0, 5, 9, 5]), 0),
+    # closest pair straddles the middle of the x order
+    (([0, 10, 4, 6, 20, -5], [0, 0, 3, 4, 1, 7]), 5),
+    # points on a vertical line
+    (([7, 7, 7, 7], [0, 10, 4, 13]), 9),
+]
+@pytest.mark.parametrize("test_input, expected_output", TEST_CLOSEST_PAIR_INPUTS)
+def test_closest_pair(test_input, expected_output):
+    xs, ys = test_input
+    assert ProblemSolver.solve(Algorithm.CLOSEST_PAIR, xs=xs, ys=ys) == expected_output
+
+def test_closest_pair_matches_all_pairs():
+    generator = GeometryGenerator(min_num_points=2, max_num_points=200, min_coordinate=-1000, max_coordinate=1000, seed=0)
+    for _ in range(50):
+        problem = generator.generate_closest_pair_problem()
+        points = list(zip(problem["xs"], problem["ys"]))
+        expected = min(
+            (x1 - x2) ** 2 + (y1 - y2) ** 2
+            for i, (x1, y1) in enumerate(points) for x2, y2 in points[i + 1:]
+        )
+        assert ProblemSolver.solve(Algorithm.CLOSEST_PAIR, **problem) == expected
+
 TEST_SEGMENT_INTERSECT_INPUTS = [
     # diagonal intersection
     (([0, 2, 0, 2], [0, 2, 2, 0]), 1),
@@ -187,12 +261,79 @@ TEST_SEGMENT_INTERSECT_INPUTS = [
     (([0, 3, 1, 2], [0, 3, 1, 2]), 1),
     # duplicate segment
     (([0, 1, 0, 1], [0, 1, 0, 1]), 1),
+    # vertical segment, other segment starts above it
+    (([0, 0, 0, 1], [0, 2, 3, 5]), 0),
 ]
 @pytest.mark.parametrize("test_input, expected_output", TEST_SEGMENT_INTERSECT_INPUTS)
 def test_segment_intersect(test_input, expected_output):
     xs, ys = test_input
     assert ProblemSolver.solve(Algorithm.SEGMENT_INTERSECT, xs=xs, ys=ys) == expected_output
 
+TEST_SEGMENT_INTERSECTIONS_INPUTS = [
+    # no segments
+    (([], []), []),
+    # crossing diagonals and a segment away from them
+    (([0, 2, 0, 2, 5, 6], [0, 2, 2, 0, 5, 5]), [[0, 1]]),
+    # parallel segments
+    (([0, 4, 0, 4, 0, 4], [0, 0, 1, 1, 2, 2]), []),
+    # segments meeting at endpoints, in a vertical and collinear chain
+    (([0, 0, 0, 0, 0, 0], [0, 1, 1, 2, 3, 2]), [[0, 1], [1, 2]]),
+    # star of segments through a common point
+    (([-1, 1, 0, 0, -1, 1, 1, -1], [0, 0, -1, 1, -1, 1, -1, 1]), [[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]]),
+]
+@pytest.mark.parametrize("test_input, expected_output", TEST_SEGMENT_INTERSECTIONS_INPUTS)
+def test_segment_intersections(test_input, expected_output):
+    xs, ys = test_input
+    assert ProblemSolver.solve(Algorithm.SEGMENT_INTERSECTIONS, xs=xs, ys=ys) == expected_output
+    assert ProblemSolver.solve(Algorithm.ANY_SEGMENTS_INTERSECT, xs=xs, ys=ys) == int(bool(expected_output))
+
+@pytest.mark.parametrize("max_segment_length", [None, 1, 3])
+def test_segment_sweeps_match_pairwise_tests(max_segment_length):
+    generator = GeometryGenerator(min_num_segments=1, max_num_segments=30, min_coordinate=-5, max_coordinate=5, max_segment_length=max_segment_length, seed=0)
+    answers = []
+    for _ in range(100):
+        problem = generator.generate_segment_intersections_problem()
+        xs, ys = problem["xs"], problem["ys"]
+        num_segments = len(xs) // 2
+        expected = [
+            [i, j]
+            for i in range(num_segments) for j in range(i + 1, num_segments)
+            if ProblemSolver.solve(
+                Algorithm.SEGMENT_INTERSECT,
+                xs=xs[2*i:2*i+2] + xs[2*j:2*j+2],
+                ys=ys[2*i:2*i+2] + ys[2*j:2*j+2],
+            )
+        ]
+        assert ProblemSolver.solve(Algorithm.SEGMENT_INTERSECTIONS, **problem) == expected
+        assert GeometrySolver.segment_intersections(xs, ys, chunk_size=1) == expected
+        answers.append(ProblemSolver.solve(Algorithm.ANY_SEGMENTS_INTERSECT, **problem))
+        assert answers[-1] == int(bool(expected))
+    # both answers occur
+    assert 0 < sum(answers) < len(answers)
+
+def test_sweep_line_status_neighbors():
+    # segments at equal heights are ordered by index
+    heights = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9, 3, 2, 3, 8, 4]
+    def below(a, b):
+        return (heights[a], a) < (heights[b], b)
+
+    status = SweepLineStatus(below, block_size=2)
+    present = []
+    for s in range(len(heights)):
+        prev, next_ = status.insert(s)
+        present = sorted(present + [s], key=lambda t: (heights[t], t))
+        i = present.index(s)
+        assert prev == (present[i - 1] if i > 0 else None)
+        assert next_ == (present[i + 1] if i + 1 < len(present) else None)
+    for s in [7, 0, 19, 3, 1, 12, 5, 8, 2, 4, 6, 9, 10, 11, 13, 14, 15, 16, 17, 18]:
+        i = present.index(s)
+        assert status.remove(s) == (
+            present[i - 1] if i > 0 else None,
+            present[i + 1] if i + 1 < len(present) else None,
+        )
+        present.remove(s)
+    assert status.blocks == []
+
 
 ####################
 ### Graphs Tests ###
@@ -254,6 +395,15 @@ def test_dfs(test_input, expected_output):
     parents = ProblemSolver.solve(Algorithm.DFS, edge_list=edges, num_vertices=num_vertices, src=src)
     assert parents == expected_output
 
+def test_traversals_on_long_path():
+    # deep enough to overflow a recursive traversal
+    num_vertices = 100_000
+    edges = [(u, u + 1, 1) for u in range(num_vertices - 1)]
+    expected_parents = [0] + list(range(num_vertices - 1))
+    assert ProblemSolver.solve(Algorithm.BFS, edge_list=edges, num_vertices=num_vertices, src=0) == expected_parents
+    assert ProblemSolver.solve(Algorithm.DFS, edge_list=edges, num_vertices=num_vertices, src=0) == expected_parents
+    assert ProblemSolver.solve(Algorithm.TOPOLOGICAL_SORT, edge_list=edges, num_vertices=num_vertices) == list(range(num_vertices))
+
 TEST_DAGS = [
     # single vertex
     ((), 1, 0),
@@ -346,6 +496,35 @@ def test_dag_shortest_path_regression():
     distances = ProblemSolver.solve(Algorithm.DAG_SHORTEST_PATH, edge_list=edges, num_vertices=num_vertices, src=src)
     assert distances == expected_distances
 
+def test_dag_shortest_paths_rejects_cycles():
+    edges = [(0, 1, 1), (1, 2, 1), (2, 1, 1)]
+    with pytest.raises(ValueError):
+        ProblemSolver.solve(Algorithm.DAG_SHORTEST_PATH, edge_list=edges, num_vertices=3, src=0)
+
+def largest_first_topological_order(edges, num_vertices):
+    # a valid order that differs from the one Kahn's algorithm finds
+    indegrees = [sum(v == b for _, b, _ in edges) for v in range(num_vertices)]
+    available = [v for v in range(num_vertices) if indegrees[v] == 0]
+    order = []
+    while available:
+        u = max(available)
+        available.remove(u)
+        order.append(u)
+        for a, v, _ in edges:
+            if a == u:
+                indegrees[v] -= 1
+                if indegrees[v] == 0:
+                    available.append(v)
+    return order
+
+@pytest.mark.parametrize("test_input, expected_output", zip(TEST_DAGS, DAG_SHORTEST_PATH_DISTANCES))
+def test_dag_shortest_paths_with_known_topological_order(test_input, expected_output):
+    edges, num_vertices, src = test_input
+    graph = CSRGraph.from_edge_list(edges, num_vertices)
+    graph.topo_order = largest_first_topological_order(edges, num_vertices)
+    distances = ProblemSolver.solve(Algorithm.DAG_SHORTEST_PATH, edge_list=graph, num_vertices=num_vertices, src=src)
+    assert distances == expected_output
+
 TEST_GRAPH_INPUTS_ONLY_POSITIVE_WEIGHTS = [
     # single vertex
     ((), 1, 0),
@@ -401,6 +580,32 @@ def test_dijkstra(test_input, expected_output):
     distances = ProblemSolver.solve(Algorithm.DIJKSTRA, edge_list=edges, num_vertices=num_vertices, src=src)
     assert distances == expected_output
 
+@pytest.mark.parametrize("test_input, expected_output", zip(TEST_GRAPH_INPUTS_ONLY_POSITIVE_WEIGHTS, POSITIVE_WEIGHT_GRAPH_SHORTEST_PATH_DISTANCES))
+def test_dijkstra_bucket_queue(test_input, expected_output):
+    edges, num_vertices, src = test_input
+    distances = ProblemSolver.solve(Algorithm.DIJKSTRA, edge_list=edges, num_vertices=num_vertices, src=src, bucket_queue=True)
+    assert distances == expected_output
+
+@pytest.mark.parametrize("bucket_queue", [False, True])
+def test_dijkstra_settles_by_distance(bucket_queue):
+    # keying the heap on edge weights instead of tentative
+    # distances relaxes 1 -> 3 through the longer path 0 -> 2 -> 1
+    edges = [(0, 1, 5), (0, 2, 3), (1, 3, 1), (2, 1, 3), (3, 0, 3)]
+    distances = ProblemSolver.solve(Algorithm.DIJKSTRA, edge_list=edges, num_vertices=4, src=0, bucket_queue=bucket_queue)
+    assert distances == [0, 5, 3, 6]
+
+def test_dijkstra_matches_bellman_ford():
+    generator = ProblemGenerator(seed=0)
+    for _ in range(100):
+        problem = generator.generate_problem(Algorithm.DIJKSTRA)
+        expected_distances = ProblemSolver.solve(Algorithm.BELLMAN_FORD, **problem)
+        assert ProblemSolver.solve(Algorithm.DIJKSTRA, **problem) == expected_distances
+        assert ProblemSolver.solve(Algorithm.DIJKSTRA, **problem, bucket_queue=True) == expected_distances
+
+def test_dijkstra_bucket_queue_rejects_negative_weights():
+    with pytest.raises(ValueError):
+        ProblemSolver.solve(Algorithm.DIJKSTRA, edge_list=[(0, 1, -1)], num_vertices=2, src=0, bucket_queue=True)
+
 @pytest.mark.parametrize("test_input, expected_output", zip(TEST_GRAPH_INPUTS_ONLY_POSITIVE_WEIGHTS, POSITIVE_WEIGHT_GRAPH_SHORTEST_PATH_DISTANCES))
 def test_bellman_ford_positive_weights(test_input, expected_output):
     edges, num_vertices, src = test_input
@@ -444,6 +649,221 @@ def test_bellman_ford_negative_weights(test_input, expected_output):
     distances = ProblemSolver.solve(Algorithm.BELLMAN_FORD, edge_list=edges, num_vertices=num_vertices, src=src)
     assert distances == expected_output
 
+TEST_GRAPH_INPUTS_WITH_NEGATIVE_CYCLES = [
+    # negative cycle 1 -> 2 -> 1 reachable from src
+    (
+        (
+            (0, 1, 1),
+            (1, 2, -2),
+            (2, 1, 1),
+            (2, 3, 4),
+        ),
+        4,
+        0
+    ),
+    # negative cycle 2 -> 3 -> 2 not reachable from src
+    (
+        (
+            (0, 1, 1),
+            (2, 3, -2),
+            (3, 2, 1),
+        ),
+        4,
+        0
+    ),
+]
+
+NEGATIVE_CYCLE_SHORTEST_PATH_DISTANCES = [
+    -1,
+    [0, 1, float('inf'), float('inf')],
+]
+@pytest.mark.parametrize("test_input, expected_output", zip(TEST_GRAPH_INPUTS_WITH_NEGATIVE_CYCLES, NEGATIVE_CYCLE_SHORTEST_PATH_DISTANCES))
+def test_bellman_ford_negative_cycles(test_input, expected_output):
+    edges, num_vertices, src = test_input
+    distances = ProblemSolver.solve(Algorithm.BELLMAN_FORD, edge_list=edges, num_vertices=num_vertices, src=src)
+    assert distances == expected_output
+
+@pytest.mark.parametrize("test_input", [
+    *TEST_GRAPH_INPUTS_WITH_NEGATIVE_WEIGHTS,
+    *TEST_GRAPH_INPUTS_WITH_NEGATIVE_CYCLES,
+])
+def test_bellman_ford_prepared_graph_queries(test_input):
+    edges, num_vertices, _ = test_input
+    graph = GraphsSolver.prepare(edges, num_vertices)
+    answers = GraphsSolver.solve_queries(
+        GraphsSolver.bellman_ford, graph, num_vertices, range(num_vertices)
+    )
+    assert answers == [
+        GraphsSolver.bellman_ford(edges, num_vertices, src)
+        for src in range(num_vertices)
+    ]
+    # the edges are grouped by target once for all queries
+    assert graph.edges_by_target() is graph.edges_by_target()
+
+
+INF = float('inf')
+TEST_FLOYD_WARSHALL_INPUTS = [
+    # single vertex
+    (([], 1), [[0]]),
+    # negative weight and unreachable vertex
+    # 0 -> 1 -> 2, 0 -> 2, 3 isolated
+    (
+        (
+            [
+                (0, 1, 4),
+                (1, 2, -2),
+                (0, 2, 3),
+                (2, 0, 1),
+            ],
+            4
+        ),
+        [
+            [0, 4, 2, INF],
+            [-1, 0, -2, INF],
+            [1, 5, 0, INF],
+            [INF, INF, INF, 0],
+        ]
+    ),
+    # parallel edges keep the lightest one
+    (([(0, 1, 5), (0, 1, 2), (1, 0, 1)], 2), [[0, 2], [1, 0]]),
+    # negative cycle 0 -> 1 -> 0
+    (([(0, 1, 1), (1, 0, -2), (1, 2, 1)], 3), -1),
+]
+@pytest.mark.parametrize("test_input, expected_output", TEST_FLOYD_WARSHALL_INPUTS)
+def test_floyd_warshall(test_input, expected_output):
+    edges, num_vertices = test_input
+    distances = ProblemSolver.solve(Algorithm.FLOYD_WARSHALL, edge_list=edges, num_vertices=num_vertices)
+    assert distances == expected_output
+
+def test_floyd_warshall_matches_bellman_ford():
+    generator = ProblemGenerator(seed=0)
+    for _ in range(50):
+        problem = generator.generate_problem(Algorithm.FLOYD_WARSHALL)
+        distances = ProblemSolver.solve(Algorithm.FLOYD_WARSHALL, **problem)
+        for src in range(problem["num_vertices"]):
+            assert distances[src] == ProblemSolver.solve(Algorithm.BELLMAN_FORD, **problem, src=src)
+            # generated graphs are strongly connected
+            assert INF not in distances[src]
+
+
+def undirected(edges):
+    return [e for u, v, w in edges for e in ((u, v, w), (v, u, w))]
+
+TEST_MST_INPUTS = [
+    # single vertex
+    (([], 1), 0),
+    # graph from CLRS figure 23.1 with vertices a..i as 0..8
+    (
+        (
+            undirected([
+                (0, 1, 4), (0, 7, 8), (1, 2, 8), (1, 7, 11),
+                (2, 3, 7), (2, 5, 4), (2, 8, 2), (3, 4, 9),
+                (3, 5, 14), (4, 5, 10), (5, 6, 2), (6, 7, 1),
+                (6, 8, 6), (7, 8, 7),
+            ]),
+            9
+        ),
+        37
+    ),
+    # disconnected graph gives a minimum spanning forest
+    # 0 - 1 - 2   3 - 4
+    # \______/
+    (
+        (
+            undirected([(0, 1, 3), (1, 2, 1), (0, 2, 2), (3, 4, 5)]),
+            5
+        ),
+        8
+    ),
+]
+@pytest.mark.parametrize("mst_algorithm", [Algorithm.MST_KRUSKAL, Algorithm.MST_PRIM])
+@pytest.mark.parametrize("test_input, expected_output", TEST_MST_INPUTS)
+def test_mst(mst_algorithm, test_input, expected_output):
+    edges, num_vertices = test_input
+    assert ProblemSolver.solve(mst_algorithm, edge_list=edges, num_vertices=num_vertices) == expected_output
+
+def test_mst_kruskal_matches_prim():
+    generator = ProblemGenerator(seed=0)
+    for _ in range(100):
+        problem = generator.generate_problem(Algorithm.MST_KRUSKAL)
+        expected = ProblemSolver.solve(Algorithm.MST_KRUSKAL, **problem)
+        assert ProblemSolver.solve(Algorithm.MST_PRIM, **problem) == expected
+
+        edges, num_vertices = problem["edge_list"], problem["num_vertices"]
+        for graph in (
+            CSRGraph.from_edge_list(edges, num_vertices),
+            GraphsSolver.prepare(edges, num_vertices),
+        ):
+            assert GraphsSolver.mst_prim(graph, num_vertices) == expected
+
+
+def reachable(edges, num_vertices, src, removed_vertex=None, removed_edge=None):
+    # reference reachability without the removed vertex or
+    # (both directions of the) removed edge
+    visited = {src}
+    stack = [src]
+    while stack:
+        u = stack.pop()
+        for a, b, _ in edges:
+            if a != u or b in visited or b == removed_vertex or {a, b} == removed_edge:
+                continue
+            visited.add(b)
+            stack.append(b)
+    return visited
+
+TEST_LOW_LINK_GRAPHS = [
+    # two triangles joined by the bridge 2 - 3
+    (undirected([(0, 1, 1), (1, 2, 1), (2, 0, 1), (2, 3, 1), (3, 4, 1), (4, 5, 1), (5, 3, 1)]), 6),
+    # path with a parallel edge 1 = 2, which is not a bridge
+    (undirected([(0, 1, 1), (1, 2, 1), (1, 2, 1), (2, 3, 1)]), 4),
+    # star and an isolated vertex
+    (undirected([(0, 1, 1), (0, 2, 1), (0, 3, 1)]), 5),
+]
+def check_bridges_and_articulation_points(edges, num_vertices):
+    is_bridge = ProblemSolver.solve(Algorithm.BRIDGES, edge_list=edges, num_vertices=num_vertices)
+    for (u, v, _), bridge in zip(edges, is_bridge):
+        parallel_edges = sum({a, b} == {u, v} for a, b, _ in edges)
+        assert bridge == (parallel_edges == 2 and v not in reachable(edges, num_vertices, u, removed_edge={u, v}))
+
+    is_cut = ProblemSolver.solve(Algorithm.ARTICULATION_POINTS, edge_list=edges, num_vertices=num_vertices)
+    for v in range(num_vertices):
+        neighbors = {b for a, b, _ in edges if a == v}
+        assert is_cut[v] == any(
+            b not in reachable(edges, num_vertices, a, removed_vertex=v)
+            for a in neighbors for b in neighbors
+        )
+
+@pytest.mark.parametrize("edges, num_vertices", TEST_LOW_LINK_GRAPHS)
+def test_bridges_and_articulation_points(edges, num_vertices):
+    check_bridges_and_articulation_points(edges, num_vertices)
+
+def test_scc():
+    # 0 <-> 1 -> 2 -> 3 -> 4 -> 2, 5
+    edges = [(0, 1, 1), (1, 0, 1), (1, 2, 1), (2, 3, 1), (3, 4, 1), (4, 2, 1)]
+    assert ProblemSolver.solve(Algorithm.SCC, edge_list=edges, num_vertices=6) == [0, 0, 2, 2, 2, 5]
+
+def test_low_link_problems_match_reference():
+    generator = ProblemGenerator(seed=0)
+    for _ in range(30):
+        problem = generator.generate_problem(Algorithm.SCC)
+        edges, num_vertices = problem["edge_list"], problem["num_vertices"]
+        reach = [reachable(edges, num_vertices, v) for v in range(num_vertices)]
+        expected_labels = [min(u for u in reach[v] if v in reach[u]) for v in range(num_vertices)]
+        assert ProblemSolver.solve(Algorithm.SCC, **problem) == expected_labels
+
+        for algorithm in (Algorithm.BRIDGES, Algorithm.ARTICULATION_POINTS):
+            problem = generator.generate_problem(algorithm)
+            check_bridges_and_articulation_points(problem["edge_list"], problem["num_vertices"])
+
+def test_low_link_on_long_path():
+    # deep enough to overflow a recursive traversal
+    num_vertices = 100_000
+    edges = undirected([(u, u + 1, 1) for u in range(num_vertices - 1)])
+    assert ProblemSolver.solve(Algorithm.BRIDGES, edge_list=edges, num_vertices=num_vertices) == [1] * len(edges)
+    assert ProblemSolver.solve(Algorithm.ARTICULATION_POINTS, edge_list=edges, num_vertices=num_vertices) == [0] + [1] * (num_vertices - 2) + [0]
+    cycle = [(u, (u + 1) % num_vertices, 1) for u in range(num_vertices)]
+    assert ProblemSolver.solve(Algorithm.SCC, edge_list=cycle, num_vertices=num_vertices) == [0] * num_vertices
+
 
 ####################
 ### Greedy Tests ###
@@ -545,3 +965,61 @@ SORTING_TEST_IDS = [f"{algo}_{i}" for i, (algo, *_) in enumerate(TEST_INPUTS_BY_
 def test_sort(sorting_algorithm, test_input, expected_output):
     array = test_input
     assert ProblemSolver.solve(sorting_algorithm, array=array) == expected_output
+
+
+###################
+### Batch Tests ###
+###################
+
+TEST_BATCH_INPUTS = [
+    (Algorithm.KADANE, [{"array": array} for array, _ in TEST_KADANE_INPUTS]),
+    (Algorithm.LCS_LENGTH, [
+        {"sequence_a": list(map(ord, a)), "sequence_b": list(map(ord, b))}
+        for (a, b), _ in TEST_LCS_LENGTH_INPUTS
+    ]),
+    (Algorithm.BINARY_SEARCH, [
+        {"array": array, "target": target} for (array, target), _ in TEST_BINARY_SEARCH_INPUTS
+    ] + [
+        # duplicates must return the same index as the scalar bisection
+        {"array": [1, 1, 1, 1, 2, 2, 2, 3], "target": target} for target in (1, 2, 3)
+    ]),
+    (Algorithm.MINIMUM, [{"array": array} for array, _ in TEST_MINIMUM_INPUTS]),
+    *[
+        (algorithm, [{"array": array} for array, _ in TEST_SORT_ARRAY_INPUTS])
+        for algorithm in SORTING_ALGORITHMS
+    ],
+    # no vectorized solver
+    (Algorithm.TASK_SCHEDULING, [
+        {"deadlines": deadlines, "weights": weights}
+        for (deadlines, weights), _ in TEST_TASK_SCHEDULING_INPUTS
+    ]),
+]
+@pytest.mark.parametrize("algorithm, problems", TEST_BATCH_INPUTS)
+def test_solve_batch(algorithm, problems):
+    expected_answers = [ProblemSolver.solve(algorithm, **problem) for problem in problems]
+    assert ProblemSolver.solve_batch(algorithm, batch_from_problems(problems)) == expected_answers
+
+
+#######################
+### CSR Graph Tests ###
+#######################
+
+TEST_CSR_INPUTS = [
+    *[(Algorithm.BFS, test_input) for test_input, _ in TEST_TREE_INPUTS],
+    *[(Algorithm.DFS, test_input) for test_input, _ in TEST_TREE_INPUTS],
+    *[(Algorithm.TOPOLOGICAL_SORT, test_input) for test_input in TEST_DAGS],
+    *[(Algorithm.DAG_SHORTEST_PATH, test_input) for test_input in TEST_DAGS],
+    *[(Algorithm.DIJKSTRA, test_input) for test_input in TEST_GRAPH_INPUTS_ONLY_POSITIVE_WEIGHTS],
+    *[(Algorithm.BELLMAN_FORD, test_input) for test_input in TEST_GRAPH_INPUTS_WITH_NEGATIVE_WEIGHTS],
+]
+@pytest.mark.parametrize("algorithm, test_input", TEST_CSR_INPUTS)
+def test_csr_graph_input(algorithm, test_input):
+    edges, num_vertices, src = test_input
+    graph = CSRGraph.from_edge_list(edges, num_vertices)
+
+    # out-edges keep their edge list order
+    assert sorted(graph.to_edge_list(), key=lambda e: e[0]) == \
+        sorted(edges, key=lambda e: e[0])
+    kwargs = {"num_vertices": num_vertices, "src": src}
+    assert ProblemSolver.solve(algorithm, edge_list=graph, **kwargs) == \
+        ProblemSolver.solve(algorithm, edge_list=edges, **kwargs)